@@ -5,6 +5,7 @@
 
 import axios, { AxiosInstance, AxiosError } from 'axios';
 import Constants from 'expo-constants';
+import AsyncStorage from '@react-native-async-storage/async-storage';
 import {
   Product,
   Article,
@@ -12,6 +13,8 @@ import {
   Category,
   Brand,
   ApiResponse,
+  CatalogEntity,
+  CatalogSyncResponse,
 } from '../types';
 
 // Get API URL from app.json extra config
@@ -74,12 +77,180 @@ function handleApiError(error: any): never {
   throw new ApiError(error.message || 'Unknown error occurred');
 }
 
+// ============================================================================
+// CATALOG SYNC
+// ============================================================================
+
+// Catalog kept on the device; one AsyncStorage key per entity keeps each
+// value small enough for Android's per-row limit
+const CATALOG_STORAGE_PREFIX = 'catalog:v1:';
+const CATALOG_ENTITIES: CatalogEntity[] = [
+  'brands',
+  'categories',
+  'products',
+  'articles',
+];
+// Screens mounting together share one sync; revisits within this window
+// read the cache without a request
+const MIN_SYNC_INTERVAL_MS = 30 * 1000;
+
+interface CatalogCache {
+  cursor?: string;
+  etag?: string;
+  brands: Record<string, Brand>;
+  categories: Record<string, Category>;
+  products: Record<string, Product>;
+  articles: Record<string, Article>;
+}
+
+let catalog: CatalogCache | null = null;
+let lastSyncAt = 0;
+let syncInFlight: Promise<CatalogCache> | null = null;
+
+function emptyCatalog(): CatalogCache {
+  return { brands: {}, categories: {}, products: {}, articles: {} };
+}
+
+async function loadCatalog(): Promise<CatalogCache> {
+  if (catalog) return catalog;
+
+  const keys = ['meta', ...CATALOG_ENTITIES].map(
+    (key) => CATALOG_STORAGE_PREFIX + key
+  );
+  try {
+    const entries = Object.fromEntries(await AsyncStorage.multiGet(keys));
+    const meta = JSON.parse(entries[CATALOG_STORAGE_PREFIX + 'meta'] || '{}');
+    catalog = { ...emptyCatalog(), cursor: meta.cursor, etag: meta.etag };
+    for (const entity of CATALOG_ENTITIES) {
+      const stored = entries[CATALOG_STORAGE_PREFIX + entity];
+      if (stored) catalog[entity] = JSON.parse(stored);
+    }
+  } catch (error) {
+    console.warn('Catalog cache unreadable, starting over:', error);
+    catalog = emptyCatalog();
+  }
+  return catalog;
+}
+
+async function saveCatalog(cache: CatalogCache): Promise<void> {
+  await AsyncStorage.multiSet([
+    [
+      CATALOG_STORAGE_PREFIX + 'meta',
+      JSON.stringify({ cursor: cache.cursor, etag: cache.etag }),
+    ],
+    ...CATALOG_ENTITIES.map((entity): [string, string] => [
+      CATALOG_STORAGE_PREFIX + entity,
+      JSON.stringify(cache[entity]),
+    ]),
+  ]);
+}
+
+function applyChanges(cache: CatalogCache, page: CatalogSyncResponse): CatalogCache {
+  const next = page.reset ? emptyCatalog() : cache;
+  for (const entity of CATALOG_ENTITIES) {
+    const records = next[entity] as Record<string, { id: string }>;
+    for (const record of page[entity]) records[record.id] = record;
+    for (const id of page.deleted[entity]) delete records[id];
+  }
+  next.cursor = page.cursor;
+  return next;
+}
+
+async function fetchCatalogChanges(): Promise<CatalogCache> {
+  let cache = await loadCatalog();
+  let changed = false;
+  let hasMore = true;
+
+  while (hasMore) {
+    const response = await api.get<CatalogSyncResponse>('/api/sync/catalog', {
+      params: cache.cursor ? { cursor: cache.cursor } : undefined,
+      headers: cache.etag ? { 'If-None-Match': cache.etag } : undefined,
+      validateStatus: (status) => status === 200 || status === 304,
+    });
+
+    // 304: nothing changed since the last sync, so no body was sent
+    if (response.status === 304) break;
+
+    cache = applyChanges(cache, response.data);
+    cache.etag = response.headers['etag'];
+    hasMore = response.data.hasMore;
+    changed = true;
+  }
+
+  catalog = cache;
+  if (changed) await saveCatalog(cache);
+  return cache;
+}
+
+/**
+ * Bring the local catalog up to date with the server, downloading only what
+ * changed. Offline, the cached catalog is returned as long as there is one.
+ */
+export async function syncCatalog(force: boolean = false): Promise<CatalogCache> {
+  if (!force && catalog && Date.now() - lastSyncAt < MIN_SYNC_INTERVAL_MS) {
+    return catalog;
+  }
+
+  syncInFlight ??= fetchCatalogChanges()
+    .then((cache) => {
+      lastSyncAt = Date.now();
+      return cache;
+    })
+    .catch(async (error) => {
+      const cached = await loadCatalog();
+      if (Object.keys(cached.products).length > 0) {
+        console.warn('Catalog sync failed, using cached catalog:', error.message);
+        return cached;
+      }
+      handleApiError(error);
+    })
+    .finally(() => {
+      syncInFlight = null;
+    });
+
+  return syncInFlight;
+}
+
+/**
+ * Drop the local catalog (e.g. when switching API servers)
+ */
+export async function clearCatalogCache(): Promise<void> {
+  catalog = null;
+  lastSyncAt = 0;
+  await AsyncStorage.multiRemove(
+    ['meta', ...CATALOG_ENTITIES].map((key) => CATALOG_STORAGE_PREFIX + key)
+  );
+}
+
+function withRelations(cache: CatalogCache, product: Product): Product {
+  return {
+    ...product,
+    brand: cache.brands[product.brandId],
+    category: cache.categories[product.categoryId],
+  };
+}
+
+function matchesSearch(product: Product, query: string): boolean {
+  const q = query.toLowerCase();
+  return (
+    product.title.toLowerCase().includes(q) ||
+    !!product.brand?.name.toLowerCase().includes(q) ||
+    !!product.shortSummary?.toLowerCase().includes(q)
+  );
+}
+
+function paginate<T>(items: T[], page?: number, limit?: number): T[] {
+  if (!limit) return items;
+  const start = ((page || 1) - 1) * limit;
+  return items.slice(start, start + limit);
+}
+
 // ============================================================================
 // PRODUCTS
 // ============================================================================
 
 /**
- * Get all products
+ * Get all products, newest first
  */
 export async function getProducts(params?: {
   category?: string;
@@ -88,38 +259,35 @@ export async function getProducts(params?: {
   page?: number;
   limit?: number;
 }): Promise<Product[]> {
-  try {
-    const response = await api.get<Product[]>('/api/products', { params });
-    return response.data;
-  } catch (error) {
-    handleApiError(error);
-  }
+  const cache = await syncCatalog();
+  const products = Object.values(cache.products)
+    .map((product) => withRelations(cache, product))
+    .filter(
+      (product) =>
+        (!params?.category || product.category?.slug === params.category) &&
+        (!params?.brand || product.brand?.slug === params.brand) &&
+        (!params?.search || matchesSearch(product, params.search))
+    )
+    .sort((a, b) => b.createdAt.localeCompare(a.createdAt));
+
+  return paginate(products, params?.page, params?.limit);
 }
 
 /**
  * Get a single product by slug
  */
 export async function getProduct(slug: string): Promise<Product> {
-  try {
-    const response = await api.get<Product>(`/api/products/${slug}`);
-    return response.data;
-  } catch (error) {
-    handleApiError(error);
-  }
+  const cache = await syncCatalog();
+  const product = Object.values(cache.products).find((p) => p.slug === slug);
+  if (!product) throw new ApiError('Product not found', 404);
+  return withRelations(cache, product);
 }
 
 /**
  * Search products
  */
 export async function searchProducts(query: string): Promise<Product[]> {
-  try {
-    const response = await api.get<Product[]>('/api/products/search', {
-      params: { q: query },
-    });
-    return response.data;
-  } catch (error) {
-    handleApiError(error);
-  }
+  return getProducts({ search: query });
 }
 
 // ============================================================================
@@ -130,24 +298,18 @@ export async function searchProducts(query: string): Promise<Product[]> {
  * Get all categories
  */
 export async function getCategories(): Promise<Category[]> {
-  try {
-    const response = await api.get<Category[]>('/api/categories');
-    return response.data;
-  } catch (error) {
-    handleApiError(error);
-  }
+  const cache = await syncCatalog();
+  return Object.values(cache.categories).sort((a, b) =>
+    a.name.localeCompare(b.name)
+  );
 }
 
 /**
  * Get all brands
  */
 export async function getBrands(): Promise<Brand[]> {
-  try {
-    const response = await api.get<Brand[]>('/api/brands');
-    return response.data;
-  } catch (error) {
-    handleApiError(error);
-  }
+  const cache = await syncCatalog();
+  return Object.values(cache.brands).sort((a, b) => a.name.localeCompare(b.name));
 }
 
 // ============================================================================
@@ -155,31 +317,31 @@ export async function getBrands(): Promise<Brand[]> {
 // ============================================================================
 
 /**
- * Get all published articles
+ * Get all published articles, newest first
  */
 export async function getArticles(params?: {
   category?: string;
   page?: number;
   limit?: number;
 }): Promise<Article[]> {
-  try {
-    const response = await api.get<Article[]>('/api/articles', { params });
-    return response.data;
-  } catch (error) {
-    handleApiError(error);
-  }
+  const cache = await syncCatalog();
+  const articles = Object.values(cache.articles)
+    .filter((article) => !params?.category || article.category === params.category)
+    .sort((a, b) =>
+      (b.publishedAt || b.createdAt).localeCompare(a.publishedAt || a.createdAt)
+    );
+
+  return paginate(articles, params?.page, params?.limit);
 }
 
 /**
  * Get a single article by slug
  */
 export async function getArticle(slug: string): Promise<Article> {
-  try {
-    const response = await api.get<Article>(`/api/articles/${slug}`);
-    return response.data;
-  } catch (error) {
-    handleApiError(error);
-  }
+  const cache = await syncCatalog();
+  const article = Object.values(cache.articles).find((a) => a.slug === slug);
+  if (!article) throw new ApiError('Article not found', 404);
+  return article;
 }
 
 // ============================================================================
@@ -189,6 +189,23 @@ export interface PaginatedResponse<T> {
   hasMore: boolean;
 }
 
+/**
+ * One page from GET /api/sync/catalog. Null fields are omitted, and product
+ * badges carry only { badge: { id, code, name } }.
+ */
+export interface CatalogSyncResponse {
+  reset: boolean;
+  brands: Brand[];
+  categories: Category[];
+  products: Product[];
+  articles: Article[];
+  deleted: Record<CatalogEntity, string[]>;
+  cursor: string;
+  hasMore: boolean;
+}
+
+export type CatalogEntity = 'brands' | 'categories' | 'products' | 'articles';
+
 // ============================================================================
 // NAVIGATION
 // ============================================================================
@@ -23,7 +23,8 @@ const nextConfig = {
     formats: ['image/avif', 'image/webp'],
     deviceSizes: [640, 750, 828, 1080, 1200, 1920, 2048, 3840],
     imageSizes: [16, 32, 48, 64, 96, 128, 256, 384],
-    minimumCacheTTL: 60,
+    // Remote product images rarely change; re-optimizing them every minute wastes CPU
+    minimumCacheTTL: 60 * 60 * 24,
     remotePatterns: [
       {
         protocol: 'https',
@@ -41,6 +42,14 @@ const nextConfig = {
   },
   experimental: {
     optimizePackageImports: ['lucide-react', '@radix-ui/react-icons'],
+    // Image derivatives are read from public/, which Vercel serves from the
+    // CDN and does not bundle into functions; trace it into the routes that
+    // hash and resize the images (see src/lib/image-derivatives.ts)
+    outputFileTracingIncludes: {
+      '/': ['./public/images/**/*'],
+      '/shop': ['./public/images/**/*'],
+      '/img/[hash]/[variant]': ['./public/images/**/*'],
+    },
   },
   headers: async () => {
     return [
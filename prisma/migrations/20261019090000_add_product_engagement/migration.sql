@@ -0,0 +1,21 @@
+-- CreateTable
+CREATE TABLE "product_engagement" (
+    "id" TEXT NOT NULL,
+    "productId" TEXT NOT NULL,
+    "merchant" TEXT NOT NULL DEFAULT 'NONE',
+    "bucketStart" TIMESTAMP(3) NOT NULL,
+    "views" INTEGER NOT NULL DEFAULT 0,
+    "clicks" INTEGER NOT NULL DEFAULT 0,
+    "updatedAt" TIMESTAMP(3) NOT NULL,
+
+    CONSTRAINT "product_engagement_pkey" PRIMARY KEY ("id")
+);
+
+-- CreateIndex
+CREATE UNIQUE INDEX "product_engagement_productId_merchant_bucketStart_key" ON "product_engagement"("productId", "merchant", "bucketStart");
+
+-- CreateIndex
+CREATE INDEX "product_engagement_bucketStart_idx" ON "product_engagement"("bucketStart");
+
+-- AddForeignKey
+ALTER TABLE "product_engagement" ADD CONSTRAINT "product_engagement_productId_fkey" FOREIGN KEY ("productId") REFERENCES "products"("id") ON DELETE CASCADE ON UPDATE CASCADE;
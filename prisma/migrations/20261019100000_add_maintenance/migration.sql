@@ -0,0 +1,31 @@
+-- CreateEnum
+CREATE TYPE "MaintenanceRunStatus" AS ENUM ('SUCCESS', 'FAILED');
+
+-- CreateTable
+CREATE TABLE "maintenance_locks" (
+    "name" TEXT NOT NULL,
+    "lockedBy" TEXT NOT NULL,
+    "lockedUntil" TIMESTAMP(3) NOT NULL,
+
+    CONSTRAINT "maintenance_locks_pkey" PRIMARY KEY ("name")
+);
+
+-- CreateTable
+CREATE TABLE "maintenance_runs" (
+    "id" TEXT NOT NULL,
+    "job" TEXT NOT NULL,
+    "status" "MaintenanceRunStatus" NOT NULL,
+    "rowsDeleted" INTEGER NOT NULL DEFAULT 0,
+    "bytesReclaimed" BIGINT NOT NULL DEFAULT 0,
+    "error" TEXT,
+    "startedAt" TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    "finishedAt" TIMESTAMP(3),
+
+    CONSTRAINT "maintenance_runs_pkey" PRIMARY KEY ("id")
+);
+
+-- CreateIndex
+CREATE INDEX "maintenance_runs_job_startedAt_idx" ON "maintenance_runs"("job", "startedAt");
+
+-- CreateIndex
+CREATE INDEX "label_scans_imageUrl_idx" ON "label_scans"("imageUrl");
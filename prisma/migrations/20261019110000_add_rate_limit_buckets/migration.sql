@@ -0,0 +1,12 @@
+-- CreateTable (UNLOGGED: rate limit state is disposable and write-heavy)
+CREATE UNLOGGED TABLE "rate_limit_buckets" (
+    "key" TEXT NOT NULL,
+    "tokens" DOUBLE PRECISION NOT NULL,
+    "allowed" BOOLEAN NOT NULL DEFAULT true,
+    "updatedAt" TIMESTAMP(3) NOT NULL,
+
+    CONSTRAINT "rate_limit_buckets_pkey" PRIMARY KEY ("key")
+);
+
+-- CreateIndex
+CREATE INDEX "rate_limit_buckets_updatedAt_idx" ON "rate_limit_buckets"("updatedAt");
@@ -0,0 +1,41 @@
+-- Composite (sort column, id) indexes for admin table keyset pagination.
+-- The single-column createdAt indexes are superseded by (createdAt, id).
+
+-- DropIndex
+DROP INDEX "contact_messages_createdAt_idx";
+
+-- DropIndex
+DROP INDEX "label_scans_createdAt_idx";
+
+-- CreateIndex
+CREATE INDEX "products_createdAt_id_idx" ON "products"("createdAt", "id");
+
+-- CreateIndex
+CREATE INDEX "products_title_id_idx" ON "products"("title", "id");
+
+-- CreateIndex
+CREATE INDEX "products_healthScore_id_idx" ON "products"("healthScore", "id");
+
+-- CreateIndex
+CREATE INDEX "articles_createdAt_id_idx" ON "articles"("createdAt", "id");
+
+-- CreateIndex
+CREATE INDEX "articles_updatedAt_id_idx" ON "articles"("updatedAt", "id");
+
+-- CreateIndex
+CREATE INDEX "articles_title_id_idx" ON "articles"("title", "id");
+
+-- CreateIndex
+CREATE INDEX "articles_status_createdAt_id_idx" ON "articles"("status", "createdAt", "id");
+
+-- CreateIndex
+CREATE INDEX "contact_messages_createdAt_id_idx" ON "contact_messages"("createdAt", "id");
+
+-- CreateIndex
+CREATE INDEX "contact_messages_status_createdAt_id_idx" ON "contact_messages"("status", "createdAt", "id");
+
+-- CreateIndex
+CREATE INDEX "label_scans_createdAt_id_idx" ON "label_scans"("createdAt", "id");
+
+-- CreateIndex
+CREATE INDEX "label_scans_status_createdAt_id_idx" ON "label_scans"("status", "createdAt", "id");
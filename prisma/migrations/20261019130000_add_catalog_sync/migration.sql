@@ -0,0 +1,46 @@
+-- CreateTable
+CREATE TABLE "sync_tombstones" (
+    "id" TEXT NOT NULL,
+    "entity" TEXT NOT NULL,
+    "entityId" TEXT NOT NULL,
+    "deletedAt" TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP,
+
+    CONSTRAINT "sync_tombstones_pkey" PRIMARY KEY ("id")
+);
+
+-- CreateIndex
+CREATE INDEX "sync_tombstones_deletedAt_id_idx" ON "sync_tombstones"("deletedAt", "id");
+
+-- CreateIndex
+CREATE INDEX "brands_updatedAt_id_idx" ON "brands"("updatedAt", "id");
+
+-- CreateIndex
+CREATE INDEX "categories_updatedAt_id_idx" ON "categories"("updatedAt", "id");
+
+-- CreateIndex
+CREATE INDEX "products_updatedAt_id_idx" ON "products"("updatedAt", "id");
+
+-- CreateFunction (record deleted catalog rows, including cascaded deletes)
+CREATE FUNCTION "record_sync_tombstone"() RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO "sync_tombstones" ("id", "entity", "entityId", "deletedAt")
+    VALUES (gen_random_uuid()::text, TG_TABLE_NAME, OLD."id", NOW() AT TIME ZONE 'UTC');
+    RETURN OLD;
+END;
+$$ LANGUAGE plpgsql;
+
+-- CreateTrigger
+CREATE TRIGGER "brands_sync_tombstone" AFTER DELETE ON "brands"
+    FOR EACH ROW EXECUTE FUNCTION "record_sync_tombstone"();
+
+-- CreateTrigger
+CREATE TRIGGER "categories_sync_tombstone" AFTER DELETE ON "categories"
+    FOR EACH ROW EXECUTE FUNCTION "record_sync_tombstone"();
+
+-- CreateTrigger
+CREATE TRIGGER "products_sync_tombstone" AFTER DELETE ON "products"
+    FOR EACH ROW EXECUTE FUNCTION "record_sync_tombstone"();
+
+-- CreateTrigger
+CREATE TRIGGER "articles_sync_tombstone" AFTER DELETE ON "articles"
+    FOR EACH ROW EXECUTE FUNCTION "record_sync_tombstone"();
@@ -0,0 +1,5 @@
+-- DropIndex (superseded by the composite index below)
+DROP INDEX "telemetry_events_createdAt_idx";
+
+-- CreateIndex
+CREATE INDEX "telemetry_events_createdAt_id_idx" ON "telemetry_events"("createdAt", "id");
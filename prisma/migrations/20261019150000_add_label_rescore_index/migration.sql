@@ -0,0 +1,27 @@
+-- AlterTable
+ALTER TABLE "label_scans" ADD COLUMN "scoredAt" TIMESTAMP(3);
+
+-- AlterTable
+ALTER TABLE "maintenance_runs" ADD COLUMN "rowsUpdated" INTEGER NOT NULL DEFAULT 0;
+
+-- CreateTable
+CREATE TABLE "label_scan_ingredients" (
+    "scanId" TEXT NOT NULL,
+    "term" TEXT NOT NULL,
+    "ingredientId" TEXT,
+
+    CONSTRAINT "label_scan_ingredients_pkey" PRIMARY KEY ("scanId","term")
+);
+
+-- CreateIndex
+CREATE INDEX "label_scan_ingredients_term_idx" ON "label_scan_ingredients"("term");
+
+-- CreateIndex
+CREATE INDEX "label_scan_ingredients_ingredientId_idx" ON "label_scan_ingredients"("ingredientId");
+
+-- AddForeignKey
+ALTER TABLE "label_scan_ingredients" ADD CONSTRAINT "label_scan_ingredients_scanId_fkey" FOREIGN KEY ("scanId") REFERENCES "label_scans"("id") ON DELETE CASCADE ON UPDATE CASCADE;
+
+-- CreateTrigger (deleted ingredients re-score the scans that matched them)
+CREATE TRIGGER "ingredients_sync_tombstone" AFTER DELETE ON "ingredients"
+    FOR EACH ROW EXECUTE FUNCTION "record_sync_tombstone"();
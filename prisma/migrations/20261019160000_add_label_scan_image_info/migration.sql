@@ -0,0 +1,3 @@
+-- AlterTable
+ALTER TABLE "label_scans" ADD COLUMN "imageHash" TEXT,
+ADD COLUMN "imageWidth" INTEGER;
@@ -0,0 +1,241 @@
+#!/usr/bin/env tsx
+
+/**
+ * Telemetry exporter
+ * Streams raw telemetry events for a time range to NDJSON, CSV or Parquet in
+ * (createdAt, id) order, in small keyset batches with constant memory.
+ * Progress is checkpointed to <out>.checkpoint.json; rerunning the same
+ * command after a crash or Ctrl-C continues where it stopped.
+ *
+ * Usage:
+ *   pnpm export:telemetry --from 2026-09-01 --to 2026-10-01 --out events.ndjson
+ *   pnpm export:telemetry --from 2026-09-01 --out events.csv --event-type PAGE_VIEW
+ *   pnpm export:telemetry --from 2026-09-01 --out events.parquet   # events-00001.parquet, ...
+ *   pnpm export:telemetry ... --rows-per-file 5000000              # Parquet part size
+ *   pnpm export:telemetry ... --restart                            # ignore the checkpoint
+ */
+
+import {
+  closeSync,
+  existsSync,
+  ftruncateSync,
+  openSync,
+  readFileSync,
+  renameSync,
+  rmSync,
+  writeFileSync,
+  writeSync,
+} from 'fs';
+import { extname } from 'path';
+import { TelemetryEventType } from '@prisma/client';
+import {
+  EXPORT_FORMATS,
+  ExportFormat,
+  ExportOptions,
+  exportTelemetry,
+  formatExportPosition,
+  parseExportPosition,
+} from '../src/lib/telemetry-export';
+import { prisma } from '../src/lib/prisma';
+
+interface Checkpoint {
+  format: ExportFormat;
+  from: string;
+  to: string;
+  eventType?: string;
+  after: string | null;
+  rows: number;
+  bytes?: number; // NDJSON/CSV: output length at `after`
+  part?: number; // Parquet: last completed part file
+}
+
+function parseArgs(argv: string[]) {
+  const valueOf = (flag: string) => {
+    const i = argv.indexOf(flag);
+    return i !== -1 ? argv[i + 1] : undefined;
+  };
+  const out = valueOf('--out');
+  const extension = extname(out || '').slice(1);
+  const format = (valueOf('--format') ||
+    (extension === 'csv' || extension === 'parquet' ? extension : 'ndjson')) as ExportFormat;
+
+  return {
+    out,
+    format,
+    from: valueOf('--from'),
+    to: valueOf('--to'),
+    eventType: valueOf('--event-type') as TelemetryEventType | undefined,
+    rowsPerFile: parseInt(valueOf('--rows-per-file') || '1000000'),
+    restart: argv.includes('--restart'),
+  };
+}
+
+function saveCheckpoint(path: string, checkpoint: Checkpoint) {
+  // Write then rename so a crash never leaves a half-written checkpoint
+  writeFileSync(`${path}.tmp`, JSON.stringify(checkpoint, null, 2));
+  renameSync(`${path}.tmp`, path);
+}
+
+function logProgress(rows: number, startedAt: number) {
+  const seconds = (Date.now() - startedAt) / 1000;
+  console.log(`  ${rows.toLocaleString()} events (${Math.round(rows / seconds)}/s)`);
+}
+
+/**
+ * NDJSON/CSV: one file, checkpointed after every batch. On resume the file is
+ * truncated back to the checkpoint, dropping any half-written batch.
+ */
+async function exportLines(out: string, checkpointPath: string, checkpoint: Checkpoint) {
+  const resuming = checkpoint.after !== null;
+  const fd = openSync(out, resuming && existsSync(out) ? 'r+' : 'w');
+  let bytes = resuming ? checkpoint.bytes ?? 0 : 0;
+  ftruncateSync(fd, bytes);
+
+  const options: ExportOptions = {
+    from: new Date(checkpoint.from),
+    to: new Date(checkpoint.to),
+    eventType: checkpoint.eventType as TelemetryEventType | undefined,
+    after: checkpoint.after ? parseExportPosition(checkpoint.after) : null,
+    header: !resuming,
+  };
+
+  const startedAt = Date.now();
+  const baseRows = checkpoint.rows;
+  let lastLogged = 0;
+  try {
+    for await (const chunk of exportTelemetry(checkpoint.format, options)) {
+      if (chunk.bytes.length > 0) {
+        writeSync(fd, chunk.bytes, 0, chunk.bytes.length, bytes);
+        bytes += chunk.bytes.length;
+      }
+      if (!chunk.position) continue;
+
+      checkpoint.after = formatExportPosition(chunk.position);
+      checkpoint.rows = baseRows + chunk.rows;
+      checkpoint.bytes = bytes;
+      saveCheckpoint(checkpointPath, checkpoint);
+
+      if (chunk.rows - lastLogged >= 100000) {
+        logProgress(chunk.rows, startedAt);
+        lastLogged = chunk.rows;
+      }
+    }
+  } finally {
+    closeSync(fd);
+  }
+  console.log(`Wrote ${out}`);
+}
+
+/**
+ * Parquet: a file is only readable once its footer is written, so the export
+ * is split into part files that each complete on their own; resuming starts
+ * the next part.
+ */
+async function exportParquet(
+  out: string,
+  checkpointPath: string,
+  checkpoint: Checkpoint,
+  rowsPerFile: number
+) {
+  const base = out.replace(/\.parquet$/, '');
+  const startedAt = Date.now();
+
+  for (;;) {
+    const part = (checkpoint.part ?? 0) + 1;
+    const partPath = `${base}-${String(part).padStart(5, '0')}.parquet`;
+    const fd = openSync(`${partPath}.partial`, 'w');
+
+    let rows = 0;
+    let last = checkpoint.after;
+    try {
+      for await (const chunk of exportTelemetry('parquet', {
+        from: new Date(checkpoint.from),
+        to: new Date(checkpoint.to),
+        eventType: checkpoint.eventType as TelemetryEventType | undefined,
+        after: checkpoint.after ? parseExportPosition(checkpoint.after) : null,
+        limit: rowsPerFile,
+      })) {
+        if (chunk.bytes.length > 0) writeSync(fd, chunk.bytes);
+        rows = chunk.rows;
+        if (chunk.position) last = formatExportPosition(chunk.position);
+      }
+    } finally {
+      closeSync(fd);
+    }
+
+    if (rows === 0) {
+      rmSync(`${partPath}.partial`);
+      break;
+    }
+
+    renameSync(`${partPath}.partial`, partPath);
+    checkpoint.part = part;
+    checkpoint.after = last;
+    checkpoint.rows += rows;
+    saveCheckpoint(checkpointPath, checkpoint);
+    console.log(`Wrote ${partPath} (${rows.toLocaleString()} events)`);
+    logProgress(checkpoint.rows, startedAt);
+
+    if (rows < rowsPerFile) break;
+  }
+}
+
+async function main() {
+  const args = parseArgs(process.argv.slice(2));
+
+  if (!args.out || !args.from || !(args.format in EXPORT_FORMATS)) {
+    console.error(
+      'Usage: pnpm export:telemetry --from <date> [--to <date>] --out <file.ndjson|csv|parquet>'
+    );
+    process.exit(1);
+  }
+  if (args.eventType && !(args.eventType in TelemetryEventType)) {
+    console.error(`Unknown event type ${args.eventType}`);
+    process.exit(1);
+  }
+
+  const checkpointPath = `${args.out}.checkpoint.json`;
+  const fresh: Checkpoint = {
+    format: args.format,
+    from: new Date(args.from).toISOString(),
+    to: (args.to ? new Date(args.to) : new Date()).toISOString(),
+    eventType: args.eventType,
+    after: null,
+    rows: 0,
+  };
+
+  let checkpoint = fresh;
+  if (!args.restart && existsSync(checkpointPath)) {
+    const saved: Checkpoint = JSON.parse(readFileSync(checkpointPath, 'utf8'));
+    // Without --to, the resumed export keeps the end time it started with
+    const keys: Array<keyof Checkpoint> = ['format', 'from', 'eventType'];
+    if (args.to) keys.push('to');
+    const same = keys.every((key) => saved[key] === fresh[key]);
+    if (!same) {
+      console.error(`${checkpointPath} is for a different export; use --restart to overwrite`);
+      process.exit(1);
+    }
+    checkpoint = saved;
+    console.log(
+      `↩️  Resuming after ${checkpoint.rows.toLocaleString()} events (${checkpoint.after})`
+    );
+  }
+
+  console.log(`📤 Exporting telemetry ${checkpoint.from} → ${checkpoint.to} as ${args.format}`);
+
+  if (args.format === 'parquet') {
+    await exportParquet(args.out, checkpointPath, checkpoint, args.rowsPerFile);
+  } else {
+    await exportLines(args.out, checkpointPath, checkpoint);
+  }
+
+  rmSync(checkpointPath, { force: true });
+  console.log(`✅ Exported ${checkpoint.rows.toLocaleString()} events`);
+}
+
+main()
+  .catch((error) => {
+    console.error(error);
+    process.exit(1);
+  })
+  .finally(() => prisma.$disconnect());
@@ -0,0 +1,90 @@
+#!/usr/bin/env tsx
+
+/**
+ * Catalog importer
+ * Streams a CSV or JSONL product feed into the database, upserting by slug.
+ * Brand and category columns are slugs (add brandName / categoryName to
+ * create missing ones); badges are |-separated badge codes; CSV affiliate
+ * links go in amazonUrl / flipkartUrl / otherUrl columns.
+ *
+ * Usage:
+ *   pnpm import:catalog products.csv
+ *   pnpm import:catalog feed.jsonl --dry-run     # validate only
+ *   pnpm import:catalog feed.jsonl --skip 4000   # resume after 4000 rows
+ *   pnpm import:catalog feed.csv --errors errors.jsonl
+ */
+
+import { createReadStream, writeFileSync } from 'fs';
+import { extname } from 'path';
+import { ImportFormat, importCatalog } from '../src/lib/catalog-import';
+import { prisma } from '../src/lib/prisma';
+
+function parseArgs(argv: string[]) {
+  const valueOf = (flag: string) => {
+    const i = argv.indexOf(flag);
+    return i !== -1 ? argv[i + 1] : undefined;
+  };
+  const valueFlags = ['--format', '--skip', '--batch-size', '--errors'];
+  const file = argv.find((arg, i) => !arg.startsWith('--') && !valueFlags.includes(argv[i - 1]));
+  const format = (valueOf('--format') ||
+    (extname(file || '') === '.csv' ? 'csv' : 'jsonl')) as ImportFormat;
+
+  return {
+    file,
+    format,
+    dryRun: argv.includes('--dry-run'),
+    skip: parseInt(valueOf('--skip') || '0'),
+    batchSize: valueOf('--batch-size') ? parseInt(valueOf('--batch-size')!) : undefined,
+    errorsFile: valueOf('--errors'),
+  };
+}
+
+async function main() {
+  const args = parseArgs(process.argv.slice(2));
+
+  if (!args.file) {
+    console.error('Usage: pnpm import:catalog <file.csv|file.jsonl> [--dry-run] [--skip N]');
+    process.exit(1);
+  }
+
+  console.log(`📦 Importing ${args.file} (${args.format}${args.dryRun ? ', dry run' : ''})`);
+
+  const report = await importCatalog(createReadStream(args.file), {
+    format: args.format,
+    dryRun: args.dryRun,
+    skip: args.skip,
+    batchSize: args.batchSize,
+    onProgress: (progress) => {
+      const rowsRead = progress.processed + progress.failed + progress.skipped;
+      console.log(
+        `  ${rowsRead} rows read (line ${progress.lastLine}), ${progress.failed} failed, ` +
+          `${progress.durationMs}ms`
+      );
+    },
+  });
+
+  for (const error of report.errors.slice(0, 20)) {
+    console.log(`✗ line ${error.line}${error.slug ? ` (${error.slug})` : ''}: ${error.error}`);
+  }
+  if (report.errors.length > 20) {
+    console.log(`  ... and ${report.failed - 20} more`);
+  }
+  if (args.errorsFile) {
+    writeFileSync(args.errorsFile, report.errors.map((e) => JSON.stringify(e)).join('\n') + '\n');
+    console.log(`Errors written to ${args.errorsFile}`);
+  }
+
+  console.log(
+    `✅ ${report.created} created, ${report.updated} updated, ${report.failed} failed, ` +
+      `${report.brandsCreated} brands and ${report.categoriesCreated} categories created ` +
+      `in ${(report.durationMs / 1000).toFixed(1)}s`
+  );
+  if (report.failed > 0) process.exitCode = 2;
+}
+
+main()
+  .catch((error) => {
+    console.error(error);
+    process.exit(1);
+  })
+  .finally(() => prisma.$disconnect());
@@ -0,0 +1,85 @@
+#!/usr/bin/env tsx
+
+/**
+ * Maintenance runner
+ * Runs due cleanup jobs (expired OTPs, failed scans, orphaned uploads, old
+ * telemetry) and label scan re-scoring for hosts without Vercel Cron, e.g.
+ * Docker or a VM crontab.
+ *
+ * Usage:
+ *   pnpm maintenance                      # run due jobs once
+ *   pnpm maintenance --job failed-scans   # only this job (repeatable)
+ *   pnpm maintenance --force              # ignore schedules
+ *   pnpm maintenance --loop               # check every minute until stopped
+ *   pnpm maintenance --list               # show jobs and schedules
+ */
+
+import { MAINTENANCE_JOBS, runMaintenance } from '../src/lib/maintenance';
+import { prisma } from '../src/lib/prisma';
+
+function parseArgs(argv: string[]) {
+  const jobs: string[] = [];
+  for (let i = 0; i < argv.length; i++) {
+    if (argv[i] === '--job' && argv[i + 1]) jobs.push(argv[++i]);
+  }
+  return {
+    jobs: jobs.length > 0 ? jobs : undefined,
+    force: argv.includes('--force'),
+    loop: argv.includes('--loop'),
+    list: argv.includes('--list'),
+  };
+}
+
+function formatBytes(bytes: number): string {
+  if (bytes < 1024) return `${bytes} B`;
+  if (bytes < 1024 * 1024) return `${(bytes / 1024).toFixed(1)} KB`;
+  return `${(bytes / 1024 / 1024).toFixed(1)} MB`;
+}
+
+async function runOnce(jobs: string[] | undefined, force: boolean) {
+  const report = await runMaintenance({ jobs, force });
+  if (!report.locked) return;
+
+  for (const job of report.jobs) {
+    if (job.status === 'SKIPPED') continue;
+    console.log(
+      `${job.status === 'SUCCESS' ? '✓' : '✗'} ${job.job}: ${job.rowsDeleted} rows, ` +
+        (job.rowsUpdated ? `${job.rowsUpdated} updated, ` : '') +
+        `${formatBytes(job.bytesReclaimed)} reclaimed (${job.durationMs}ms)` +
+        (job.error ? ` - ${job.error}` : '')
+    );
+  }
+}
+
+async function main() {
+  const args = parseArgs(process.argv.slice(2));
+
+  if (args.list) {
+    for (const job of MAINTENANCE_JOBS) {
+      console.log(`${job.name.padEnd(18)} ${job.schedule.padEnd(14)} ${job.description}`);
+    }
+    return;
+  }
+
+  if (!args.loop) {
+    await runOnce(args.jobs, args.force);
+    return;
+  }
+
+  console.log('Maintenance scheduler started, checking every minute');
+  let stopped = false;
+  process.on('SIGINT', () => (stopped = true));
+  process.on('SIGTERM', () => (stopped = true));
+
+  while (!stopped) {
+    await runOnce(args.jobs, false).catch((error) => console.error('Maintenance error:', error));
+    await new Promise((resolve) => setTimeout(resolve, 60_000 - (Date.now() % 60_000)));
+  }
+}
+
+main()
+  .catch((error) => {
+    console.error(error);
+    process.exit(1);
+  })
+  .finally(() => prisma.$disconnect());
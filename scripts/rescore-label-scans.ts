@@ -0,0 +1,68 @@
+#!/usr/bin/env tsx
+
+/**
+ * Label scan re-scorer
+ * Re-scores historical label scans against the current Ingredient table from
+ * their stored extractedData, without redoing OCR. The `label-rescore`
+ * maintenance job does this daily for ingredient changes; use this after
+ * changing the scoring rules, or to backfill a large table in one go.
+ *
+ * Usage:
+ *   pnpm rescore:labels --all                     # every completed scan
+ *   pnpm rescore:labels --since 2026-10-01        # ingredient changes since a date
+ *   pnpm rescore:labels --all --chunk-size 500
+ */
+
+import { rescoreLabelScans } from '../src/lib/label-rescore';
+import { prisma } from '../src/lib/prisma';
+
+function parseArgs(argv: string[]) {
+  const valueOf = (flag: string) => {
+    const i = argv.indexOf(flag);
+    return i !== -1 ? argv[i + 1] : undefined;
+  };
+  return {
+    all: argv.includes('--all'),
+    since: valueOf('--since'),
+    chunkSize: valueOf('--chunk-size') ? parseInt(valueOf('--chunk-size')!) : undefined,
+  };
+}
+
+async function main() {
+  const args = parseArgs(process.argv.slice(2));
+  const since = args.since ? new Date(args.since) : null;
+
+  if (!args.all && (!since || isNaN(since.getTime()))) {
+    console.error('Usage: pnpm rescore:labels --all | --since <date> [--chunk-size <n>]');
+    process.exit(1);
+  }
+
+  const startedAt = Date.now();
+  let lastLogged = 0;
+  const result = await rescoreLabelScans({
+    all: args.all,
+    since,
+    chunkSize: args.chunkSize,
+    onProgress: (progress) => {
+      if (progress.scanned - lastLogged < 5000) return;
+      lastLogged = progress.scanned;
+      const seconds = (Date.now() - startedAt) / 1000;
+      console.log(
+        `  ${progress.scanned.toLocaleString()} scans, ${progress.updated.toLocaleString()} ` +
+          `updated (${Math.round(progress.scanned / seconds)}/s)`
+      );
+    },
+  });
+
+  console.log(
+    `✅ ${result.updated} updated, ${result.unchanged} unchanged, ` +
+      `${result.conflicts} changed concurrently (of ${result.scanned})`
+  );
+}
+
+main()
+  .catch((error) => {
+    console.error(error);
+    process.exit(1);
+  })
+  .finally(() => prisma.$disconnect());
@@ -9,18 +9,57 @@ import { Badge } from '@/components/ui/badge';
 import { Plus, Edit, Video } from 'lucide-react';
 import { formatDate } from '@/lib/utils';
 import { DeleteButton } from '@/components/admin/delete-button';
+import {
+  TableFilterLinks,
+  TablePagination,
+  TableSortLinks,
+} from '@/components/admin/table-controls';
+import { TableDefinition, fetchTablePage, formatTotal, parseTableQuery } from '@/lib/admin-table';
 
-export default async function ArticlesListPage() {
+const ARTICLES_TABLE: TableDefinition = {
+  table: 'articles',
+  sorts: { createdAt: 'date', updatedAt: 'date', title: 'string' },
+  defaultSort: 'createdAt',
+  defaultDirection: 'desc',
+  filters: {
+    status: { field: 'status', values: { DRAFT: 'DRAFT', PUBLISHED: 'PUBLISHED' } },
+  },
+};
+
+export default async function ArticlesListPage({
+  searchParams,
+}: {
+  searchParams: { [key: string]: string | undefined };
+}) {
   const session = await getServerSession(authOptions);
 
   if (!session) {
     redirect('/admin/login');
   }
 
-  const articles = await prisma.article.findMany({
-    include: { author: true },
-    orderBy: { createdAt: 'desc' },
-  });
+  const query = parseTableQuery(ARTICLES_TABLE, searchParams);
+  // The list never shows the article body, so leave bodyMarkdown out
+  const page = await fetchTablePage(
+    ARTICLES_TABLE,
+    query,
+    (args) =>
+      prisma.article.findMany({
+        ...args,
+        select: {
+          id: true,
+          title: true,
+          excerpt: true,
+          videoUrl: true,
+          category: true,
+          status: true,
+          publishedAt: true,
+          createdAt: true,
+          updatedAt: true,
+        },
+      }),
+    (args) => prisma.article.count(args)
+  );
+  const articles = page.rows;
 
   return (
     <div>
@@ -38,8 +77,26 @@ export default async function ArticlesListPage() {
       </div>
 
       <Card>
-        <CardHeader>
-          <CardTitle>All Articles ({articles.length})</CardTitle>
+        <CardHeader className="space-y-4">
+          <CardTitle>All Articles ({formatTotal(page.total)})</CardTitle>
+          <TableSortLinks
+            basePath="/admin/articles"
+            query={query}
+            options={[
+              { sort: 'createdAt', label: 'Newest' },
+              { sort: 'updatedAt', label: 'Recently Updated' },
+              { sort: 'title', label: 'Title' },
+            ]}
+          />
+          <TableFilterLinks
+            basePath="/admin/articles"
+            query={query}
+            name="status"
+            options={[
+              { value: 'PUBLISHED', label: 'Published' },
+              { value: 'DRAFT', label: 'Drafts' },
+            ]}
+          />
         </CardHeader>
         <CardContent>
           <div className="space-y-4">
@@ -81,7 +138,7 @@ export default async function ArticlesListPage() {
               </div>
             ))}
 
-            {articles.length === 0 && (
+            {page.total.count === 0 && Object.keys(query.filters).length === 0 && (
               <div className="text-center py-12">
                 <p className="text-neutral-600">No articles yet. Write your first article!</p>
                 <Button asChild className="mt-4">
@@ -93,6 +150,7 @@ export default async function ArticlesListPage() {
               </div>
             )}
           </div>
+          <TablePagination basePath="/admin/articles" query={query} page={page} />
         </CardContent>
       </Card>
     </div>
@@ -1,33 +1,64 @@
 import { prisma } from '@/lib/prisma';
 import { ContactMessageList } from '@/components/admin/contact-message-list';
+import { TableFilterLinks, TablePagination } from '@/components/admin/table-controls';
+import {
+  TableDefinition,
+  TableQuery,
+  countByValue,
+  fetchTablePage,
+  formatTotal,
+  parseTableQuery,
+} from '@/lib/admin-table';
 
 export const dynamic = 'force-dynamic';
 
-async function getContactMessages() {
-  const messages = await prisma.contactMessage.findMany({
-    orderBy: {
-      createdAt: 'desc',
-    },
-  });
-  return messages;
+const STATUSES = ['NEW', 'READ', 'REPLIED', 'ARCHIVED'] as const;
+
+const CONTACT_MESSAGES_TABLE: TableDefinition = {
+  table: 'contact_messages',
+  sorts: { createdAt: 'date' },
+  defaultSort: 'createdAt',
+  defaultDirection: 'desc',
+  filters: {
+    status: { field: 'status', values: Object.fromEntries(STATUSES.map((s) => [s, s])) },
+  },
+};
+
+async function getContactMessages(query: TableQuery) {
+  return fetchTablePage(
+    CONTACT_MESSAGES_TABLE,
+    query,
+    (args) => prisma.contactMessage.findMany(args),
+    (args) => prisma.contactMessage.count(args)
+  );
 }
 
 async function getStats() {
-  const [total, newCount, readCount, repliedCount] = await Promise.all([
-    prisma.contactMessage.count(),
-    prisma.contactMessage.count({ where: { status: 'NEW' } }),
-    prisma.contactMessage.count({ where: { status: 'READ' } }),
-    prisma.contactMessage.count({ where: { status: 'REPLIED' } }),
-  ]);
+  const { counts, approximate } = await countByValue('contact_messages', 'status', async () => {
+    const groups = await prisma.contactMessage.groupBy({ by: ['status'], _count: true });
+    return Object.fromEntries(groups.map((group) => [group.status, group._count]));
+  });
+
+  const format = (count: number) =>
+    formatTotal({ count, kind: approximate ? 'estimate' : 'exact' });
+  const total = STATUSES.reduce((sum, status) => sum + (counts[status] || 0), 0);
 
-  return { total, newCount, readCount, repliedCount };
+  return {
+    total: format(total),
+    newCount: format(counts.NEW || 0),
+    readCount: format(counts.READ || 0),
+    repliedCount: format(counts.REPLIED || 0),
+    byStatus: Object.fromEntries(STATUSES.map((status) => [status, format(counts[status] || 0)])),
+  };
 }
 
-export default async function ContactMessagesPage() {
-  const [messages, stats] = await Promise.all([
-    getContactMessages(),
-    getStats(),
-  ]);
+export default async function ContactMessagesPage({
+  searchParams,
+}: {
+  searchParams: { [key: string]: string | undefined };
+}) {
+  const query = parseTableQuery(CONTACT_MESSAGES_TABLE, searchParams);
+  const [page, stats] = await Promise.all([getContactMessages(query), getStats()]);
 
   return (
     <div className="space-y-6">
@@ -58,8 +89,22 @@ export default async function ContactMessagesPage() {
         </div>
       </div>
 
+      {/* Filter Tabs */}
+      <TableFilterLinks
+        basePath="/admin/contact-messages"
+        query={query}
+        name="status"
+        allLabel={`All (${stats.total})`}
+        options={STATUSES.map((status) => ({
+          value: status,
+          label: status.charAt(0) + status.slice(1).toLowerCase(),
+          count: stats.byStatus[status],
+        }))}
+      />
+
       {/* Messages List */}
-      <ContactMessageList messages={messages} />
+      <ContactMessageList messages={page.rows} />
+      <TablePagination basePath="/admin/contact-messages" query={query} page={page} />
     </div>
   );
 }
@@ -1,36 +1,92 @@
 import { prisma } from '@/lib/prisma';
 import { Card, CardContent, CardHeader, CardTitle } from '@/components/ui/card';
 import { Badge } from '@/components/ui/badge';
-import Link from 'next/link';
+import { TableFilterLinks, TablePagination } from '@/components/admin/table-controls';
+import { ResponsiveImage } from '@/components/responsive-image';
+import { imageVariantsFromInfo } from '@/lib/image-derivatives';
+import {
+  TableDefinition,
+  TableQuery,
+  countByValue,
+  fetchTablePage,
+  formatTotal,
+  parseTableQuery,
+} from '@/lib/admin-table';
 
 export const dynamic = 'force-dynamic';
 
-async function getLabelScans() {
-  const scans = await prisma.labelScan.findMany({
-    orderBy: {
-      createdAt: 'desc',
+const LABEL_SCANS_TABLE: TableDefinition = {
+  table: 'label_scans',
+  sorts: { createdAt: 'date' },
+  defaultSort: 'createdAt',
+  defaultDirection: 'desc',
+  filters: {
+    status: {
+      field: 'status',
+      values: { PROCESSING: 'PROCESSING', COMPLETED: 'COMPLETED', FAILED: 'FAILED' },
     },
-    take: 100,
-  });
-  return scans;
+  },
+};
+
+async function getLabelScans(query: TableQuery) {
+  // OCR text and analysis JSON are not shown in the list
+  return fetchTablePage(
+    LABEL_SCANS_TABLE,
+    query,
+    (args) =>
+      prisma.labelScan.findMany({
+        ...args,
+        select: {
+          id: true,
+          imageUrl: true,
+          imageHash: true,
+          imageWidth: true,
+          productName: true,
+          healthScore: true,
+          status: true,
+          createdAt: true,
+        },
+      }),
+    (args) => prisma.labelScan.count(args)
+  );
 }
 
 async function getStats() {
-  const [total, completed, processing, failed] = await Promise.all([
-    prisma.labelScan.count(),
-    prisma.labelScan.count({ where: { status: 'COMPLETED' } }),
-    prisma.labelScan.count({ where: { status: 'PROCESSING' } }),
-    prisma.labelScan.count({ where: { status: 'FAILED' } }),
-  ]);
+  const { counts, approximate } = await countByValue('label_scans', 'status', async () => {
+    const groups = await prisma.labelScan.groupBy({ by: ['status'], _count: true });
+    return Object.fromEntries(groups.map((group) => [group.status, group._count]));
+  });
 
-  return { total, completed, processing, failed };
+  const format = (count: number) =>
+    formatTotal({ count, kind: approximate ? 'estimate' : 'exact' });
+  const completed = counts.COMPLETED || 0;
+  const processing = counts.PROCESSING || 0;
+  const failed = counts.FAILED || 0;
+
+  return {
+    total: format(completed + processing + failed),
+    completed: format(completed),
+    processing: format(processing),
+    failed: format(failed),
+  };
 }
 
-export default async function LabelScansPage() {
-  const [scans, stats] = await Promise.all([
-    getLabelScans(),
-    getStats(),
-  ]);
+export default async function LabelScansPage({
+  searchParams,
+}: {
+  searchParams: { [key: string]: string | undefined };
+}) {
+  const query = parseTableQuery(LABEL_SCANS_TABLE, searchParams);
+  const [page, stats] = await Promise.all([getLabelScans(query), getStats()]);
+  // Uploads are full-size phone photos; thumbnails use 96px derivatives built
+  // from the hash stored at upload (scans from before that show the original)
+  const scans = page.rows.map((scan) => ({
+    ...scan,
+    thumbnail:
+      scan.imageHash && scan.imageWidth
+        ? imageVariantsFromInfo(scan.imageUrl, { hash: scan.imageHash, width: scan.imageWidth })
+        : null,
+  }));
 
   return (
     <div className="space-y-6">
@@ -63,8 +119,18 @@ export default async function LabelScansPage() {
 
       {/* Scans List */}
       <Card>
-        <CardHeader>
-          <CardTitle>Recent Scans</CardTitle>
+        <CardHeader className="space-y-4">
+          <CardTitle>Recent Scans ({formatTotal(page.total)})</CardTitle>
+          <TableFilterLinks
+            basePath="/admin/label-scans"
+            query={query}
+            name="status"
+            options={[
+              { value: 'COMPLETED', label: 'Completed' },
+              { value: 'PROCESSING', label: 'Processing' },
+              { value: 'FAILED', label: 'Failed' },
+            ]}
+          />
         </CardHeader>
         <CardContent>
           {scans.length === 0 ? (
@@ -78,11 +144,24 @@ export default async function LabelScansPage() {
                 >
                   {/* Image */}
                   <div className="flex-shrink-0">
-                    <img
-                      src={scan.imageUrl}
-                      alt="Product label"
-                      className="w-24 h-24 object-cover rounded-lg"
-                    />
+                    {scan.thumbnail ? (
+                      <div className="relative w-24 h-24 overflow-hidden rounded-lg">
+                        <ResponsiveImage
+                          src={scan.imageUrl}
+                          alt="Product label"
+                          variants={scan.thumbnail}
+                          sizes="96px"
+                          className="object-cover"
+                        />
+                      </div>
+                    ) : (
+                      <img
+                        src={scan.imageUrl}
+                        alt="Product label"
+                        loading="lazy"
+                        className="w-24 h-24 object-cover rounded-lg"
+                      />
+                    )}
                   </div>
 
                   {/* Details */}
@@ -132,6 +211,7 @@ export default async function LabelScansPage() {
               ))}
             </div>
           )}
+          <TablePagination basePath="/admin/label-scans" query={query} page={page} />
         </CardContent>
       </Card>
     </div>
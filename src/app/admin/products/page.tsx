@@ -8,24 +8,51 @@ import { Card, CardContent, CardHeader, CardTitle } from '@/components/ui/card';
 import { Badge } from '@/components/ui/badge';
 import { Plus, Edit } from 'lucide-react';
 import { DeleteButton } from '@/components/admin/delete-button';
+import {
+  TableFilterLinks,
+  TablePagination,
+  TableSortLinks,
+} from '@/components/admin/table-controls';
+import { TableDefinition, fetchTablePage, formatTotal, parseTableQuery } from '@/lib/admin-table';
 
-export default async function ProductsListPage() {
+const PRODUCTS_TABLE: TableDefinition = {
+  table: 'products',
+  sorts: { createdAt: 'date', title: 'string', healthScore: 'number' },
+  defaultSort: 'createdAt',
+  defaultDirection: 'desc',
+  filters: { standard: { field: 'isMeetsStandard', values: { yes: true, no: false } } },
+};
+
+export default async function ProductsListPage({
+  searchParams,
+}: {
+  searchParams: { [key: string]: string | undefined };
+}) {
   const session = await getServerSession(authOptions);
 
   if (!session) {
     redirect('/admin/login');
   }
 
-  const products = await prisma.product.findMany({
-    include: {
-      brand: true,
-      category: true,
-      badges: {
-        include: { badge: true },
-      },
-    },
-    orderBy: { createdAt: 'desc' },
-  });
+  const query = parseTableQuery(PRODUCTS_TABLE, searchParams);
+  const page = await fetchTablePage(
+    PRODUCTS_TABLE,
+    query,
+    (args) =>
+      prisma.product.findMany({
+        ...args,
+        include: {
+          brand: { select: { name: true } },
+          category: { select: { name: true } },
+          badges: {
+            include: { badge: { select: { id: true, name: true } } },
+            take: 3,
+          },
+        },
+      }),
+    (args) => prisma.product.count(args)
+  );
+  const products = page.rows;
 
   return (
     <div>
@@ -43,8 +70,26 @@ export default async function ProductsListPage() {
       </div>
 
       <Card>
-        <CardHeader>
-          <CardTitle>All Products ({products.length})</CardTitle>
+        <CardHeader className="space-y-4">
+          <CardTitle>All Products ({formatTotal(page.total)})</CardTitle>
+          <TableSortLinks
+            basePath="/admin/products"
+            query={query}
+            options={[
+              { sort: 'createdAt', label: 'Newest' },
+              { sort: 'title', label: 'Title' },
+              { sort: 'healthScore', label: 'Health Score' },
+            ]}
+          />
+          <TableFilterLinks
+            basePath="/admin/products"
+            query={query}
+            name="standard"
+            options={[
+              { value: 'yes', label: 'Meets Standard' },
+              { value: 'no', label: 'Below Standard' },
+            ]}
+          />
         </CardHeader>
         <CardContent>
           <div className="space-y-4">
@@ -68,7 +113,7 @@ export default async function ProductsListPage() {
                     <span>Health Score: {product.healthScore}</span>
                   </div>
                   <div className="mt-2 flex flex-wrap gap-1">
-                    {product.badges.slice(0, 3).map((pb) => (
+                    {product.badges.map((pb) => (
                       <Badge key={pb.badge.id} variant="secondary" className="text-xs">
                         {pb.badge.name}
                       </Badge>
@@ -87,7 +132,7 @@ export default async function ProductsListPage() {
               </div>
             ))}
 
-            {products.length === 0 && (
+            {page.total.count === 0 && Object.keys(query.filters).length === 0 && (
               <div className="text-center py-12">
                 <p className="text-neutral-600">No products yet. Add your first product!</p>
                 <Button asChild className="mt-4">
@@ -99,6 +144,7 @@ export default async function ProductsListPage() {
               </div>
             )}
           </div>
+          <TablePagination basePath="/admin/products" query={query} page={page} />
         </CardContent>
       </Card>
     </div>
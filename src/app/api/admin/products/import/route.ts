@@ -0,0 +1,59 @@
+import { NextRequest, NextResponse } from 'next/server';
+import { getServerSession } from 'next-auth';
+import { authOptions } from '@/lib/auth';
+import { ImportFormat, importCatalog, readableStreamChunks } from '@/lib/catalog-import';
+
+export const dynamic = 'force-dynamic';
+export const maxDuration = 300;
+
+function detectFormat(request: NextRequest, param: string | null): ImportFormat | null {
+  if (param === 'csv' || param === 'jsonl') return param;
+  const contentType = request.headers.get('content-type') || '';
+  if (contentType.includes('csv')) return 'csv';
+  if (contentType.includes('ndjson') || contentType.includes('jsonl')) return 'jsonl';
+  return null;
+}
+
+/**
+ * POST /api/admin/products/import
+ * Stream a CSV or JSONL catalog in the request body and upsert products by slug.
+ * ?format=csv|jsonl (or Content-Type text/csv / application/x-ndjson),
+ * ?dryRun=true validates without writing, ?skip=N resumes after N rows.
+ */
+export async function POST(request: NextRequest) {
+  const session = await getServerSession(authOptions);
+
+  if (!session) {
+    return NextResponse.json({ error: 'Unauthorized' }, { status: 401 });
+  }
+
+  const { searchParams } = new URL(request.url);
+  const format = detectFormat(request, searchParams.get('format'));
+
+  if (!format) {
+    return NextResponse.json(
+      { error: 'Specify ?format=csv or ?format=jsonl (or a CSV / NDJSON Content-Type)' },
+      { status: 400 }
+    );
+  }
+
+  if (!request.body) {
+    return NextResponse.json({ error: 'Request body is empty' }, { status: 400 });
+  }
+
+  try {
+    const report = await importCatalog(readableStreamChunks(request.body), {
+      format,
+      dryRun: searchParams.get('dryRun') === 'true',
+      skip: parseInt(searchParams.get('skip') || '0') || 0,
+    });
+
+    return NextResponse.json(report, { status: report.failed > 0 ? 207 : 200 });
+  } catch (error: any) {
+    console.error('Catalog import error:', error);
+    return NextResponse.json(
+      { error: 'Catalog import failed', details: error.message },
+      { status: 500 }
+    );
+  }
+}
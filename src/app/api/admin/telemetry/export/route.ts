@@ -0,0 +1,112 @@
+import { NextRequest, NextResponse } from 'next/server';
+import { getServerSession } from 'next-auth';
+import { TelemetryEventType } from '@prisma/client';
+import { authOptions } from '@/lib/auth';
+import {
+  EXPORT_FORMATS,
+  ExportFormat,
+  exportTelemetry,
+  parseExportPosition,
+} from '@/lib/telemetry-export';
+
+export const dynamic = 'force-dynamic';
+export const maxDuration = 300;
+
+// Finish the response (and the Parquet footer) well before maxDuration
+const EXPORT_DEADLINE_MS = 240 * 1000;
+const DEFAULT_RANGE_MS = 24 * 60 * 60 * 1000;
+
+function parseDate(value: string | null, fallback: Date): Date | null {
+  if (!value) return fallback;
+  const date = new Date(value);
+  return isNaN(date.getTime()) ? null : date;
+}
+
+/**
+ * GET /api/admin/telemetry/export
+ * Stream raw telemetry events in (createdAt, id) order.
+ * ?format=ndjson|csv|parquet, ?from / ?to (ISO, default the last 24h, `to`
+ * exclusive), ?eventType, ?limit, ?after=<createdAt>,<id> to resume after a
+ * row. A response stops at a batch boundary after ~4 minutes; fetch again
+ * with `after` set to the last row until one comes back empty.
+ */
+export async function GET(request: NextRequest) {
+  const session = await getServerSession(authOptions);
+
+  if (!session) {
+    return NextResponse.json({ error: 'Unauthorized' }, { status: 401 });
+  }
+
+  const { searchParams } = new URL(request.url);
+  const format = (searchParams.get('format') || 'ndjson') as ExportFormat;
+  if (!(format in EXPORT_FORMATS)) {
+    return NextResponse.json(
+      { error: 'format must be ndjson, csv or parquet' },
+      { status: 400 }
+    );
+  }
+
+  const to = parseDate(searchParams.get('to'), new Date());
+  const from = to
+    ? parseDate(searchParams.get('from'), new Date(to.getTime() - DEFAULT_RANGE_MS))
+    : null;
+  if (!from || !to || from >= to) {
+    return NextResponse.json({ error: 'Invalid from/to range' }, { status: 400 });
+  }
+
+  const eventType = searchParams.get('eventType') as TelemetryEventType | null;
+  if (eventType && !(eventType in TelemetryEventType)) {
+    return NextResponse.json({ error: 'Invalid eventType' }, { status: 400 });
+  }
+
+  const afterParam = searchParams.get('after');
+  const after = afterParam ? parseExportPosition(afterParam) : null;
+  if (afterParam && !after) {
+    return NextResponse.json(
+      { error: 'after must be "<createdAt ISO>,<id>" of the last exported row' },
+      { status: 400 }
+    );
+  }
+
+  const limit = searchParams.get('limit') ? parseInt(searchParams.get('limit')!) : undefined;
+
+  const chunks = exportTelemetry(format, {
+    from,
+    to,
+    eventType: eventType ?? undefined,
+    after,
+    limit: limit && limit > 0 ? limit : undefined,
+    deadline: Date.now() + EXPORT_DEADLINE_MS,
+    header: !after,
+  });
+
+  // Pull-based: the next batch is only read once the client has taken the last
+  const body = new ReadableStream<Uint8Array>({
+    async pull(controller) {
+      try {
+        const { value, done } = await chunks.next();
+        if (done) {
+          controller.close();
+        } else if (value.bytes.length > 0) {
+          controller.enqueue(value.bytes);
+        }
+      } catch (error) {
+        console.error('Telemetry export error:', error);
+        controller.error(error);
+      }
+    },
+    async cancel() {
+      await chunks.return(undefined);
+    },
+  });
+
+  const { contentType, extension } = EXPORT_FORMATS[format];
+  const fileName = `telemetry-${from.toISOString().slice(0, 10)}.${extension}`;
+  return new NextResponse(body, {
+    headers: {
+      'Content-Type': contentType,
+      'Content-Disposition': `attachment; filename="${fileName}"`,
+      'Cache-Control': 'no-store',
+    },
+  });
+}
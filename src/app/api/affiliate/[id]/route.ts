@@ -0,0 +1,38 @@
+import { NextRequest, NextResponse } from 'next/server';
+import { prisma } from '@/lib/prisma';
+import { buildAffiliateUrl } from '@/lib/affiliate';
+import { recordAffiliateClick } from '@/lib/engagement';
+import { withDbMetrics } from '@/lib/db-metrics';
+
+/**
+ * GET /api/affiliate/[id]
+ * Count an outbound click and redirect to the merchant
+ */
+async function redirectToMerchant(
+  request: NextRequest,
+  { params }: { params: { id: string } }
+) {
+  try {
+    const link = await prisma.affiliateLink.findUnique({
+      where: { id: params.id },
+      select: { productId: true, merchant: true, url: true, isActive: true },
+    });
+
+    if (!link || !link.isActive) {
+      return NextResponse.json({ error: 'Link not found' }, { status: 404 });
+    }
+
+    // In-memory only - flushed to product_engagement in batches
+    recordAffiliateClick(link.productId, link.merchant);
+
+    const response = NextResponse.redirect(buildAffiliateUrl(link.url, link.merchant), 302);
+    response.headers.set('Cache-Control', 'no-store');
+    response.headers.set('X-Robots-Tag', 'noindex, nofollow');
+    return response;
+  } catch (error) {
+    console.error('Affiliate redirect error:', error);
+    return NextResponse.json({ error: 'Failed to resolve link' }, { status: 500 });
+  }
+}
+
+export const GET = withDbMetrics('/api/affiliate/[id]', redirectToMerchant);
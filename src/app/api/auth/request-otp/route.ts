@@ -2,12 +2,17 @@ import { NextRequest, NextResponse } from 'next/server';
 import bcrypt from 'bcryptjs';
 import { prisma } from '@/lib/prisma';
 import { createAndSendOTP } from '@/lib/otp';
+import { enforceRateLimits, getClientIp } from '@/lib/rate-limit';
 
 /**
  * Step 1 of login: Verify password and send OTP
  */
 export async function POST(request: NextRequest) {
   try {
+    // Throttle per IP before touching the body or running bcrypt
+    const ipLimited = await enforceRateLimits([['otp-ip', getClientIp(request)]]);
+    if (ipLimited) return ipLimited;
+
     const { email, password } = await request.json();
 
     if (!email || !password) {
@@ -51,6 +56,12 @@ export async function POST(request: NextRequest) {
     }
 
     console.log(`✅ Password verified for ${email}`);
+
+    // Limit OTP emails per account regardless of source IP. Only counted
+    // after the password check, so wrong guesses can't lock the owner out.
+    const emailLimited = await enforceRateLimits([['otp-email', email]]);
+    if (emailLimited) return emailLimited;
+
     console.log(`📧 Generating and sending OTP...`);
 
     // Password is correct - generate and send OTP
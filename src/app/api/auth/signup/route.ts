@@ -4,6 +4,7 @@ import bcrypt from 'bcryptjs';
 import { z } from 'zod';
 import crypto from 'crypto';
 import { sendVerificationEmail } from '@/lib/email';
+import { enforceRateLimits, getClientIp } from '@/lib/rate-limit';
 
 const signupSchema = z.object({
   name: z.string().min(2, 'Name must be at least 2 characters'),
@@ -16,6 +17,9 @@ const signupSchema = z.object({
 
 export async function POST(request: NextRequest) {
   try {
+    const ipLimited = await enforceRateLimits([['signup-ip', getClientIp(request)]]);
+    if (ipLimited) return ipLimited;
+
     const body = await request.json();
 
     // Validate input
@@ -29,6 +33,9 @@ export async function POST(request: NextRequest) {
 
     const { name, email, password } = validationResult.data;
 
+    const emailLimited = await enforceRateLimits([['signup-email', email]]);
+    if (emailLimited) return emailLimited;
+
     // Check if user already exists
     const existingUser = await prisma.user.findUnique({
       where: { email },
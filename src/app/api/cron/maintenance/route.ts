@@ -0,0 +1,46 @@
+import { NextRequest, NextResponse } from 'next/server';
+import { getServerSession } from 'next-auth';
+import { authOptions } from '@/lib/auth';
+import { runMaintenance } from '@/lib/maintenance';
+
+export const dynamic = 'force-dynamic';
+export const maxDuration = 300;
+
+/**
+ * Vercel Cron sends `Authorization: Bearer $CRON_SECRET`; admins can also
+ * trigger a run from a logged-in session
+ */
+async function isAuthorized(request: NextRequest): Promise<boolean> {
+  const secret = process.env.CRON_SECRET;
+  if (secret && request.headers.get('authorization') === `Bearer ${secret}`) {
+    return true;
+  }
+  const session = await getServerSession(authOptions);
+  return session?.user?.role === 'ADMIN';
+}
+
+/**
+ * GET /api/cron/maintenance
+ * Run due maintenance jobs. ?job=a,b limits the jobs, ?force=true ignores schedules.
+ */
+export async function GET(request: NextRequest) {
+  if (!(await isAuthorized(request))) {
+    return NextResponse.json({ error: 'Unauthorized' }, { status: 401 });
+  }
+
+  try {
+    const { searchParams } = new URL(request.url);
+    const jobs = searchParams.get('job')?.split(',').filter(Boolean);
+    const force = searchParams.get('force') === 'true';
+
+    const report = await runMaintenance({ jobs, force });
+
+    return NextResponse.json(report, { status: report.locked ? 200 : 409 });
+  } catch (error: any) {
+    console.error('Maintenance run error:', error);
+    return NextResponse.json(
+      { error: 'Maintenance run failed', details: error.message },
+      { status: 500 }
+    );
+  }
+}
@@ -0,0 +1,44 @@
+import { NextResponse } from 'next/server';
+import { prisma } from '@/lib/prisma';
+import { probeDatabase } from '@/lib/db-health';
+import { getPoolStats } from '@/lib/db-pool';
+import { ocrQueue } from '@/lib/ocr-queue';
+import { getImageCacheStats } from '@/lib/image-derivatives';
+
+export const dynamic = 'force-dynamic';
+
+/**
+ * GET /api/health
+ * Database latency, connection pool saturation, OCR queue depth and image cache size
+ */
+export async function GET() {
+  const database = await probeDatabase();
+  const healthy = database.status === 'up';
+
+  const [pool, processingScans] = await Promise.all([
+    getPoolStats(),
+    healthy
+      ? prisma.labelScan.count({ where: { status: 'PROCESSING' } }).catch(() => null)
+      : null,
+  ]);
+
+  return NextResponse.json(
+    {
+      status: healthy ? 'ok' : 'degraded',
+      timestamp: new Date().toISOString(),
+      uptimeSeconds: Math.round(process.uptime()),
+      database,
+      pool,
+      ocrQueue: {
+        active: ocrQueue.activeCount,
+        waiting: ocrQueue.pendingCount,
+        processingScans,
+      },
+      imageCache: getImageCacheStats(),
+    },
+    {
+      status: healthy ? 200 : 503,
+      headers: { 'Cache-Control': 'no-store' },
+    }
+  );
+}
@@ -1,14 +1,23 @@
 import { NextRequest, NextResponse } from 'next/server';
 import { prisma } from '@/lib/prisma';
 import { extractTextFromImage, parseLabelText } from '@/lib/ocr';
-import { analyzeLabelData } from '@/lib/label-analysis';
+import { analyzeLabelData, labelIngredientTerms } from '@/lib/label-analysis';
 import { writeFile } from 'fs/promises';
 import { join } from 'path';
+import { LABEL_UPLOAD_DIR, labelUploadUrl } from '@/lib/uploads';
 import { randomUUID } from 'crypto';
 import { Prisma } from '@prisma/client';
+import { runWithQueryMetrics } from '@/lib/db-metrics';
+import { ocrQueue } from '@/lib/ocr-queue';
+import { enforceRateLimits, getClientIp } from '@/lib/rate-limit';
+import { getImageInfo, warmImageDerivatives } from '@/lib/image-derivatives';
 
 export async function POST(request: NextRequest) {
   try {
+    // OCR is expensive; reject before reading the upload
+    const limited = await enforceRateLimits([['label-scan-ip', getClientIp(request)]]);
+    if (limited) return limited;
+
     const formData = await request.formData();
     const file = formData.get('image') as File;
 
@@ -35,7 +44,7 @@ export async function POST(request: NextRequest) {
 
     // Save file temporarily
     const fileName = `${randomUUID()}-${file.name.replace(/[^a-zA-Z0-9.-]/g, '_')}`;
-    const uploadDir = join(process.cwd(), 'public', 'uploads', 'labels');
+    const uploadDir = LABEL_UPLOAD_DIR;
     const filePath = join(uploadDir, fileName);
 
     console.log('💾 Saving to:', filePath);
@@ -47,22 +56,32 @@ export async function POST(request: NextRequest) {
     await writeFile(filePath, buffer);
     console.log('✅ File saved successfully');
 
-    const imageUrl = `/uploads/labels/${fileName}`;
+    const imageUrl = labelUploadUrl(fileName);
+    // Stored so the admin list can build thumbnail URLs without reading the file
+    const imageInfo = await getImageInfo(imageUrl).catch(() => null);
+    // Admin thumbnails render at 96px (192px on 2x screens)
+    warmImageDerivatives(imageUrl, [160, 320]);
 
     // Create initial scan record
     const scan = await prisma.labelScan.create({
       data: {
         imageUrl,
+        imageHash: imageInfo?.hash,
+        imageWidth: imageInfo?.width,
         status: 'PROCESSING',
       },
     });
 
     console.log('🔄 Created scan record:', scan.id);
 
-    // Perform OCR in background (we'll return scan ID immediately)
-    processLabelScan(scan.id, filePath).catch((error) => {
-      console.error('❌ Background processing failed:', error);
-    });
+    // Queue OCR in background (we'll return scan ID immediately)
+    ocrQueue
+      .run(() =>
+        runWithQueryMetrics('label-scan:process', () => processLabelScan(scan.id, filePath))
+      )
+      .catch((error) => {
+        console.error('❌ Background processing failed:', error);
+      });
 
     return NextResponse.json(
       {
@@ -125,6 +144,9 @@ async function processLabelScan(scanId: string, imagePath: string) {
         productName: parsed.productName,
         healthScore: analysis.overallScore,
         analysisResult: JSON.parse(JSON.stringify(analysis)),
+        scoredAt: new Date(),
+        // Reverse index used to re-score this scan when its ingredients change
+        ingredientTerms: { create: labelIngredientTerms(analysis) },
       },
     });
 
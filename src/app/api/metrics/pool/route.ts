@@ -0,0 +1,42 @@
+import { NextRequest, NextResponse } from 'next/server';
+import { getServerSession } from 'next-auth';
+import { authOptions } from '@/lib/auth';
+import { areMetricsExposed } from '@/lib/db-metrics';
+import { getPoolMetricsPrometheus, getPoolStats } from '@/lib/db-pool';
+
+/**
+ * GET /api/metrics/pool
+ * Connection pool gauges and wait time (admin, or metrics exposed).
+ * ?format=prometheus returns every Prisma metric for scraping.
+ */
+export async function GET(request: NextRequest) {
+  if (!areMetricsExposed()) {
+    const session = await getServerSession(authOptions);
+    if (!session) {
+      return NextResponse.json({ error: 'Unauthorized' }, { status: 401 });
+    }
+  }
+
+  try {
+    const { searchParams } = new URL(request.url);
+
+    if (searchParams.get('format') === 'prometheus') {
+      return new NextResponse(await getPoolMetricsPrometheus(), {
+        headers: {
+          'Content-Type': 'text/plain; version=0.0.4',
+          'Cache-Control': 'no-store',
+        },
+      });
+    }
+
+    return NextResponse.json(await getPoolStats(), {
+      headers: { 'Cache-Control': 'no-store' },
+    });
+  } catch (error: any) {
+    console.error('Pool metrics error:', error);
+    return NextResponse.json(
+      { error: 'Failed to read pool metrics', details: error.message },
+      { status: 500 }
+    );
+  }
+}
@@ -0,0 +1,21 @@
+import { NextRequest, NextResponse } from 'next/server';
+import { areMetricsExposed, getRecentQueryMetrics } from '@/lib/db-metrics';
+
+/**
+ * GET /api/metrics/queries
+ * Recent per-request query counts (dev/test only, used by the query budget tests)
+ */
+export async function GET(request: NextRequest) {
+  if (!areMetricsExposed()) {
+    return NextResponse.json({ error: 'Not found' }, { status: 404 });
+  }
+
+  const { searchParams } = new URL(request.url);
+  const route = searchParams.get('route') || undefined;
+  const limit = parseInt(searchParams.get('limit') || '20');
+
+  return NextResponse.json(
+    { records: getRecentQueryMetrics(route).slice(0, limit) },
+    { headers: { 'Cache-Control': 'no-store' } }
+  );
+}
@@ -0,0 +1,39 @@
+import { NextResponse } from 'next/server';
+import { getServerSession } from 'next-auth';
+import { authOptions } from '@/lib/auth';
+import { areMetricsExposed } from '@/lib/db-metrics';
+import { getRateLimitCounters, resetRateLimits } from '@/lib/rate-limit';
+
+export const dynamic = 'force-dynamic';
+
+async function isAuthorized(): Promise<boolean> {
+  return areMetricsExposed() || Boolean(await getServerSession(authOptions));
+}
+
+/**
+ * GET /api/metrics/rate-limits
+ * Effective limits and allowed/blocked counters for this instance
+ * (admin, or metrics exposed)
+ */
+export async function GET() {
+  if (!(await isAuthorized())) {
+    return NextResponse.json({ error: 'Unauthorized' }, { status: 401 });
+  }
+
+  return NextResponse.json(getRateLimitCounters(), {
+    headers: { 'Cache-Control': 'no-store' },
+  });
+}
+
+/**
+ * DELETE /api/metrics/rate-limits
+ * Refill every bucket, e.g. between load tests (admin, or metrics exposed)
+ */
+export async function DELETE() {
+  if (!(await isAuthorized())) {
+    return NextResponse.json({ error: 'Unauthorized' }, { status: 401 });
+  }
+
+  await resetRateLimits();
+  return NextResponse.json({ success: true });
+}
@@ -0,0 +1,85 @@
+import { NextRequest, NextResponse } from 'next/server';
+import { promisify } from 'util';
+import { brotliCompress, constants, gzip } from 'zlib';
+import {
+  decodeSyncCursor,
+  getCatalogChanges,
+  isEmptyChanges,
+  syncEtag,
+} from '@/lib/catalog-sync';
+
+export const dynamic = 'force-dynamic';
+
+const brotli = promisify(brotliCompress);
+const gzipAsync = promisify(gzip);
+
+/**
+ * Compress with the best encoding the client accepts (React Native's
+ * networking decodes gzip transparently)
+ */
+async function encodeBody(
+  request: NextRequest,
+  json: string
+): Promise<{ body: Buffer; encoding?: string }> {
+  const accepted = request.headers.get('accept-encoding') ?? '';
+  const raw = Buffer.from(json);
+  if (raw.length < 1024) return { body: raw };
+
+  if (/\bbr\b/.test(accepted)) {
+    const body = await brotli(raw, {
+      params: {
+        [constants.BROTLI_PARAM_QUALITY]: 5,
+        [constants.BROTLI_PARAM_SIZE_HINT]: raw.length,
+      },
+    });
+    return { body, encoding: 'br' };
+  }
+  if (/\bgzip\b/.test(accepted)) {
+    return { body: await gzipAsync(raw, { level: 6 }), encoding: 'gzip' };
+  }
+  return { body: raw };
+}
+
+/**
+ * GET /api/sync/catalog?cursor=...
+ * Brands, categories, products and published articles changed since the
+ * cursor, plus deleted ids. Omit the cursor for a full sync; follow `cursor`
+ * while `hasMore` is true. Send the last ETag as If-None-Match to get a 304
+ * when nothing changed.
+ */
+export async function GET(request: NextRequest) {
+  const cursorParam = request.nextUrl.searchParams.get('cursor');
+  // A malformed or outdated cursor falls back to a full sync (reset: true)
+  const cursor = cursorParam ? decodeSyncCursor(cursorParam) : null;
+
+  try {
+    const changes = await getCatalogChanges(cursor);
+    const etag = syncEtag(changes.cursor);
+    const headers = {
+      ETag: etag,
+      'Cache-Control': 'private, no-cache',
+      Vary: 'Accept-Encoding',
+    };
+
+    const ifNoneMatch = request.headers.get('if-none-match')?.split(',') ?? [];
+    if (ifNoneMatch.some((tag) => tag.trim() === etag) && isEmptyChanges(changes)) {
+      return new NextResponse(null, { status: 304, headers });
+    }
+
+    // Nulls are left out; every field the app reads is optional
+    const json = JSON.stringify(changes, (_key, value) => (value === null ? undefined : value));
+    const { body, encoding } = await encodeBody(request, json);
+
+    return new NextResponse(body, {
+      headers: {
+        ...headers,
+        'Content-Type': 'application/json',
+        'Content-Length': String(body.length),
+        ...(encoding && { 'Content-Encoding': encoding }),
+      },
+    });
+  } catch (error) {
+    console.error('Catalog sync error:', error);
+    return NextResponse.json({ error: 'Failed to sync catalog' }, { status: 500 });
+  }
+}
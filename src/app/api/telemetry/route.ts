@@ -1,21 +1,23 @@
 import { NextRequest, NextResponse } from 'next/server';
 import { trackEvent } from '@/lib/telemetry';
 import { TelemetryEventType } from '@prisma/client';
+import { withDbMetrics } from '@/lib/db-metrics';
+import { enforceRateLimits, getClientIp } from '@/lib/rate-limit';
 
 /**
  * POST /api/telemetry
  * Track telemetry events from client-side
  */
-export async function POST(request: NextRequest) {
+async function trackTelemetry(request: NextRequest) {
   try {
-    const body = await request.json();
-
     // Extract request metadata
     const userAgent = request.headers.get('user-agent') || undefined;
-    const ipAddress =
-      request.headers.get('x-forwarded-for')?.split(',')[0] ||
-      request.headers.get('x-real-ip') ||
-      undefined;
+    const ipAddress = getClientIp(request);
+
+    const ipLimited = await enforceRateLimits([['telemetry-ip', ipAddress]]);
+    if (ipLimited) return ipLimited;
+
+    const body = await request.json();
 
     // Validate event type
     const validEventTypes: TelemetryEventType[] = [
@@ -101,3 +103,5 @@ export async function GET(request: NextRequest) {
     );
   }
 }
+
+export const POST = withDbMetrics('/api/telemetry', trackTelemetry);
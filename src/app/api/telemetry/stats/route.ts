@@ -3,12 +3,13 @@ import { getServerSession } from 'next-auth';
 import { authOptions } from '@/lib/auth';
 import { getTelemetryStats } from '@/lib/telemetry';
 import { TelemetryEventType } from '@prisma/client';
+import { withDbMetrics } from '@/lib/db-metrics';
 
 /**
  * GET /api/telemetry/stats
  * Get telemetry statistics (admin only)
  */
-export async function GET(request: NextRequest) {
+async function getStats(request: NextRequest) {
   try {
     // Check authentication
     const session = await getServerSession(authOptions);
@@ -38,3 +39,5 @@ export async function GET(request: NextRequest) {
     );
   }
 }
+
+export const GET = withDbMetrics('/api/telemetry/stats', getStats);
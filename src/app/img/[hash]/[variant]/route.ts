@@ -0,0 +1,49 @@
+import { NextRequest, NextResponse } from 'next/server';
+import { getDerivative } from '@/lib/image-derivatives';
+
+export const dynamic = 'force-dynamic';
+
+/**
+ * GET /img/{hash}/{width}.{avif|webp}?src=/images/...
+ * Resized derivative of a public image. The URL embeds the source's content
+ * hash, so responses are immutable; a stale hash gets a short cache lifetime.
+ * Lives outside /api so the no-store header in vercel.json does not apply.
+ */
+export async function GET(
+  request: NextRequest,
+  { params }: { params: { hash: string; variant: string } }
+) {
+  const src = request.nextUrl.searchParams.get('src');
+  const match = params.variant.match(/^(\d+)\.(avif|webp)$/);
+  if (!src || !match || !/^[0-9a-f]{16}$/.test(params.hash)) {
+    return NextResponse.json({ error: 'Invalid image request' }, { status: 400 });
+  }
+
+  try {
+    const derivative = await getDerivative(src, params.hash, parseInt(match[1]), match[2]);
+    if (!derivative) {
+      return NextResponse.json({ error: 'Image not found' }, { status: 404 });
+    }
+
+    // Worker pool is saturated: serve the original rather than queue unboundedly
+    if (derivative === 'busy') {
+      return NextResponse.redirect(new URL(src, request.url), {
+        status: 307,
+        headers: { 'Cache-Control': 'no-store' },
+      });
+    }
+
+    return new NextResponse(derivative.body, {
+      headers: {
+        'Content-Type': derivative.contentType,
+        'Content-Length': String(derivative.body.length),
+        'Cache-Control': derivative.current
+          ? 'public, max-age=31536000, immutable'
+          : 'public, max-age=60',
+      },
+    });
+  } catch (error) {
+    console.error('Image derivative error:', error);
+    return NextResponse.json({ error: 'Failed to process image' }, { status: 500 });
+  }
+}
@@ -6,62 +6,67 @@ import { prisma } from '@/lib/prisma';
 import { formatDate } from '@/lib/utils';
 import { generateOrganizationSchema, generateWebsiteSchema } from '@/lib/seo';
 import { ProductCard } from '@/components/product-card';
-import { mockProducts, mockArticles } from '@/lib/mock-data';
+import { withDatabase } from '@/lib/db-health';
+import { withImageVariants } from '@/lib/image-derivatives';
 import Image from 'next/image';
 
 async function getFeaturedProducts() {
-  try {
-    return await prisma.product.findMany({
-      where: {
-        isMeetsStandard: true,
-      },
-      include: {
-        brand: true,
-        category: true,
-        badges: {
-          include: {
-            badge: true,
+  // Return mock data if database is not available
+  return withDatabase(
+    () =>
+      prisma.product.findMany({
+        where: {
+          isMeetsStandard: true,
+        },
+        include: {
+          brand: true,
+          category: true,
+          badges: {
+            include: {
+              badge: true,
+            },
           },
+          affiliateLinks: true,
+        },
+        take: 6,
+        orderBy: {
+          healthScore: 'desc',
         },
-        affiliateLinks: true,
-      },
-      take: 6,
-      orderBy: {
-        healthScore: 'desc',
-      },
-    });
-  } catch (error) {
-    // Return mock data if database is not available
-    console.log('Database not available, using mock data');
-    return null;
-  }
+      }),
+    null
+  );
 }
 
 async function getRecentArticles() {
-  try {
-    return await prisma.article.findMany({
-      where: {
-        status: 'PUBLISHED',
-      },
-      orderBy: {
-        publishedAt: 'desc',
-      },
-      take: 3,
-    });
-  } catch (error) {
-    // Return mock data if database is not available
-    console.log('Database not available, using mock data');
-    return null;
-  }
+  // Return mock data if database is not available
+  return withDatabase(
+    () =>
+      prisma.article.findMany({
+        where: {
+          status: 'PUBLISHED',
+        },
+        orderBy: {
+          publishedAt: 'desc',
+        },
+        take: 3,
+      }),
+    null
+  );
 }
 
 export default async function HomePage() {
   const [dbProducts, dbArticles] = await Promise.all([getFeaturedProducts(), getRecentArticles()]);
 
-  // Use database data if available, otherwise use mock data
-  const products = dbProducts && dbProducts.length > 0 ? dbProducts : mockProducts;
-  const articles = dbArticles && dbArticles.length > 0 ? dbArticles : mockArticles;
+  // Use database data if available, otherwise use mock data (loaded only when needed)
   const usingMockData = !dbProducts || dbProducts.length === 0;
+  const mock =
+    usingMockData || !dbArticles || dbArticles.length === 0
+      ? await import('@/lib/mock-data')
+      : null;
+  const products = await withImageVariants(
+    dbProducts && dbProducts.length > 0 ? dbProducts : mock!.mockProducts
+  );
+  const articles = dbArticles && dbArticles.length > 0 ? dbArticles : mock!.mockArticles;
 
   return (
     <>
@@ -128,8 +133,8 @@ export default async function HomePage() {
           </div>
 
           <div className="grid grid-cols-1 gap-6 sm:grid-cols-2 lg:grid-cols-3">
-            {products.map((product) => (
-              <ProductCard key={product.id} product={product} />
+            {products.map((product, index) => (
+              <ProductCard key={product.id} product={product} priority={index === 0} />
             ))}
           </div>
 
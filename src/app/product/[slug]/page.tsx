@@ -1,17 +1,33 @@
+import { cache } from 'react';
 import { notFound } from 'next/navigation';
 import Link from 'next/link';
 import { prisma } from '@/lib/prisma';
 import { Badge } from '@/components/ui/badge';
 import { Card, CardContent, CardHeader, CardTitle } from '@/components/ui/card';
-import { buildAffiliateUrl } from '@/lib/affiliate';
+import { recordProductView } from '@/lib/engagement';
+import { runWithQueryMetrics } from '@/lib/db-metrics';
 import { generateMetadata as genMeta, generateProductSchema } from '@/lib/seo';
 import { AffiliateButton } from '@/components/product/affiliate-button';
 
+// Shared by generateMetadata and the page so each request loads the product once
+const getProduct = cache((slug: string) =>
+  runWithQueryMetrics('/product/[slug]', () =>
+    prisma.product.findUnique({
+      where: { slug },
+      include: {
+        brand: true,
+        category: true,
+        badges: {
+          include: { badge: true },
+        },
+        affiliateLinks: true,
+      },
+    })
+  )
+);
+
 export async function generateMetadata({ params }: { params: { slug: string } }) {
-  const product = await prisma.product.findUnique({
-    where: { slug: params.slug },
-    include: { brand: true },
-  });
+  const product = await getProduct(params.slug);
 
   if (!product) return {};
 
@@ -23,22 +39,14 @@ export async function generateMetadata({ params }: { params: { slug: string } })
 }
 
 export default async function ProductPage({ params }: { params: { slug: string } }) {
-  const product = await prisma.product.findUnique({
-    where: { slug: params.slug },
-    include: {
-      brand: true,
-      category: true,
-      badges: {
-        include: { badge: true },
-      },
-      affiliateLinks: true,
-    },
-  });
+  const product = await getProduct(params.slug);
 
   if (!product) {
     notFound();
   }
 
+  recordProductView(product.id);
+
   const productSchema = generateProductSchema({
     name: product.title,
     description: product.shortSummary || product.description || '',
@@ -85,17 +93,14 @@ export default async function ProductPage({ params }: { params: { slug: string }
             <div className="mt-8 space-y-3">
               {product.affiliateLinks
                 .filter((link) => link.isActive)
-                .map((link) => {
-                  const affiliateUrl = buildAffiliateUrl(link.url, link.merchant);
-                  return (
-                    <AffiliateButton
-                      key={link.id}
-                      href={affiliateUrl}
-                      merchant={link.merchant}
-                      productId={product.id}
-                    />
-                  );
-                })}
+                .map((link) => (
+                  <AffiliateButton
+                    key={link.id}
+                    href={`/api/affiliate/${link.id}`}
+                    merchant={link.merchant}
+                    productId={product.id}
+                  />
+                ))}
             </div>
 
             <p className="mt-4 text-xs text-neutral-500">
@@ -6,7 +6,9 @@ import { Button } from '@/components/ui/button';
 import { generateMetadata as genMeta } from '@/lib/seo';
 import { cn } from '@/lib/utils';
 import { ProductCard } from '@/components/product-card';
-import { mockProducts, mockCategories } from '@/lib/mock-data';
+import { runWithQueryMetrics } from '@/lib/db-metrics';
+import { withDatabase } from '@/lib/db-health';
+import { withImageVariants } from '@/lib/image-derivatives';
 
 export const metadata = genMeta({
   title: 'Shop Healthy Products',
@@ -15,59 +17,55 @@ export const metadata = genMeta({
 });
 
 async function getProducts(searchParams: any) {
-  try {
-    const where: any = {};
-
-    if (searchParams.palmOilFree === 'true') {
-      where.isPalmOilFree = true;
-    }
-    if (searchParams.lowSugar === 'true') {
-      where.isLowSugar = true;
-    }
-    if (searchParams.wholeGrain === 'true') {
-      where.isWholeGrain = true;
-    }
-    if (searchParams.category) {
-      where.category = { slug: searchParams.category };
-    }
-
-    const products = await prisma.product.findMany({
-      where,
-      include: {
-        brand: true,
-        category: true,
-        badges: {
-          include: { badge: true },
-        },
-        affiliateLinks: true,
-      },
-      orderBy: {
-        healthScore: 'desc',
-      },
-    });
-
-    return products;
-  } catch (error) {
-    console.log('Database not available, using mock data');
-    return null;
+  const where: any = {};
+
+  if (searchParams.palmOilFree === 'true') {
+    where.isPalmOilFree = true;
+  }
+  if (searchParams.lowSugar === 'true') {
+    where.isLowSugar = true;
+  }
+  if (searchParams.wholeGrain === 'true') {
+    where.isWholeGrain = true;
   }
+  if (searchParams.category) {
+    where.category = { slug: searchParams.category };
+  }
+
+  // Returns null (mock data) immediately while the database circuit is open
+  return withDatabase(
+    () =>
+      prisma.product.findMany({
+        where,
+        include: {
+          brand: true,
+          category: true,
+          badges: {
+            include: { badge: true },
+          },
+          affiliateLinks: true,
+        },
+        orderBy: {
+          healthScore: 'desc',
+        },
+      }),
+    null
+  );
 }
 
 async function getCategories() {
-  try {
-    const categories = await prisma.category.findMany({
-      include: {
-        _count: {
-          select: { products: true },
+  return withDatabase(
+    () =>
+      prisma.category.findMany({
+        include: {
+          _count: {
+            select: { products: true },
+          },
         },
-      },
-      orderBy: { name: 'asc' },
-    });
-    return categories;
-  } catch (error) {
-    console.log('Database not available, using mock data');
-    return null;
-  }
+        orderBy: { name: 'asc' },
+      }),
+    null
+  );
 }
 
 export default async function ShopPage({
@@ -75,18 +73,21 @@ export default async function ShopPage({
 }: {
   searchParams: { [key: string]: string | undefined };
 }) {
-  const [dbProducts, dbCategories] = await Promise.all([
-    getProducts(searchParams),
-    getCategories(),
-  ]);
-
-  // Use database data if available, otherwise use mock data
-  let products = dbProducts && dbProducts.length > 0 ? dbProducts : mockProducts;
-  const categories = dbCategories && dbCategories.length > 0 ? dbCategories : mockCategories.map(cat => ({
+  const [dbProducts, dbCategories] = await runWithQueryMetrics('/shop', () =>
+    Promise.all([getProducts(searchParams), getCategories()])
+  );
+
+  // Use database data if available, otherwise use mock data (loaded only when needed)
+  const usingMockData = !dbProducts || dbProducts.length === 0;
+  const mock =
+    usingMockData || !dbCategories || dbCategories.length === 0
+      ? await import('@/lib/mock-data')
+      : null;
+  let products = dbProducts && dbProducts.length > 0 ? dbProducts : mock!.mockProducts;
+  const categories = dbCategories && dbCategories.length > 0 ? dbCategories : mock!.mockCategories.map(cat => ({
     ...cat,
-    _count: { products: mockProducts.filter(p => p.category.name === cat.name).length }
+    _count: { products: mock!.mockProducts.filter(p => p.category.name === cat.name).length }
   }));
-  const usingMockData = !dbProducts || dbProducts.length === 0;
 
   // Apply filters to mock data
   if (usingMockData && searchParams) {
@@ -99,6 +100,7 @@ export default async function ShopPage({
     }) as typeof products;
   }
 
+  const productCards = await withImageVariants<any>(products);
   const activeCategory = searchParams.category;
 
   return (
@@ -208,8 +210,8 @@ export default async function ShopPage({
           </div>
 
           <div className="grid grid-cols-1 gap-6 sm:grid-cols-2 lg:grid-cols-3">
-            {products.map((product: any) => (
-              <ProductCard key={product.id} product={product} />
+            {productCards.map((product, index) => (
+              <ProductCard key={product.id} product={product} priority={index === 0} />
             ))}
           </div>
 
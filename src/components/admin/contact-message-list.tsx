@@ -24,15 +24,9 @@ interface ContactMessageListProps {
 }
 
 export function ContactMessageList({ messages }: ContactMessageListProps) {
-  const [filter, setFilter] = useState<ContactMessageStatus | 'ALL'>('ALL');
   const [selectedMessage, setSelectedMessage] = useState<ContactMessage | null>(null);
   const [isUpdating, setIsUpdating] = useState(false);
 
-  const filteredMessages = messages.filter((message) => {
-    if (filter === 'ALL') return true;
-    return message.status === filter;
-  });
-
   const handleStatusChange = async (messageId: string, newStatus: ContactMessageStatus) => {
     setIsUpdating(true);
     try {
@@ -84,47 +78,8 @@ export function ContactMessageList({ messages }: ContactMessageListProps) {
 
   return (
     <div className="space-y-4">
-      {/* Filter Tabs */}
-      <div className="flex gap-2 flex-wrap">
-        <Button
-          variant={filter === 'ALL' ? 'default' : 'outline'}
-          size="sm"
-          onClick={() => setFilter('ALL')}
-        >
-          All ({messages.length})
-        </Button>
-        <Button
-          variant={filter === 'NEW' ? 'default' : 'outline'}
-          size="sm"
-          onClick={() => setFilter('NEW')}
-        >
-          New ({messages.filter((m) => m.status === 'NEW').length})
-        </Button>
-        <Button
-          variant={filter === 'READ' ? 'default' : 'outline'}
-          size="sm"
-          onClick={() => setFilter('READ')}
-        >
-          Read ({messages.filter((m) => m.status === 'READ').length})
-        </Button>
-        <Button
-          variant={filter === 'REPLIED' ? 'default' : 'outline'}
-          size="sm"
-          onClick={() => setFilter('REPLIED')}
-        >
-          Replied ({messages.filter((m) => m.status === 'REPLIED').length})
-        </Button>
-        <Button
-          variant={filter === 'ARCHIVED' ? 'default' : 'outline'}
-          size="sm"
-          onClick={() => setFilter('ARCHIVED')}
-        >
-          Archived ({messages.filter((m) => m.status === 'ARCHIVED').length})
-        </Button>
-      </div>
-
       {/* Messages List */}
-      {filteredMessages.length === 0 ? (
+      {messages.length === 0 ? (
         <Card>
           <CardContent className="py-12 text-center text-neutral-500">
             No messages found
@@ -132,7 +87,7 @@ export function ContactMessageList({ messages }: ContactMessageListProps) {
         </Card>
       ) : (
         <div className="space-y-3">
-          {filteredMessages.map((message) => (
+          {messages.map((message) => (
             <Card
               key={message.id}
               className={`hover:shadow-md transition-shadow ${
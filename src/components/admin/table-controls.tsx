@@ -0,0 +1,124 @@
+import Link from 'next/link';
+import { Button } from '@/components/ui/button';
+import { ChevronLeft, ChevronRight, ArrowUp, ArrowDown } from 'lucide-react';
+import { TablePage, TableQuery, tableHref } from '@/lib/admin-table';
+
+interface TableSortLinksProps {
+  basePath: string;
+  query: TableQuery;
+  options: Array<{ sort: string; label: string }>;
+}
+
+/**
+ * Sort options as links; choosing the active one again reverses the direction
+ */
+export function TableSortLinks({ basePath, query, options }: TableSortLinksProps) {
+  return (
+    <div className="flex flex-wrap items-center gap-2 text-sm">
+      <span className="text-neutral-500">Sort by:</span>
+      {options.map((option) => {
+        const active = option.sort === query.sort;
+        const nextDirection = active && query.direction === 'desc' ? 'asc' : 'desc';
+        const Arrow = query.direction === 'desc' ? ArrowDown : ArrowUp;
+
+        return (
+          <Button key={option.sort} variant={active ? 'secondary' : 'ghost'} size="sm" asChild>
+            <Link
+              href={tableHref(basePath, query, {
+                sort: option.sort,
+                dir: nextDirection,
+                after: undefined,
+                before: undefined,
+              })}
+            >
+              {option.label}
+              {active && <Arrow className="ml-1 h-3 w-3" />}
+            </Link>
+          </Button>
+        );
+      })}
+    </div>
+  );
+}
+
+interface TableFilterLinksProps {
+  basePath: string;
+  query: TableQuery;
+  name: string;
+  options: Array<{ value: string; label: string; count?: string }>;
+  allLabel?: string;
+}
+
+/**
+ * Filter tabs for one query param, plus an "All" tab that clears it
+ */
+export function TableFilterLinks({
+  basePath,
+  query,
+  name,
+  options,
+  allLabel = 'All',
+}: TableFilterLinksProps) {
+  const active = query.filters[name];
+  const tabs = [{ value: undefined, label: allLabel, count: undefined }, ...options];
+
+  return (
+    <div className="flex flex-wrap gap-2">
+      {tabs.map((tab) => (
+        <Button
+          key={tab.value ?? 'all'}
+          variant={active === tab.value ? 'default' : 'outline'}
+          size="sm"
+          asChild
+        >
+          <Link
+            href={tableHref(basePath, query, {
+              [name]: tab.value,
+              after: undefined,
+              before: undefined,
+            })}
+          >
+            {tab.label}
+            {tab.count !== undefined && ` (${tab.count})`}
+          </Link>
+        </Button>
+      ))}
+    </div>
+  );
+}
+
+interface TablePaginationProps {
+  basePath: string;
+  query: TableQuery;
+  page: TablePage<unknown>;
+}
+
+/**
+ * Previous / next links driven by keyset cursors
+ */
+export function TablePagination({ basePath, query, page }: TablePaginationProps) {
+  if (!page.prevCursor && !page.nextCursor) return null;
+
+  return (
+    <div className="mt-6 flex items-center justify-between">
+      {page.prevCursor ? (
+        <Button variant="outline" size="sm" asChild>
+          <Link href={tableHref(basePath, query, { before: page.prevCursor, after: undefined })}>
+            <ChevronLeft className="mr-1 h-4 w-4" />
+            Previous
+          </Link>
+        </Button>
+      ) : (
+        <span />
+      )}
+      {page.nextCursor && (
+        <Button variant="outline" size="sm" asChild>
+          <Link href={tableHref(basePath, query, { after: page.nextCursor, before: undefined })}>
+            Next
+            <ChevronRight className="ml-1 h-4 w-4" />
+          </Link>
+        </Button>
+      )}
+    </div>
+  );
+}
@@ -5,6 +5,11 @@ import Image from 'next/image';
 import { Badge } from '@/components/ui/badge';
 import { Button } from '@/components/ui/button';
 import { Card, CardContent } from '@/components/ui/card';
+import { ResponsiveImage } from '@/components/responsive-image';
+import type { ImageVariants } from '@/lib/image-derivatives';
+
+// Cards are one column on mobile, two from sm, three (at most ~400px wide) from lg
+const CARD_IMAGE_SIZES = '(min-width: 1024px) 400px, (min-width: 640px) 50vw, 100vw';
 
 interface Product {
   id: string;
@@ -13,6 +18,7 @@ interface Product {
   brand?: { name: string };
   category?: { name: string };
   heroImage?: string | null;
+  heroImageVariants?: ImageVariants | null;
   shortSummary?: string | null;
   healthScore: number;
   isPalmOilFree: boolean;
@@ -24,9 +30,10 @@ interface Product {
 
 interface ProductCardProps {
   product: Product;
+  priority?: boolean;
 }
 
-export function ProductCard({ product }: ProductCardProps) {
+export function ProductCard({ product, priority = false }: ProductCardProps) {
   const getHealthScoreColor = (score: number) => {
     if (score >= 80) return 'bg-green-500';
     if (score >= 60) return 'bg-amber-500';
@@ -44,11 +51,22 @@ export function ProductCard({ product }: ProductCardProps) {
       <Link href={`/product/${product.slug}`}>
         {/* Product Image */}
         <div className="relative aspect-square bg-gradient-to-br from-neutral-50 to-neutral-100">
-          {product.heroImage ? (
+          {product.heroImage && product.heroImageVariants ? (
+            <ResponsiveImage
+              src={product.heroImage}
+              alt={product.title}
+              variants={product.heroImageVariants}
+              sizes={CARD_IMAGE_SIZES}
+              priority={priority}
+              className="object-cover group-hover:scale-105 transition-transform duration-300"
+            />
+          ) : product.heroImage ? (
             <Image
               src={product.heroImage}
               alt={product.title}
               fill
+              sizes={CARD_IMAGE_SIZES}
+              priority={priority}
               className="object-cover group-hover:scale-105 transition-transform duration-300"
             />
           ) : (
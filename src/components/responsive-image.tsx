@@ -0,0 +1,41 @@
+import type { ImageVariants } from '@/lib/image-derivatives';
+import { cn } from '@/lib/utils';
+
+interface ResponsiveImageProps {
+  src: string;
+  alt: string;
+  variants: ImageVariants;
+  sizes: string; // rendered width per breakpoint, so the browser picks the smallest file
+  className?: string;
+  priority?: boolean; // above-the-fold (LCP) images load eagerly
+}
+
+/**
+ * <picture> over pre-generated AVIF/WebP derivatives (see getImageVariants),
+ * falling back to the original image. Fills its positioned parent, like
+ * next/image with `fill`.
+ */
+export function ResponsiveImage({
+  src,
+  alt,
+  variants,
+  sizes,
+  className,
+  priority = false,
+}: ResponsiveImageProps) {
+  return (
+    <picture>
+      <source type="image/avif" srcSet={variants.avif} sizes={sizes} />
+      <source type="image/webp" srcSet={variants.webp} sizes={sizes} />
+      {/* eslint-disable-next-line @next/next/no-img-element */}
+      <img
+        src={src}
+        alt={alt}
+        sizes={sizes}
+        loading={priority ? 'eager' : 'lazy'}
+        decoding="async"
+        className={cn('absolute inset-0 h-full w-full', className)}
+      />
+    </picture>
+  );
+}
@@ -0,0 +1,139 @@
+/**
+ * @jest-environment node
+ */
+const mockQueryRaw = jest.fn();
+jest.mock('@/lib/prisma', () => ({
+  prisma: { $queryRaw: (...args: unknown[]) => mockQueryRaw(...args) },
+}));
+
+import {
+  TableDefinition,
+  TableFindArgs,
+  fetchTablePage,
+  formatTotal,
+  parseTableQuery,
+  tableHref,
+} from '../admin-table';
+
+const TABLE: TableDefinition = {
+  table: 'label_scans',
+  sorts: { createdAt: 'date', title: 'string' },
+  defaultSort: 'createdAt',
+  defaultDirection: 'desc',
+  filters: { status: { field: 'status', values: { FAILED: 'FAILED' } } },
+};
+
+const rows = Array.from({ length: 60 }, (_, i) => ({
+  id: `scan-${String(i).padStart(2, '0')}`,
+  createdAt: new Date(Date.UTC(2026, 0, 1, 0, 60 - i)),
+}));
+
+describe('Admin Table', () => {
+  beforeEach(() => {
+    mockQueryRaw.mockReset();
+    mockQueryRaw.mockResolvedValue([{ estimate: 60 }]);
+  });
+
+  describe('parseTableQuery', () => {
+    it('should fall back to defaults for unknown sorts and filter values', () => {
+      const query = parseTableQuery(TABLE, { sort: 'passwordHash', status: 'DELETED' });
+      expect(query).toMatchObject({ sort: 'createdAt', direction: 'desc', filters: {} });
+    });
+
+    it('should default non-default sorts to ascending', () => {
+      const query = parseTableQuery(TABLE, { sort: 'title', status: 'FAILED' });
+      expect(query).toMatchObject({
+        sort: 'title',
+        direction: 'asc',
+        filters: { status: 'FAILED' },
+      });
+    });
+  });
+
+  describe('fetchTablePage', () => {
+    it('should page forward with a keyset condition on (sort, id)', async () => {
+      const findMany = jest.fn(async (args: TableFindArgs) => rows.slice(0, args.take));
+      const count = jest.fn(async () => 60);
+      const query = parseTableQuery(TABLE, {});
+
+      const first = await fetchTablePage(TABLE, query, findMany, count);
+      expect(first.rows).toHaveLength(query.pageSize);
+      expect(first.prevCursor).toBeNull();
+      expect(first.nextCursor).not.toBeNull();
+      expect(first.total).toEqual({ count: 60, kind: 'exact' });
+      expect(findMany.mock.calls[0][0].orderBy).toEqual([{ createdAt: 'desc' }, { id: 'desc' }]);
+
+      await fetchTablePage(TABLE, { ...query, after: first.nextCursor! }, findMany, count);
+      const last = first.rows[first.rows.length - 1];
+      expect(findMany.mock.calls[1][0].where).toEqual({
+        AND: [
+          { createdAt: { lte: last.createdAt } },
+          {
+            OR: [
+              { createdAt: { lt: last.createdAt } },
+              { createdAt: last.createdAt, id: { lt: last.id } },
+            ],
+          },
+        ],
+      });
+    });
+
+    it('should read backwards in reverse order and restore display order', async () => {
+      const findMany = jest.fn(async (args: TableFindArgs) =>
+        rows.slice(25, 50).reverse().slice(0, args.take)
+      );
+      const query = parseTableQuery(TABLE, {});
+      const before = Buffer.from(JSON.stringify([rows[50].createdAt, rows[50].id])).toString(
+        'base64url'
+      );
+
+      const page = await fetchTablePage(TABLE, { ...query, before }, findMany, async () => 60);
+      expect(findMany.mock.calls[0][0].orderBy).toEqual([{ createdAt: 'asc' }, { id: 'asc' }]);
+      expect(page.rows[0].id).toBe('scan-25');
+      expect(page.nextCursor).not.toBeNull();
+    });
+
+    it('should ignore malformed cursors', async () => {
+      const findMany = jest.fn(async () => []);
+      const query = { ...parseTableQuery(TABLE, {}), after: 'not-a-cursor' };
+
+      await fetchTablePage(TABLE, query, findMany, async () => 0);
+      expect(findMany.mock.calls[0][0].where).toEqual({});
+    });
+
+    it('should use the pg_class estimate for large unfiltered tables', async () => {
+      mockQueryRaw.mockResolvedValue([{ estimate: 2_400_000 }]);
+      const count = jest.fn(async () => 0);
+
+      const page = await fetchTablePage(TABLE, parseTableQuery(TABLE, {}), async () => [], count);
+      expect(page.total).toEqual({ count: 2_400_000, kind: 'estimate' });
+      expect(count).not.toHaveBeenCalled();
+    });
+
+    it('should cap filtered counts', async () => {
+      const count = jest.fn(async () => 10_001);
+      const query = parseTableQuery(TABLE, { status: 'FAILED' });
+
+      const page = await fetchTablePage(TABLE, query, async () => [], count);
+      expect(count).toHaveBeenCalledWith({ where: { status: 'FAILED' }, take: 10_001 });
+      expect(page.total).toEqual({ count: 10_000, kind: 'capped' });
+    });
+  });
+
+  describe('formatTotal', () => {
+    it('should mark estimates and capped counts', () => {
+      expect(formatTotal({ count: 1234, kind: 'exact' })).toBe('1,234');
+      expect(formatTotal({ count: 2_400_000, kind: 'estimate' })).toBe('≈2.4M');
+      expect(formatTotal({ count: 10_000, kind: 'capped' })).toBe('10,000+');
+    });
+  });
+
+  describe('tableHref', () => {
+    it('should keep sort and filters while replacing cursors', () => {
+      const query = { ...parseTableQuery(TABLE, { status: 'FAILED' }), after: 'abc' };
+      expect(tableHref('/admin/label-scans', query, { before: 'xyz', after: undefined })).toBe(
+        '/admin/label-scans?sort=createdAt&dir=desc&status=FAILED&before=xyz'
+      );
+    });
+  });
+});
@@ -0,0 +1,96 @@
+/**
+ * @jest-environment node
+ */
+jest.mock('@/lib/prisma', () => ({ prisma: {} }));
+jest.mock('@prisma/client', () => ({ Prisma: {} }));
+
+import { parseImportRow, readCsvRecords, readLines } from '../catalog-import';
+
+async function* chunked(text: string, size: number) {
+  for (let i = 0; i < text.length; i += size) {
+    yield Buffer.from(text.slice(i, i + size));
+  }
+}
+
+async function collect<T>(iterable: AsyncIterable<T>): Promise<T[]> {
+  const items: T[] = [];
+  for await (const item of iterable) items.push(item);
+  return items;
+}
+
+describe('Catalog Import', () => {
+  describe('readCsvRecords', () => {
+    it('should parse quoted fields across chunk boundaries', async () => {
+      const csv = 'slug,title\r\na,"Oats, rolled"\nb,"Say ""hi""\nsecond line"\nc,plain\n';
+      const records = await collect(readCsvRecords(chunked(csv, 3)));
+
+      expect(records).toEqual([
+        { line: 1, fields: ['slug', 'title'] },
+        { line: 2, fields: ['a', 'Oats, rolled'] },
+        { line: 3, fields: ['b', 'Say "hi"\nsecond line'] },
+        { line: 5, fields: ['c', 'plain'] },
+      ]);
+    });
+
+    it('should skip blank lines and keep a final record without newline', async () => {
+      const records = await collect(readCsvRecords(chunked('a,b\n\nc,d', 4)));
+      expect(records.map((r) => r.fields)).toEqual([
+        ['a', 'b'],
+        ['c', 'd'],
+      ]);
+    });
+  });
+
+  describe('readLines', () => {
+    it('should split lines and decode multi-byte characters split across chunks', async () => {
+      const bytes = Buffer.from('{"title":"Ragi – millet"}\n{"a":1}');
+      const chunks = (async function* () {
+        for (const byte of bytes) yield Uint8Array.of(byte);
+      })();
+
+      const lines = await collect(readLines(chunks));
+      expect(lines).toEqual([
+        { line: 1, text: '{"title":"Ragi – millet"}' },
+        { line: 2, text: '{"a":1}' },
+      ]);
+    });
+  });
+
+  describe('parseImportRow', () => {
+    const base = {
+      slug: 'rolled-oats',
+      title: 'Rolled Oats',
+      brand: 'yoga-bar',
+      category: 'snacks',
+    };
+
+    it('should coerce CSV strings', () => {
+      const { row } = parseImportRow({
+        ...base,
+        healthScore: '72',
+        isLowSugar: 'yes',
+        isPalmOilFree: 'false',
+        badges: 'LOW_SUGAR|WHOLE_GRAIN',
+        nutritionJson: '{"protein":"12g"}',
+      });
+
+      expect(row).toMatchObject({
+        healthScore: 72,
+        isLowSugar: true,
+        isPalmOilFree: false,
+        badges: ['LOW_SUGAR', 'WHOLE_GRAIN'],
+        nutritionJson: { protein: '12g' },
+      });
+    });
+
+    it('should report the failing field', () => {
+      expect(parseImportRow({ ...base, slug: 'Rolled Oats' }).error).toMatch(/^slug:/);
+      expect(parseImportRow({ ...base, healthScore: '140' }).error).toMatch(/^healthScore:/);
+      expect(parseImportRow({ ...base, title: undefined }).error).toMatch(/^title:/);
+      expect(
+        parseImportRow({ ...base, affiliateLinks: [{ merchant: 'EBAY', url: 'https://x.y' }] })
+          .error
+      ).toMatch(/^affiliateLinks\.0\.merchant:/);
+    });
+  });
+});
@@ -0,0 +1,139 @@
+/**
+ * @jest-environment node
+ */
+const mockFindMany = {
+  brand: jest.fn(),
+  category: jest.fn(),
+  product: jest.fn(),
+  article: jest.fn(),
+  syncTombstone: jest.fn(),
+};
+jest.mock('@/lib/prisma', () => ({
+  prisma: Object.fromEntries(
+    ['brand', 'category', 'product', 'article', 'syncTombstone'].map((model) => [
+      model,
+      { findMany: (...args: unknown[]) => (mockFindMany as any)[model](...args) },
+    ])
+  ),
+}));
+
+import {
+  decodeSyncCursor,
+  encodeSyncCursor,
+  getCatalogChanges,
+  isEmptyChanges,
+  syncEtag,
+  SyncCursor,
+} from '../catalog-sync';
+
+const recent = new Date(Date.now() - 60 * 60 * 1000).toISOString();
+const CURSOR: SyncCursor = {
+  brands: [recent, 'b1'],
+  categories: [recent, 'c1'],
+  products: [recent, 'p1'],
+  articles: [recent, 'a1'],
+  deleted: [recent, 't1'],
+  synced: recent,
+};
+
+describe('Catalog Sync', () => {
+  beforeEach(() => {
+    for (const findMany of Object.values(mockFindMany)) {
+      findMany.mockReset();
+      findMany.mockResolvedValue([]);
+    }
+  });
+
+  describe('cursors', () => {
+    it('should round-trip and reject malformed cursors', () => {
+      expect(decodeSyncCursor(encodeSyncCursor(CURSOR))).toEqual(CURSOR);
+      expect(decodeSyncCursor('not-a-cursor')).toBeNull();
+      expect(
+        decodeSyncCursor(encodeSyncCursor({ ...CURSOR, products: ['yesterday', 'p1'] }))
+      ).toBeNull();
+    });
+
+    it('should give a stable weak ETag per cursor', () => {
+      const cursor = encodeSyncCursor(CURSOR);
+      expect(syncEtag(cursor)).toMatch(/^W\/"[\w-]+"$/);
+      expect(syncEtag(cursor)).toBe(syncEtag(cursor));
+      const moved = encodeSyncCursor({ ...CURSOR, brands: [recent, 'b2'] });
+      expect(syncEtag(cursor)).not.toBe(syncEtag(moved));
+      const resynced = encodeSyncCursor({ ...CURSOR, synced: new Date().toISOString() });
+      expect(syncEtag(cursor)).toBe(syncEtag(resynced));
+    });
+
+    it('should treat the last tombstone as synced-through for older cursors', () => {
+      const old = new Date(Date.UTC(2020, 0, 1)).toISOString();
+      const legacy: Partial<SyncCursor> = { ...CURSOR, deleted: [old, 't1'] };
+      delete legacy.synced;
+      const cursor = encodeSyncCursor(legacy as SyncCursor);
+      expect(decodeSyncCursor(cursor)?.synced).toBe(old);
+    });
+  });
+
+  describe('getCatalogChanges', () => {
+    it('should return an empty page with the same positions when nothing changed', async () => {
+      const changes = await getCatalogChanges(CURSOR);
+
+      expect(changes.reset).toBe(false);
+      expect(changes.hasMore).toBe(false);
+      expect(isEmptyChanges(changes)).toBe(true);
+      expect(syncEtag(changes.cursor)).toBe(syncEtag(encodeSyncCursor(CURSOR)));
+      const { synced, ...positions } = decodeSyncCursor(changes.cursor)!;
+      expect(positions).toEqual({ ...CURSOR, synced: undefined });
+      expect(Date.parse(synced)).toBeGreaterThan(Date.parse(CURSOR.synced));
+    });
+
+    it('should read after the cursor position in (updatedAt, id) order', async () => {
+      await getCatalogChanges(CURSOR);
+
+      const args = mockFindMany.product.mock.calls[0][0];
+      expect(args.orderBy).toEqual([{ updatedAt: 'asc' }, { id: 'asc' }]);
+      expect(args.where.AND[1].OR).toEqual([
+        { updatedAt: { gt: new Date(recent) } },
+        { updatedAt: new Date(recent), id: { gt: 'p1' } },
+      ]);
+    });
+
+    it('should turn tombstones and unpublished articles into deletions', async () => {
+      const later = new Date(Date.parse(recent) + 1000);
+      mockFindMany.syncTombstone.mockResolvedValue([
+        { id: 't2', entity: 'products', entityId: 'p9', deletedAt: later },
+      ]);
+      mockFindMany.article.mockResolvedValue([
+        { id: 'a2', status: 'PUBLISHED', updatedAt: later },
+        { id: 'a3', status: 'DRAFT', updatedAt: later },
+      ]);
+
+      const changes = await getCatalogChanges(CURSOR);
+
+      expect(changes.deleted.products).toEqual(['p9']);
+      expect(changes.deleted.articles).toEqual(['a3']);
+      expect(changes.articles).toEqual([{ id: 'a2', status: 'PUBLISHED', updatedAt: later }]);
+      expect(decodeSyncCursor(changes.cursor)).toMatchObject({
+        articles: [later.toISOString(), 'a3'],
+        deleted: [later.toISOString(), 't2'],
+        products: CURSOR.products,
+      });
+    });
+
+    it('should not restart a client whose last tombstone is old but synced recently', async () => {
+      const old = new Date(Date.UTC(2020, 0, 1)).toISOString();
+      const changes = await getCatalogChanges({ ...CURSOR, deleted: [old, 't1'] });
+
+      expect(changes.reset).toBe(false);
+      expect(decodeSyncCursor(changes.cursor)?.deleted).toEqual([old, 't1']);
+    });
+
+    it('should restart from scratch when the cursor predates tombstone retention', async () => {
+      const old = new Date(Date.UTC(2020, 0, 1)).toISOString();
+      const changes = await getCatalogChanges({ ...CURSOR, deleted: [old, 't1'], synced: old });
+
+      expect(changes.reset).toBe(true);
+      expect(isEmptyChanges(changes)).toBe(false);
+      const args = mockFindMany.brand.mock.calls[0][0];
+      expect(args.where.AND[0].updatedAt.gte).toEqual(new Date(0));
+    });
+  });
+});
@@ -0,0 +1,54 @@
+import { deleteInChunks } from '../chunked-delete';
+
+function rowsSource(total: number) {
+  let remaining = total;
+  return {
+    findBatch: jest.fn(async (take: number) =>
+      Array.from({ length: Math.min(take, remaining) }, (_, i) => i)
+    ),
+    deleteBatch: jest.fn(async (rows: number[]) => {
+      remaining -= rows.length;
+      return rows.length;
+    }),
+  };
+}
+
+describe('deleteInChunks', () => {
+  it('should delete in batches until a batch comes back short', async () => {
+    const source = rowsSource(25);
+
+    const deleted = await deleteInChunks({ ...source, chunkSize: 10, pauseMs: 0 });
+
+    expect(deleted).toBe(25);
+    expect(source.deleteBatch.mock.calls.map(([rows]) => rows.length)).toEqual([10, 10, 5]);
+    expect(source.findBatch).toHaveBeenCalledTimes(3);
+  });
+
+  it('should stop on an empty batch', async () => {
+    const source = rowsSource(20);
+
+    const deleted = await deleteInChunks({ ...source, chunkSize: 10, pauseMs: 0 });
+
+    expect(deleted).toBe(20);
+    expect(source.findBatch).toHaveBeenCalledTimes(3);
+    expect(source.deleteBatch).toHaveBeenCalledTimes(2);
+  });
+
+  it('should stop after maxChunks batches', async () => {
+    const source = rowsSource(100);
+
+    const deleted = await deleteInChunks({ ...source, chunkSize: 10, pauseMs: 0, maxChunks: 3 });
+
+    expect(deleted).toBe(30);
+    expect(source.findBatch).toHaveBeenCalledTimes(3);
+  });
+
+  it('should count what deleteBatch reports, not the rows found', async () => {
+    const source = rowsSource(5);
+    source.deleteBatch.mockResolvedValueOnce(3);
+
+    const deleted = await deleteInChunks({ ...source, chunkSize: 10, pauseMs: 0 });
+
+    expect(deleted).toBe(3);
+  });
+});
@@ -0,0 +1,36 @@
+import { lastScheduledTime, matchesCron, parseCron } from '../cron';
+
+describe('Cron Utilities', () => {
+  describe('parseCron', () => {
+    it('should expand steps, ranges and lists', () => {
+      const [minutes, hours, , , weekdays] = parseCron('*/15 1-3 * * 1,5');
+      expect(Array.from(minutes)).toEqual([0, 15, 30, 45]);
+      expect(Array.from(hours)).toEqual([1, 2, 3]);
+      expect(Array.from(weekdays)).toEqual([1, 5]);
+    });
+
+    it('should reject invalid expressions', () => {
+      expect(() => parseCron('* * *')).toThrow();
+      expect(() => parseCron('61 * * * *')).toThrow();
+    });
+  });
+
+  describe('matchesCron', () => {
+    it('should match in UTC', () => {
+      const schedule = parseCron('15 3 * * *');
+      expect(matchesCron(schedule, new Date('2026-01-01T03:15:42Z'))).toBe(true);
+      expect(matchesCron(schedule, new Date('2026-01-01T03:16:00Z'))).toBe(false);
+    });
+  });
+
+  describe('lastScheduledTime', () => {
+    it('should find the most recent firing', () => {
+      const last = lastScheduledTime('*/30 * * * *', new Date('2026-01-01T10:47:10Z'));
+      expect(last?.toISOString()).toBe('2026-01-01T10:30:00.000Z');
+    });
+
+    it('should return null outside the lookback window', () => {
+      expect(lastScheduledTime('0 0 1 1 *', new Date('2026-06-01T00:00:00Z'), 60)).toBeNull();
+    });
+  });
+});
@@ -0,0 +1,124 @@
+/**
+ * @jest-environment node
+ */
+const mockQueryRaw = jest.fn();
+jest.mock('@/lib/prisma', () => ({
+  prisma: { $queryRaw: (...args: unknown[]) => mockQueryRaw(...args) },
+}));
+jest.mock('@/lib/db-pool', () => ({ recordPoolTimeout: jest.fn() }));
+jest.mock('@prisma/client', () => {
+  class PrismaClientKnownRequestError extends Error {
+    code: string;
+    constructor(message: string, { code }: { code: string }) {
+      super(message);
+      this.code = code;
+    }
+  }
+  return {
+    Prisma: {
+      PrismaClientKnownRequestError,
+      PrismaClientInitializationError: class extends Error {},
+      PrismaClientRustPanicError: class extends Error {},
+    },
+  };
+});
+
+import { Prisma } from '@prisma/client';
+import * as dbHealth from '../db-health';
+
+const globalForHealth = globalThis as any;
+
+function prismaError(code: string) {
+  return new Prisma.PrismaClientKnownRequestError(code, { code, clientVersion: 'test' });
+}
+
+describe('Database Health', () => {
+  beforeEach(() => {
+    mockQueryRaw.mockReset();
+    // The state lives on globalThis (survives hot reloads), so reset it in place
+    Object.assign(globalForHealth.databaseHealth, {
+      status: 'unknown',
+      circuit: 'closed',
+      consecutiveFailures: 0,
+      circuitOpens: 0,
+      lastError: null,
+    });
+  });
+
+  afterEach(() => {
+    clearInterval(globalForHealth.databaseProbeTimer);
+    delete globalForHealth.databaseProbeTimer;
+  });
+
+  describe('withDatabase', () => {
+    it('should open the circuit only after consecutive connection errors', async () => {
+      const unreachable = () => Promise.reject(prismaError('P1001'));
+
+      await dbHealth.withDatabase(unreachable, 'mock');
+      await dbHealth.withDatabase(unreachable, 'mock');
+      expect(dbHealth.getDatabaseHealth().circuit).toBe('closed');
+
+      await dbHealth.withDatabase(unreachable, 'mock');
+      expect(dbHealth.getDatabaseHealth()).toMatchObject({
+        circuit: 'open',
+        status: 'down',
+        consecutiveFailures: 3,
+        circuitOpens: 1,
+      });
+    });
+
+    it('should reset the failure count after a successful query', async () => {
+      const unreachable = () => Promise.reject(prismaError('P1001'));
+
+      await dbHealth.withDatabase(unreachable, 'mock');
+      await dbHealth.withDatabase(unreachable, 'mock');
+      await expect(dbHealth.withDatabase(async () => 'real', 'mock')).resolves.toBe('real');
+      await dbHealth.withDatabase(unreachable, 'mock');
+
+      expect(dbHealth.getDatabaseHealth()).toMatchObject({
+        circuit: 'closed',
+        consecutiveFailures: 1,
+      });
+    });
+
+    it('should not count pool timeouts as connection errors', async () => {
+      for (let i = 0; i < 5; i++) {
+        await dbHealth.withDatabase(() => Promise.reject(prismaError('P2024')), 'mock');
+      }
+
+      expect(dbHealth.getDatabaseHealth()).toMatchObject({
+        circuit: 'closed',
+        consecutiveFailures: 0,
+      });
+    });
+  });
+
+  describe('probeDatabase', () => {
+    it('should leave the circuit closed when the probe hits a busy pool', async () => {
+      mockQueryRaw.mockRejectedValue(prismaError('P2024'));
+
+      for (let i = 0; i < 5; i++) {
+        await dbHealth.probeDatabase();
+      }
+
+      expect(dbHealth.getDatabaseHealth()).toMatchObject({
+        circuit: 'closed',
+        consecutiveFailures: 0,
+        lastError: 'P2024',
+      });
+    });
+
+    it('should close the circuit once the database answers again', async () => {
+      mockQueryRaw.mockRejectedValue(prismaError('P1001'));
+      for (let i = 0; i < 3; i++) {
+        await dbHealth.probeDatabase();
+      }
+      expect(dbHealth.getDatabaseHealth().circuit).toBe('open');
+
+      mockQueryRaw.mockResolvedValue([{ '?column?': 1 }]);
+      const health = await dbHealth.probeDatabase();
+
+      expect(health).toMatchObject({ circuit: 'closed', status: 'up', consecutiveFailures: 0 });
+    });
+  });
+});
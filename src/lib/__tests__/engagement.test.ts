@@ -0,0 +1,106 @@
+jest.mock('@/lib/prisma', () => ({ prisma: {} }));
+jest.mock('@prisma/client', () => ({ Prisma: {} }));
+
+import { EngagementCounter, EngagementRow, NO_MERCHANT } from '../engagement';
+
+const HOUR = 60 * 60 * 1000;
+
+function createCounter(sink: (rows: EngagementRow[]) => Promise<void>, maxPendingKeys = 100) {
+  return new EngagementCounter(sink, {
+    bucketMs: HOUR,
+    flushIntervalMs: 60_000,
+    maxPendingKeys,
+  });
+}
+
+describe('EngagementCounter', () => {
+  it('should coalesce views and clicks per product, merchant and bucket', async () => {
+    const flushed: EngagementRow[] = [];
+    const counter = createCounter(async (rows) => {
+      flushed.push(...rows);
+    });
+    const at = new Date('2026-01-01T10:15:00Z');
+
+    counter.record('view', 'p1', NO_MERCHANT, at);
+    counter.record('view', 'p1', NO_MERCHANT, at);
+    counter.record('click', 'p1', 'AMAZON', at);
+    counter.record('click', 'p1', 'AMAZON', new Date('2026-01-01T10:45:00Z'));
+    counter.record('click', 'p1', 'AMAZON', new Date('2026-01-01T11:05:00Z'));
+
+    expect(counter.size).toBe(3);
+    await counter.stop();
+
+    expect(flushed).toHaveLength(3);
+    const views = flushed.find((row) => row.merchant === NO_MERCHANT);
+    expect(views).toMatchObject({ views: 2, clicks: 0 });
+    expect(views?.bucketStart.toISOString()).toBe('2026-01-01T10:00:00.000Z');
+
+    const amazon = flushed.filter((row) => row.merchant === 'AMAZON');
+    expect(amazon.map((row) => row.clicks)).toEqual([2, 1]);
+    expect(counter.size).toBe(0);
+  });
+
+  it('should keep counts for the next flush when the sink fails', async () => {
+    const sink = jest
+      .fn<Promise<void>, [EngagementRow[]]>()
+      .mockRejectedValueOnce(new Error('db down'))
+      .mockResolvedValue(undefined);
+    const counter = createCounter(sink);
+    const consoleSpy = jest.spyOn(console, 'error').mockImplementation(() => {});
+
+    counter.record('view', 'p1');
+    await counter.flush();
+    counter.record('view', 'p1');
+    await counter.stop();
+
+    expect(sink).toHaveBeenCalledTimes(2);
+    expect(sink.mock.calls[1][0][0].views).toBe(2);
+    consoleSpy.mockRestore();
+  });
+
+  it('should flush counts recorded while a flush is in flight on stop', async () => {
+    let release: () => void = () => {};
+    const sink = jest
+      .fn<Promise<void>, [EngagementRow[]]>()
+      .mockImplementationOnce(() => new Promise<void>((resolve) => (release = resolve)))
+      .mockResolvedValue(undefined);
+    const counter = createCounter(sink);
+
+    counter.record('view', 'p1');
+    const inFlight = counter.flush();
+    counter.record('view', 'p2');
+    const stopped = counter.stop();
+    release();
+    await Promise.all([inFlight, stopped]);
+
+    expect(sink).toHaveBeenCalledTimes(2);
+    expect(sink.mock.calls[1][0][0].productId).toBe('p2');
+    expect(counter.size).toBe(0);
+  });
+
+  it('should give up on stop when the sink keeps failing', async () => {
+    const sink = jest
+      .fn<Promise<void>, [EngagementRow[]]>()
+      .mockRejectedValue(new Error('db down'));
+    const counter = createCounter(sink);
+    const consoleSpy = jest.spyOn(console, 'error').mockImplementation(() => {});
+
+    counter.record('view', 'p1');
+    await counter.stop();
+
+    expect(sink).toHaveBeenCalledTimes(1);
+    expect(counter.size).toBe(1);
+    consoleSpy.mockRestore();
+  });
+
+  it('should flush early when too many keys are pending', async () => {
+    const sink = jest.fn<Promise<void>, [EngagementRow[]]>().mockResolvedValue(undefined);
+    const counter = createCounter(sink, 2);
+
+    counter.record('view', 'p1');
+    counter.record('view', 'p2');
+
+    expect(sink).toHaveBeenCalledTimes(1);
+    await counter.stop();
+  });
+});
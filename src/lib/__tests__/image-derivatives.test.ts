@@ -0,0 +1,101 @@
+/**
+ * @jest-environment node
+ */
+import { mkdtemp, readdir, rm } from 'fs/promises';
+import { tmpdir } from 'os';
+import { join } from 'path';
+import {
+  DiskLru,
+  getDerivative,
+  imageVariantsFromInfo,
+  resolveImageSource,
+} from '../image-derivatives';
+
+describe('Image Derivatives', () => {
+  describe('resolveImageSource', () => {
+    it('should map public image URLs into public/', () => {
+      expect(resolveImageSource('/images/products/oats.jpg')).toBe(
+        join(process.cwd(), 'public', 'images', 'products', 'oats.jpg')
+      );
+      expect(resolveImageSource('/uploads/labels/a%20b.PNG')).toBe(
+        join(process.cwd(), 'public', 'uploads', 'labels', 'a b.PNG')
+      );
+    });
+
+    it('should keep dot segments inside public/', () => {
+      expect(resolveImageSource('/images/%2e%2e/%2e%2e/../secret.jpg')).toBe(
+        join(process.cwd(), 'public', 'secret.jpg')
+      );
+    });
+
+    it('should reject remote, traversal and non-image sources', () => {
+      expect(resolveImageSource('https://images.unsplash.com/photo.jpg')).toBeNull();
+      expect(resolveImageSource('//evil.example/photo.jpg')).toBeNull();
+      expect(resolveImageSource('/../package.json')).toBeNull();
+      expect(resolveImageSource('/images/notes.txt')).toBeNull();
+      expect(resolveImageSource('/images/%E0%A4%A.jpg')).toBeNull();
+    });
+  });
+
+  describe('imageVariantsFromInfo', () => {
+    it('should build srcsets up to the stored width', () => {
+      const variants = imageVariantsFromInfo('/uploads/labels/a.jpg', {
+        hash: '0123456789abcdef',
+        width: 400,
+      });
+
+      expect(variants?.webp).toBe(
+        '/img/0123456789abcdef/160.webp?src=%2Fuploads%2Flabels%2Fa.jpg 160w, ' +
+          '/img/0123456789abcdef/320.webp?src=%2Fuploads%2Flabels%2Fa.jpg 320w'
+      );
+      expect(variants?.avif).toContain('/img/0123456789abcdef/320.avif?');
+    });
+
+    it('should skip images narrower than the smallest derivative', () => {
+      const info = { hash: '0123456789abcdef', width: 100 };
+      expect(imageVariantsFromInfo('/uploads/labels/a.jpg', info)).toBeNull();
+    });
+  });
+
+  describe('getDerivative', () => {
+    it('should reject widths and formats outside the allowed set', async () => {
+      expect(await getDerivative('/images/a.jpg', '0123456789abcdef', 333, 'webp')).toBeNull();
+      expect(await getDerivative('/images/a.jpg', '0123456789abcdef', 320, 'png')).toBeNull();
+    });
+  });
+
+  describe('DiskLru', () => {
+    let dir: string;
+
+    beforeEach(async () => {
+      dir = await mkdtemp(join(tmpdir(), 'derivatives-'));
+    });
+
+    afterEach(async () => {
+      await rm(dir, { recursive: true, force: true });
+    });
+
+    it('should evict least recently used files over the size cap', async () => {
+      const cache = new DiskLru(dir, 25);
+      await cache.put('a.webp', Buffer.alloc(10));
+      await cache.put('b.webp', Buffer.alloc(10));
+      expect(await cache.get('a.webp')).not.toBeNull(); // a is now most recent
+
+      await cache.put('c.webp', Buffer.alloc(10));
+      await new Promise((resolve) => setTimeout(resolve, 10)); // unlink is fire-and-forget
+
+      expect(await cache.get('b.webp')).toBeNull();
+      expect((await cache.get('a.webp'))?.length).toBe(10);
+      expect((await readdir(dir)).sort()).toEqual(['a.webp', 'c.webp']);
+      expect(cache.stats).toEqual({ files: 2, bytes: 20, maxBytes: 25 });
+    });
+
+    it('should rebuild the index from files already on disk', async () => {
+      await new DiskLru(dir, 100).put('a.webp', Buffer.alloc(40));
+
+      const reloaded = new DiskLru(dir, 100);
+      expect((await reloaded.get('a.webp'))?.length).toBe(40);
+      expect(reloaded.stats.bytes).toBe(40);
+    });
+  });
+});
@@ -0,0 +1,46 @@
+import { JobQueue } from '../job-queue';
+
+function deferred() {
+  let resolve!: () => void;
+  const promise = new Promise<void>((r) => {
+    resolve = r;
+  });
+  return { promise, resolve };
+}
+
+describe('JobQueue', () => {
+  it('should never run more jobs than the concurrency limit', async () => {
+    const queue = new JobQueue(2);
+    const gates = [deferred(), deferred(), deferred()];
+    let running = 0;
+    let maxRunning = 0;
+
+    const jobs = gates.map((gate) =>
+      queue.run(async () => {
+        running++;
+        maxRunning = Math.max(maxRunning, running);
+        await gate.promise;
+        running--;
+      })
+    );
+
+    await Promise.resolve();
+    expect(queue.activeCount).toBe(2);
+    expect(queue.pendingCount).toBe(1);
+
+    gates.forEach((gate) => gate.resolve());
+    await Promise.all(jobs);
+
+    expect(maxRunning).toBe(2);
+    expect(queue.activeCount).toBe(0);
+    expect(queue.pendingCount).toBe(0);
+  });
+
+  it('should release the slot when a job fails', async () => {
+    const queue = new JobQueue(1);
+
+    await expect(queue.run(async () => Promise.reject(new Error('boom')))).rejects.toThrow('boom');
+    await expect(queue.run(async () => 'ok')).resolves.toBe('ok');
+    expect(queue.activeCount).toBe(0);
+  });
+});
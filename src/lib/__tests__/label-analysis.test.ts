@@ -0,0 +1,66 @@
+/**
+ * @jest-environment node
+ */
+const mockIngredients = jest.fn();
+jest.mock('@/lib/prisma', () => ({
+  prisma: { ingredient: { findMany: (...args: unknown[]) => mockIngredients(...args) } },
+}));
+
+import { analyzeLabelData } from '../label-analysis';
+
+function ingredient(name: string, riskLevel: string) {
+  const slug = name.toLowerCase().replace(/\s+/g, '-');
+  return { id: `ing-${slug}`, name, slug, description: null, riskLevel, updatedAt: new Date() };
+}
+
+describe('Label Analysis', () => {
+  beforeEach(() => {
+    mockIngredients.mockReset();
+  });
+
+  describe('analyzeLabelData', () => {
+    it('should look up every ingredient in a single query', async () => {
+      mockIngredients.mockResolvedValue([
+        ingredient('Sugar', 'HIGH'),
+        ingredient('Whole Wheat Flour', 'LOW'),
+        ingredient('Palm Oil', 'MODERATE'),
+      ]);
+      const ingredients = ['Whole Wheat Flour', 'Sugar', 'Palm Oil', 'Salt', 'Sugar'];
+
+      const result = await analyzeLabelData({ ingredients, nutritionFacts: {}, warnings: [] });
+
+      expect(mockIngredients).toHaveBeenCalledTimes(1);
+      const names = mockIngredients.mock.calls[0][0].where.OR.map(
+        (clause: any) => (clause.name ?? clause.slug).contains
+      );
+      expect(new Set(names)).toEqual(new Set(['whole wheat flour', 'sugar', 'palm oil', 'salt']));
+      expect(result.ingredients.map((analysis) => analysis.status)).toEqual([
+        'good',
+        'bad',
+        'moderate',
+        'unknown',
+        'bad',
+      ]);
+    });
+
+    it('should load candidates in a stable order', async () => {
+      mockIngredients.mockResolvedValue([
+        ingredient('Brown Sugar', 'MODERATE'),
+        ingredient('Sugar', 'HIGH'),
+      ]);
+      const ingredients = ['Sugar'];
+
+      const result = await analyzeLabelData({ ingredients, nutritionFacts: {}, warnings: [] });
+
+      // Both contain "sugar", so the match is the first row in id order
+      expect(mockIngredients.mock.calls[0][0].orderBy).toEqual({ id: 'asc' });
+      expect(result.ingredients[0].ingredientId).toBe('ing-brown-sugar');
+    });
+
+    it('should not query without ingredients', async () => {
+      await analyzeLabelData({ ingredients: [], nutritionFacts: {}, warnings: [] });
+
+      expect(mockIngredients).not.toHaveBeenCalled();
+    });
+  });
+});
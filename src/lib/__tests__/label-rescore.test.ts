@@ -0,0 +1,217 @@
+/**
+ * @jest-environment node
+ */
+const mockIngredients = jest.fn();
+const mockScans = jest.fn();
+const mockTombstones = jest.fn();
+const mockQueryRaw = jest.fn();
+const mockDeleteTerms = jest.fn();
+const mockCreateTerms = jest.fn();
+
+jest.mock('@/lib/prisma', () => {
+  const tx = {
+    $queryRaw: (...args: unknown[]) => mockQueryRaw(...args),
+    labelScanIngredient: {
+      deleteMany: (...args: unknown[]) => mockDeleteTerms(...args),
+      createMany: (...args: unknown[]) => mockCreateTerms(...args),
+    },
+  };
+  return {
+    prisma: {
+      ...tx,
+      ingredient: { findMany: (...args: unknown[]) => mockIngredients(...args) },
+      labelScan: { findMany: (...args: unknown[]) => mockScans(...args) },
+      syncTombstone: { findMany: (...args: unknown[]) => mockTombstones(...args) },
+      $transaction: (fn: (client: typeof tx) => unknown) => fn(tx),
+    },
+  };
+});
+jest.mock('@prisma/client', () => ({
+  Prisma: {
+    sql: (strings: TemplateStringsArray, ...values: unknown[]) => ({
+      sql: strings.join('?'),
+      values,
+    }),
+    join: (values: unknown[]) => ({ join: values }),
+  },
+}));
+
+import { labelIngredientTerms, scoreLabelData } from '../label-analysis';
+import { rescoreLabelScans } from '../label-rescore';
+
+const SUGAR = {
+  id: 'ing-sugar',
+  name: 'Sugar',
+  slug: 'sugar',
+  description: null,
+  riskLevel: 'HIGH',
+  updatedAt: new Date(),
+};
+const LABEL = { ingredients: ['Sugar', 'Whole Wheat', 'sugar'], nutritionFacts: {}, warnings: [] };
+
+/**
+ * Stored analyses come back from JSONB with their keys reordered
+ */
+function fromJsonb(value: unknown): unknown {
+  if (Array.isArray(value)) return value.map(fromJsonb);
+  if (value && typeof value === 'object') {
+    return Object.fromEntries(
+      Object.entries(JSON.parse(JSON.stringify(value)))
+        .reverse()
+        .map(([key, v]) => [key, fromJsonb(v)])
+    );
+  }
+  return value;
+}
+
+/**
+ * Serve the id pages and the chunk reads of labelScan.findMany from one list
+ */
+function mockStoredScans(scans: Array<{ id: string }>) {
+  mockScans.mockImplementation(async ({ where }: any) => {
+    if (where.id.in) return scans.filter((scan) => where.id.in.includes(scan.id));
+    return where.id.gt === '' ? scans.map(({ id }) => ({ id })) : [];
+  });
+}
+
+function rawSql(call: unknown[]): string {
+  return (call[0] as TemplateStringsArray).join('?');
+}
+
+describe('Label Re-scoring', () => {
+  beforeEach(() => {
+    jest.clearAllMocks();
+    mockIngredients.mockResolvedValue([SUGAR]);
+    mockTombstones.mockResolvedValue([]);
+    mockQueryRaw.mockImplementation(async (...call: unknown[]) => {
+      const sql = rawSql(call);
+      if (sql.includes('UPDATE "label_scans"')) {
+        return [{ id: 'scan-stale' }];
+      }
+      return [];
+    });
+  });
+
+  describe('labelIngredientTerms', () => {
+    it('should index each normalized name once with its match', () => {
+      const analysis = scoreLabelData(LABEL, [SUGAR as any]);
+
+      expect(labelIngredientTerms(analysis)).toEqual([
+        { term: 'sugar', ingredientId: 'ing-sugar' },
+        { term: 'whole wheat', ingredientId: null },
+      ]);
+    });
+  });
+
+  describe('rescoreLabelScans', () => {
+    it('should write only scans whose analysis changed', async () => {
+      const current = scoreLabelData(LABEL, [SUGAR as any]);
+      const scoredAt = new Date('2026-10-01T00:00:00.000Z');
+      mockStoredScans([
+        { id: 'scan-current', extractedData: LABEL, analysisResult: fromJsonb(current), scoredAt },
+        { id: 'scan-stale', extractedData: LABEL, analysisResult: { overallScore: 90 }, scoredAt },
+        { id: 'scan-failed', extractedData: { error: 'OCR' }, analysisResult: null, scoredAt },
+      ] as any);
+
+      const result = await rescoreLabelScans({ all: true });
+
+      expect(result).toEqual({ scanned: 3, updated: 1, unchanged: 2, conflicts: 0 });
+      const update = mockQueryRaw.mock.calls.find((call) => rawSql(call).includes('UPDATE'))!;
+      expect(update[1].join).toHaveLength(1);
+      expect(update[1].join[0].values[0]).toBe('scan-stale');
+      expect(update[1].join[0].values[1]).toBe(current.overallScore);
+      expect(mockDeleteTerms).toHaveBeenCalledWith({ where: { scanId: { in: ['scan-stale'] } } });
+      expect(mockCreateTerms).toHaveBeenCalledWith({
+        data: [
+          { scanId: 'scan-stale', term: 'sugar', ingredientId: 'ing-sugar' },
+          { scanId: 'scan-stale', term: 'whole wheat', ingredientId: null },
+        ],
+      });
+    });
+
+    it('should match what scan time matched when several ingredients contain a name', async () => {
+      const brownSugar = {
+        ...SUGAR,
+        id: 'ing-brown-sugar',
+        name: 'Brown Sugar',
+        slug: 'brown-sugar',
+      };
+      const oats = { ...SUGAR, id: 'ing-oats', name: 'Oats', slug: 'oats', riskLevel: 'LOW' };
+      // Scan time loads only the candidates, the re-score the whole table
+      const atScan = scoreLabelData(LABEL, [brownSugar, SUGAR] as any);
+      const scoredAt = new Date('2026-10-01T00:00:00.000Z');
+      mockIngredients.mockResolvedValue([brownSugar, oats, SUGAR]);
+      mockStoredScans([
+        { id: 'scan-current', extractedData: LABEL, analysisResult: fromJsonb(atScan), scoredAt },
+      ] as any);
+
+      const result = await rescoreLabelScans({ all: true });
+
+      expect(mockIngredients).toHaveBeenCalledWith({ orderBy: { id: 'asc' } });
+      expect(result).toEqual({ scanned: 1, updated: 0, unchanged: 1, conflicts: 0 });
+    });
+
+    it('should keep a result written concurrently', async () => {
+      mockStoredScans([
+        { id: 'scan-stale', extractedData: LABEL, analysisResult: null, scoredAt: null },
+      ] as any);
+      mockQueryRaw.mockResolvedValue([]);
+
+      const result = await rescoreLabelScans({ all: true });
+
+      expect(result.conflicts).toBe(1);
+      expect(result.updated).toBe(0);
+      expect(mockCreateTerms).not.toHaveBeenCalled();
+    });
+
+    it('should only look up scans affected by changed or deleted ingredients', async () => {
+      const since = new Date(Date.now() - 60 * 60 * 1000);
+      const oats = { ...SUGAR, id: 'ing-oats', name: 'Oats', slug: 'oats', updatedAt: new Date(0) };
+      mockIngredients.mockResolvedValue([SUGAR, oats]);
+      mockTombstones.mockResolvedValue([{ entityId: 'ing-deleted' }]);
+      mockStoredScans([]);
+      mockQueryRaw.mockImplementation(async (...call: unknown[]) =>
+        rawSql(call).includes('DISTINCT "term"')
+          ? [{ term: 'sugar' }, { term: 'brown sugar' }, { term: 'oats' }]
+          : []
+      );
+
+      await rescoreLabelScans({ since });
+
+      // Unindexed scans first, then the reverse index
+      expect(mockScans.mock.calls[0][0].where).toMatchObject({
+        scoredAt: null,
+        status: 'COMPLETED',
+      });
+      expect(mockTombstones.mock.calls[0][0].where).toEqual({
+        entity: 'ingredients',
+        deletedAt: { gt: since },
+      });
+      const lookup = mockQueryRaw.mock.calls.find((call) =>
+        rawSql(call).includes('DISTINCT "scanId"')
+      )!;
+      const [byIngredient, byTerm] = lookup[1].join;
+      expect(byIngredient.values[0].join).toEqual(['ing-sugar', 'ing-deleted']);
+      expect(byTerm.values[0].join).toEqual(['sugar']);
+    });
+
+    it('should only index unscored scans on the first run', async () => {
+      mockStoredScans([]);
+
+      await rescoreLabelScans({ since: null });
+
+      expect(mockScans).toHaveBeenCalledTimes(1);
+      expect(mockScans.mock.calls[0][0].where).toMatchObject({ scoredAt: null });
+      expect(mockTombstones).not.toHaveBeenCalled();
+    });
+
+    it('should fall back to a full pass once tombstones may have expired', async () => {
+      mockStoredScans([]);
+
+      await rescoreLabelScans({ since: new Date('2020-01-01') });
+
+      expect(mockScans.mock.calls[0][0].where).toEqual({ status: 'COMPLETED', id: { gt: '' } });
+      expect(mockTombstones).not.toHaveBeenCalled();
+    });
+  });
+});
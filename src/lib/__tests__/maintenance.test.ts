@@ -0,0 +1,94 @@
+/**
+ * @jest-environment node
+ */
+const mockExecuteRaw = jest.fn();
+const mockFindLastRun = jest.fn();
+jest.mock('@/lib/prisma', () => ({
+  prisma: {
+    $executeRaw: (...args: unknown[]) => mockExecuteRaw(...args),
+    maintenanceRun: { findFirst: (...args: unknown[]) => mockFindLastRun(...args) },
+  },
+}));
+jest.mock('@/lib/otp', () => ({ cleanupExpiredOTPs: jest.fn() }));
+jest.mock('@/lib/telemetry', () => ({ cleanupOldTelemetry: jest.fn() }));
+jest.mock('@/lib/label-rescore', () => ({ rescoreLabelScans: jest.fn() }));
+jest.mock('@/lib/catalog-sync', () => ({ TOMBSTONE_RETENTION_DAYS: 30 }));
+
+import { acquireLock, isJobDue, MaintenanceJob, renewLock } from '../maintenance';
+
+/** The SQL of a tagged-template $executeRaw call, without its parameters */
+function sqlOf(call: unknown[]): string {
+  return (call[0] as TemplateStringsArray).join('?').replace(/\s+/g, ' ');
+}
+
+const job: MaintenanceJob = {
+  name: 'nightly',
+  description: 'Test job',
+  schedule: '15 3 * * *',
+  run: async () => ({ rowsDeleted: 0, bytesReclaimed: 0 }),
+};
+
+describe('Maintenance', () => {
+  beforeEach(() => {
+    mockExecuteRaw.mockReset();
+    mockFindLastRun.mockReset();
+  });
+
+  describe('acquireLock', () => {
+    it('should take the lease only when it is free or expired', async () => {
+      mockExecuteRaw.mockResolvedValue(1);
+
+      await expect(acquireLock('runner-a')).resolves.toBe(true);
+      expect(sqlOf(mockExecuteRaw.mock.calls[0])).toContain(
+        'WHERE "maintenance_locks"."lockedUntil" < NOW()'
+      );
+      expect(mockExecuteRaw.mock.calls[0]).toContain('runner-a');
+    });
+
+    it('should fail while another runner holds the lease', async () => {
+      mockExecuteRaw.mockResolvedValue(0);
+
+      await expect(acquireLock('runner-b')).resolves.toBe(false);
+    });
+  });
+
+  describe('renewLock', () => {
+    it('should extend only a lease this runner still holds', async () => {
+      mockExecuteRaw.mockResolvedValueOnce(1).mockResolvedValueOnce(0);
+
+      await expect(renewLock('runner-a')).resolves.toBe(true);
+      await expect(renewLock('runner-a')).resolves.toBe(false);
+      expect(sqlOf(mockExecuteRaw.mock.calls[0])).toContain('"lockedBy" = ?');
+    });
+  });
+
+  describe('isJobDue', () => {
+    const now = new Date('2026-01-02T10:00:00Z');
+
+    it('should run a job that has never run', async () => {
+      mockFindLastRun.mockResolvedValue(null);
+
+      await expect(isJobDue(job, now)).resolves.toBe(true);
+      expect(mockFindLastRun.mock.calls[0][0].where).toEqual({ job: 'nightly' });
+    });
+
+    it('should run a job whose schedule fired since its last run', async () => {
+      mockFindLastRun.mockResolvedValue({ startedAt: new Date('2026-01-01T03:15:05Z') });
+
+      await expect(isJobDue(job, now)).resolves.toBe(true);
+    });
+
+    it('should skip a job that already ran since its schedule fired', async () => {
+      mockFindLastRun.mockResolvedValue({ startedAt: new Date('2026-01-02T03:15:05Z') });
+
+      await expect(isJobDue(job, now)).resolves.toBe(false);
+    });
+
+    it('should skip a job whose schedule has not fired within the lookback', async () => {
+      const yearly = { ...job, schedule: '0 0 1 1 *' };
+
+      await expect(isJobDue(yearly, new Date('2026-06-01T00:00:00Z'))).resolves.toBe(false);
+      expect(mockFindLastRun).not.toHaveBeenCalled();
+    });
+  });
+});
@@ -0,0 +1,263 @@
+/**
+ * @jest-environment node
+ */
+import { gunzipSync } from 'zlib';
+
+const mockFindMany = jest.fn();
+jest.mock('@/lib/prisma', () => ({
+  prisma: { telemetryEvent: { findMany: (...args: unknown[]) => mockFindMany(...args) } },
+}));
+
+import {
+  ExportFormat,
+  ExportOptions,
+  exportTelemetry,
+  formatExportPosition,
+  parseExportPosition,
+} from '../telemetry-export';
+
+const FROM = new Date('2026-10-01T00:00:00.000Z');
+const TO = new Date('2026-10-02T00:00:00.000Z');
+
+function event(i: number, overrides: Record<string, unknown> = {}) {
+  return {
+    id: `evt${String(i).padStart(3, '0')}`,
+    createdAt: new Date(FROM.getTime() + i * 1000),
+    eventType: 'PAGE_VIEW',
+    eventName: 'page_view',
+    userId: null,
+    sessionId: 'sess1',
+    path: '/shop',
+    referrer: null,
+    duration: null,
+    userAgent: 'jest',
+    properties: null,
+    ...overrides,
+  };
+}
+
+/**
+ * Thrift compact protocol reader for Parquet footers and page headers.
+ * Structs decode to { fieldId: value }.
+ */
+function readThrift(bytes: Buffer, start: number): { value: any; end: number } {
+  let pos = start;
+  const varint = () => {
+    let result = 0;
+    let shift = 0;
+    let byte;
+    do {
+      byte = bytes[pos++];
+      result += (byte & 0x7f) * 2 ** shift;
+      shift += 7;
+    } while (byte & 0x80);
+    return result;
+  };
+  const zigzag = () => {
+    const n = varint();
+    return n % 2 ? -(n + 1) / 2 : n / 2;
+  };
+  const read = (type: number): any => {
+    if (type === 5 || type === 6) return zigzag(); // i32, i64
+    if (type === 8) {
+      const length = varint();
+      pos += length;
+      return bytes.subarray(pos - length, pos);
+    }
+    if (type === 9) {
+      const header = bytes[pos++];
+      const size = header >> 4 === 15 ? varint() : header >> 4;
+      return Array.from({ length: size }, () => read(header & 0x0f));
+    }
+    if (type === 12) return struct();
+    throw new Error(`Unexpected Thrift type ${type}`);
+  };
+  const struct = () => {
+    const fields: Record<number, any> = {};
+    let id = 0;
+    for (;;) {
+      const header = bytes[pos++];
+      if (header === 0) return fields;
+      id = header >> 4 ? id + (header >> 4) : zigzag();
+      fields[id] = read(header & 0x0f);
+    }
+  };
+  const value = struct();
+  return { value, end: pos };
+}
+
+async function collect(format: ExportFormat, options: Partial<ExportOptions> = {}) {
+  const chunks = [];
+  for await (const chunk of exportTelemetry(format, { from: FROM, to: TO, ...options })) {
+    chunks.push(chunk);
+  }
+  return {
+    bytes: Buffer.concat(chunks.map((chunk) => chunk.bytes)),
+    last: chunks[chunks.length - 1],
+  };
+}
+
+describe('Telemetry Export', () => {
+  beforeEach(() => {
+    mockFindMany.mockReset();
+  });
+
+  describe('positions', () => {
+    it('should round-trip and reject malformed positions', () => {
+      const position = { createdAt: FROM, id: 'evt001' };
+      expect(formatExportPosition(position)).toBe('2026-10-01T00:00:00.000Z,evt001');
+      expect(parseExportPosition(formatExportPosition(position))).toEqual(position);
+      expect(parseExportPosition('yesterday,evt001')).toBeNull();
+      expect(parseExportPosition('2026-10-01T00:00:00.000Z')).toBeNull();
+    });
+  });
+
+  describe('batching', () => {
+    it('should page by (createdAt, id) until a short batch', async () => {
+      mockFindMany
+        .mockResolvedValueOnce([event(1), event(2)])
+        .mockResolvedValueOnce([event(3)]);
+
+      const { last } = await collect('ndjson', { batchSize: 2 });
+
+      expect(mockFindMany).toHaveBeenCalledTimes(2);
+      const second = mockFindMany.mock.calls[1][0];
+      expect(second.orderBy).toEqual([{ createdAt: 'asc' }, { id: 'asc' }]);
+      expect(second.where.AND[1].OR).toEqual([
+        { createdAt: { gt: event(2).createdAt } },
+        { createdAt: event(2).createdAt, id: { gt: 'evt002' } },
+      ]);
+      expect(second.select.ipAddress).toBeUndefined();
+      expect(last.rows).toBe(3);
+      expect(last.position).toEqual({ createdAt: event(3).createdAt, id: 'evt003' });
+    });
+
+    it('should not read past the limit', async () => {
+      mockFindMany.mockResolvedValueOnce([event(1), event(2)]);
+
+      const { last } = await collect('ndjson', { batchSize: 10, limit: 2 });
+
+      expect(mockFindMany).toHaveBeenCalledTimes(1);
+      expect(mockFindMany.mock.calls[0][0].take).toBe(2);
+      expect(last.rows).toBe(2);
+    });
+  });
+
+  describe('formats', () => {
+    it('should write one JSON object per line', async () => {
+      mockFindMany.mockResolvedValueOnce([event(1), event(2)]);
+
+      const { bytes } = await collect('ndjson');
+      const lines = bytes.toString().trim().split('\n');
+
+      expect(lines).toHaveLength(2);
+      expect(JSON.parse(lines[0])).toMatchObject({ id: 'evt001', path: '/shop' });
+    });
+
+    it('should quote CSV fields and skip the header when resuming', async () => {
+      mockFindMany.mockResolvedValue([
+        event(1, { path: '/search?q=a,b', properties: { note: 'say "hi"' } }),
+      ]);
+
+      const fresh = (await collect('csv')).bytes.toString().split('\n');
+      expect(fresh[0].split(',')).toEqual([
+        'id',
+        'createdAt',
+        'eventType',
+        'eventName',
+        'userId',
+        'sessionId',
+        'path',
+        'referrer',
+        'duration',
+        'userAgent',
+        'properties',
+      ]);
+      expect(fresh[1]).toContain('"/search?q=a,b"');
+      expect(fresh[1]).toContain('"{""note"":""say \\""hi\\""""}"');
+
+      const resumed = await collect('csv', {
+        after: { createdAt: FROM, id: 'evt000' },
+        header: false,
+      });
+      expect(resumed.bytes.toString().startsWith('evt001,')).toBe(true);
+    });
+
+    it('should write a Parquet footer and pages that decode back to the rows', async () => {
+      mockFindMany.mockResolvedValueOnce([event(1), event(2, { duration: 1500 })]);
+
+      const { bytes } = await collect('parquet');
+
+      expect(bytes.subarray(0, 4).toString()).toBe('PAR1');
+      expect(bytes.subarray(-4).toString()).toBe('PAR1');
+      const footerStart = bytes.length - 8 - bytes.readUInt32LE(bytes.length - 8);
+      const { value: meta, end } = readThrift(bytes, footerStart);
+      expect(end).toBe(bytes.length - 8);
+
+      // FileMetaData: num_rows, then the schema root and one element per column
+      expect(meta[3]).toBe(2);
+      expect(meta[2][0][5]).toBe(11);
+      expect(meta[2].slice(1).map((element: any) => element[4].toString())).toEqual([
+        'id',
+        'createdAt',
+        'eventType',
+        'eventName',
+        'userId',
+        'sessionId',
+        'path',
+        'referrer',
+        'duration',
+        'userAgent',
+        'properties',
+      ]);
+
+      // Column chunks run back to back from after the magic up to the footer
+      const [rowGroup] = meta[4];
+      expect(meta[4]).toHaveLength(1);
+      expect(rowGroup[3]).toBe(2);
+      let offset = 4;
+      for (const chunk of rowGroup[1]) {
+        expect(chunk[2]).toBe(offset);
+        expect(chunk[3][9]).toBe(offset); // data_page_offset
+        expect(chunk[3][5]).toBe(2); // num_values
+        offset += chunk[3][7]; // total_compressed_size
+      }
+      expect(offset).toBe(footerStart);
+
+      // duration is nullable: null_count and min/max statistics, then a page
+      // of definition levels (RLE runs 1 x 0, 1 x 1) followed by one INT32
+      const duration = rowGroup[1][8][3];
+      expect(duration[3][0].toString()).toBe('duration');
+      expect(duration[12][3]).toBe(1);
+      expect(duration[12][5].readInt32LE()).toBe(1500);
+      expect(duration[12][6].readInt32LE()).toBe(1500);
+
+      const { value: page, end: bodyStart } = readThrift(bytes, duration[9]);
+      expect(page[5][1]).toBe(2);
+      const body = gunzipSync(bytes.subarray(bodyStart, bodyStart + page[3]));
+      expect(body.length).toBe(page[2]);
+      const levels = body.readUInt32LE(0);
+      expect([...body.subarray(4, 4 + levels)]).toEqual([2, 0, 2, 1]);
+      expect(body.readInt32LE(4 + levels)).toBe(1500);
+      expect(body.length).toBe(4 + levels + 4);
+
+      // Required strings: PLAIN byte arrays with a 4-byte length prefix
+      const ids = rowGroup[1][0][3];
+      const { value: idPage, end: idStart } = readThrift(bytes, ids[9]);
+      const idBody = gunzipSync(bytes.subarray(idStart, idStart + idPage[3]));
+      expect(idBody.readUInt32LE(0)).toBe(6);
+      expect(idBody.subarray(4, 10).toString()).toBe('evt001');
+      expect(idBody.subarray(14, 20).toString()).toBe('evt002');
+    });
+
+    it('should still write a valid Parquet file for an empty range', async () => {
+      mockFindMany.mockResolvedValueOnce([]);
+
+      const { bytes, last } = await collect('parquet');
+
+      expect(last.rows).toBe(0);
+      expect(bytes.subarray(0, 4).toString()).toBe('PAR1');
+      expect(bytes.subarray(-4).toString()).toBe('PAR1');
+    });
+  });
+});
@@ -0,0 +1,275 @@
+import { prisma } from '@/lib/prisma';
+
+// Admin table configuration
+const PAGE_SIZE = parseInt(process.env.ADMIN_TABLE_PAGE_SIZE || '25');
+// Unfiltered tables with more rows than this show the pg_class estimate
+const EXACT_COUNT_THRESHOLD = parseInt(process.env.ADMIN_EXACT_COUNT_THRESHOLD || '50000');
+// Filtered counts stop here and display as "10,000+"
+const FILTERED_COUNT_CAP = 10000;
+
+export type SortDirection = 'asc' | 'desc';
+type SortType = 'date' | 'string' | 'number';
+
+/**
+ * A server-side admin table. Every sortable field must be non-null and backed
+ * by an index ending in `id` (e.g. @@index([createdAt, id])) so each page is a
+ * single index range scan; filters should hit indexed columns too.
+ */
+export interface TableDefinition {
+  table: string; // Postgres table name, for approximate counts
+  sorts: Record<string, SortType>;
+  defaultSort: string;
+  defaultDirection: SortDirection;
+  // Query param -> indexed field and the values it may take (param value -> DB value)
+  filters?: Record<string, { field: string; values: Record<string, unknown> }>;
+}
+
+export interface TableQuery {
+  sort: string;
+  direction: SortDirection;
+  after?: string;
+  before?: string;
+  filters: Record<string, string>;
+  pageSize: number;
+}
+
+export interface TableTotal {
+  count: number;
+  kind: 'exact' | 'estimate' | 'capped';
+}
+
+export interface TablePage<T> {
+  rows: T[];
+  nextCursor: string | null;
+  prevCursor: string | null;
+  total: TableTotal;
+}
+
+// Prisma args shared by every model delegate
+export interface TableFindArgs {
+  where: Record<string, any>;
+  orderBy: Array<Record<string, any>>;
+  take: number;
+}
+
+type SearchParams = Record<string, string | string[] | undefined>;
+
+function param(searchParams: SearchParams, name: string): string | undefined {
+  const value = searchParams[name];
+  return Array.isArray(value) ? value[0] : value;
+}
+
+/**
+ * Read sort, direction, cursor and filter params, ignoring unknown values
+ */
+export function parseTableQuery(
+  definition: TableDefinition,
+  searchParams: SearchParams
+): TableQuery {
+  const sortParam = param(searchParams, 'sort');
+  const sort = sortParam && definition.sorts[sortParam] ? sortParam : definition.defaultSort;
+  const dirParam = param(searchParams, 'dir');
+  const direction =
+    dirParam === 'asc' || dirParam === 'desc'
+      ? dirParam
+      : sort === definition.defaultSort
+        ? definition.defaultDirection
+        : 'asc';
+
+  const filters: Record<string, string> = {};
+  for (const [name, filter] of Object.entries(definition.filters ?? {})) {
+    const value = param(searchParams, name);
+    if (value && value in filter.values) filters[name] = value;
+  }
+
+  return {
+    sort,
+    direction,
+    after: param(searchParams, 'after'),
+    before: param(searchParams, 'before'),
+    filters,
+    pageSize: PAGE_SIZE,
+  };
+}
+
+// Cursors are the sort value and id of the boundary row, base64url-encoded
+function encodeCursor(value: unknown, id: string): string {
+  const raw = value instanceof Date ? value.toISOString() : value;
+  return Buffer.from(JSON.stringify([raw, id])).toString('base64url');
+}
+
+function decodeCursor(cursor: string, type: SortType): [unknown, string] | null {
+  try {
+    const [raw, id] = JSON.parse(Buffer.from(cursor, 'base64url').toString());
+    if (typeof id !== 'string') return null;
+    const value = type === 'date' ? new Date(raw) : raw;
+    if (type === 'date' && isNaN((value as Date).getTime())) return null;
+    if (type === 'number' && typeof value !== 'number') return null;
+    if (type === 'string' && typeof value !== 'string') return null;
+    return [value, id];
+  } catch {
+    return null;
+  }
+}
+
+/**
+ * Rows strictly after (value, id) in the given direction. The redundant
+ * lte/gte bound gives Postgres an index range condition instead of a filter.
+ */
+function keysetWhere(field: string, direction: SortDirection, value: unknown, id: string) {
+  const op = direction === 'desc' ? 'lt' : 'gt';
+  const bound = direction === 'desc' ? 'lte' : 'gte';
+  return {
+    AND: [
+      { [field]: { [bound]: value } },
+      { OR: [{ [field]: { [op]: value } }, { [field]: value, id: { [op]: id } }] },
+    ],
+  };
+}
+
+/**
+ * Planner estimate of a table's row count from pg_class (-1 if never analyzed)
+ */
+export async function estimateRowCount(table: string): Promise<number> {
+  const rows = await prisma.$queryRaw<Array<{ estimate: number | null }>>`
+    SELECT reltuples::float8 AS "estimate" FROM pg_class WHERE oid = to_regclass(${table})
+  `;
+  return rows[0]?.estimate ?? -1;
+}
+
+/**
+ * Total for the table header: the pg_class estimate for large unfiltered
+ * tables, otherwise an exact count (capped when filtered)
+ */
+async function getTableTotal(
+  definition: TableDefinition,
+  where: Record<string, any>,
+  count: (args: { where: Record<string, any>; take?: number }) => Promise<number>
+): Promise<TableTotal> {
+  if (Object.keys(where).length > 0) {
+    const counted = await count({ where, take: FILTERED_COUNT_CAP + 1 });
+    return counted > FILTERED_COUNT_CAP
+      ? { count: FILTERED_COUNT_CAP, kind: 'capped' }
+      : { count: counted, kind: 'exact' };
+  }
+
+  const estimate = await estimateRowCount(definition.table);
+  if (estimate >= EXACT_COUNT_THRESHOLD) {
+    return { count: Math.round(estimate), kind: 'estimate' };
+  }
+  return { count: await count({ where }), kind: 'exact' };
+}
+
+/**
+ * Fetch one keyset page plus its total. `findMany` and `count` wrap the model
+ * delegate so callers keep their own include/select.
+ */
+export async function fetchTablePage<T extends { id: string }>(
+  definition: TableDefinition,
+  query: TableQuery,
+  findMany: (args: TableFindArgs) => Promise<T[]>,
+  count: (args: { where: Record<string, any>; take?: number }) => Promise<number>
+): Promise<TablePage<T>> {
+  const type = definition.sorts[query.sort];
+  const filterWhere: Record<string, any> = {};
+  for (const [name, value] of Object.entries(query.filters)) {
+    const filter = definition.filters![name];
+    filterWhere[filter.field] = filter.values[value];
+  }
+
+  // Paging backwards reads in the opposite order, then flips the rows
+  const backwards = !query.after && !!query.before;
+  const cursor = decodeCursor((backwards ? query.before : query.after) ?? '', type);
+  const flip = (dir: SortDirection): SortDirection => (dir === 'asc' ? 'desc' : 'asc');
+  const readDirection = backwards ? flip(query.direction) : query.direction;
+
+  const where = cursor
+    ? { ...filterWhere, ...keysetWhere(query.sort, readDirection, cursor[0], cursor[1]) }
+    : filterWhere;
+
+  const [fetched, total] = await Promise.all([
+    findMany({
+      where,
+      orderBy: [{ [query.sort]: readDirection }, { id: readDirection }],
+      take: query.pageSize + 1,
+    }),
+    getTableTotal(definition, filterWhere, count),
+  ]);
+
+  const hasMore = fetched.length > query.pageSize;
+  const rows = fetched.slice(0, query.pageSize);
+  if (backwards) rows.reverse();
+
+  const first = rows[0] as Record<string, any> | undefined;
+  const last = rows[rows.length - 1] as Record<string, any> | undefined;
+  const hasNext = backwards ? true : hasMore;
+  const hasPrev = backwards ? hasMore : !!cursor;
+
+  return {
+    rows,
+    nextCursor: hasNext && last ? encodeCursor(last[query.sort], last.id) : null,
+    prevCursor: hasPrev && first ? encodeCursor(first[query.sort], first.id) : null,
+    total,
+  };
+}
+
+/**
+ * Row counts per value of an enum column (e.g. status) for summary cards.
+ * Large tables use the planner's most-common-value frequencies from pg_stats
+ * instead of counting.
+ */
+export async function countByValue(
+  table: string,
+  column: string,
+  exact: () => Promise<Record<string, number>>
+): Promise<{ counts: Record<string, number>; approximate: boolean }> {
+  const estimate = await estimateRowCount(table);
+  if (estimate < EXACT_COUNT_THRESHOLD) {
+    return { counts: await exact(), approximate: false };
+  }
+
+  const stats = await prisma.$queryRaw<Array<{ vals: string; freqs: number[] }>>`
+    SELECT most_common_vals::text AS "vals", most_common_freqs AS "freqs"
+    FROM pg_stats
+    WHERE schemaname = current_schema() AND tablename = ${table} AND attname = ${column}
+  `;
+  const counts: Record<string, number> = {};
+  if (stats[0]) {
+    const values = stats[0].vals.replace(/^\{|\}$/g, '').split(',');
+    values.forEach((value, i) => {
+      counts[value] = Math.round(stats[0].freqs[i] * estimate);
+    });
+  }
+  return { counts, approximate: true };
+}
+
+/**
+ * Format a total for display: "1,234", "≈1.2M" or "10,000+"
+ */
+export function formatTotal(total: TableTotal): string {
+  if (total.kind === 'capped') return `${total.count.toLocaleString('en-IN')}+`;
+  if (total.kind === 'estimate') {
+    return `≈${Intl.NumberFormat('en', { notation: 'compact' }).format(total.count)}`;
+  }
+  return total.count.toLocaleString('en-IN');
+}
+
+/**
+ * Query string for a table link, keeping the current sort and filters
+ */
+export function tableHref(
+  basePath: string,
+  query: TableQuery,
+  changes: Record<string, string | undefined>
+): string {
+  const params = new URLSearchParams();
+  params.set('sort', query.sort);
+  params.set('dir', query.direction);
+  for (const [name, value] of Object.entries(query.filters)) params.set(name, value);
+
+  for (const [name, value] of Object.entries(changes)) {
+    if (value === undefined) params.delete(name);
+    else params.set(name, value);
+  }
+  return `${basePath}?${params.toString()}`;
+}
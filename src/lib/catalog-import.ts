@@ -0,0 +1,651 @@
+import { randomUUID } from 'crypto';
+import { Prisma } from '@prisma/client';
+import { z } from 'zod';
+import { prisma } from '@/lib/prisma';
+
+// Catalog import configuration
+const BATCH_SIZE = parseInt(process.env.CATALOG_IMPORT_BATCH_SIZE || '500');
+const MAX_REPORTED_ERRORS = 1000;
+
+export type ImportFormat = 'csv' | 'jsonl';
+
+const MERCHANTS = ['AMAZON', 'FLIPKART', 'OTHER'] as const;
+
+// CSV columns holding one affiliate URL each (JSONL uses an affiliateLinks array)
+const AFFILIATE_COLUMNS: Record<string, (typeof MERCHANTS)[number]> = {
+  amazonUrl: 'AMAZON',
+  flipkartUrl: 'FLIPKART',
+  otherUrl: 'OTHER',
+};
+
+const FLAG_FIELDS = [
+  'isPalmOilFree',
+  'isArtificialColorFree',
+  'isLowSugar',
+  'isWholeGrain',
+  'isMeetsStandard',
+] as const;
+
+const TRUE_VALUES = ['true', '1', 'yes', 'y'];
+
+const csvBoolean = z.preprocess(
+  (value) => (typeof value === 'string' ? TRUE_VALUES.includes(value.toLowerCase()) : value),
+  z.boolean()
+);
+
+const csvJson = z.preprocess((value) => {
+  if (typeof value !== 'string') return value;
+  try {
+    return JSON.parse(value);
+  } catch {
+    return value; // rejected by the schema below
+  }
+}, z.record(z.unknown()).or(z.array(z.unknown())));
+
+/**
+ * One catalog row. Brand and category are slugs; brandName / categoryName
+ * create the brand or category if the slug does not exist yet. Badges are
+ * badge codes. Omitted fields keep their current value on update.
+ */
+const importRowSchema = z.object({
+  slug: z
+    .string()
+    .regex(/^[a-z0-9]+(?:-[a-z0-9]+)*$/, 'slug must be lowercase words separated by hyphens'),
+  title: z.string().min(1, 'title is required'),
+  brand: z.string().min(1, 'brand is required'),
+  brandName: z.string().optional(),
+  category: z.string().min(1, 'category is required'),
+  categoryName: z.string().optional(),
+  description: z.string().optional(),
+  heroImage: z.string().optional(),
+  galleryJson: csvJson.optional(),
+  shortSummary: z.string().optional(),
+  nutritionJson: csvJson.optional(),
+  ingredientsText: z.string().optional(),
+  allergensText: z.string().optional(),
+  healthScore: z.coerce.number().int().min(0).max(100).optional(),
+  isPalmOilFree: csvBoolean.optional(),
+  isArtificialColorFree: csvBoolean.optional(),
+  isLowSugar: csvBoolean.optional(),
+  isWholeGrain: csvBoolean.optional(),
+  isMeetsStandard: csvBoolean.optional(),
+  badges: z
+    .preprocess(
+      (value) => (typeof value === 'string' ? value.split('|').filter(Boolean) : value),
+      z.array(z.string())
+    )
+    .optional(),
+  affiliateLinks: z
+    .array(z.object({ merchant: z.enum(MERCHANTS), url: z.string().url() }))
+    .optional(),
+});
+
+export type ImportRow = z.infer<typeof importRowSchema>;
+
+export interface RowError {
+  line: number;
+  slug?: string;
+  error: string;
+}
+
+export interface ImportReport {
+  processed: number;
+  created: number;
+  updated: number;
+  failed: number;
+  skipped: number;
+  brandsCreated: number;
+  categoriesCreated: number;
+  lastLine: number; // source line of the last row read
+  durationMs: number;
+  dryRun: boolean;
+  errors: RowError[]; // first MAX_REPORTED_ERRORS only
+}
+
+export interface ImportOptions {
+  format: ImportFormat;
+  dryRun?: boolean;
+  // Data rows to skip, for resuming: processed + failed + skipped of the last progress report
+  skip?: number;
+  batchSize?: number;
+  onProgress?: (report: ImportReport) => void;
+}
+
+interface SourceRecord {
+  line: number;
+  data?: Record<string, unknown>;
+  error?: string;
+}
+
+interface ResolvedRow {
+  line: number;
+  row: ImportRow;
+  brandId: string;
+  categoryId: string;
+  badgeIds?: string[];
+}
+
+// ============================================================================
+// STREAM READERS
+// ============================================================================
+
+/**
+ * Adapt a web ReadableStream (e.g. request.body) to an async iterable
+ */
+export async function* readableStreamChunks(
+  stream: ReadableStream<Uint8Array>
+): AsyncGenerator<Uint8Array> {
+  const reader = stream.getReader();
+  try {
+    while (true) {
+      const { done, value } = await reader.read();
+      if (done) return;
+      yield value;
+    }
+  } finally {
+    reader.releaseLock();
+  }
+}
+
+async function* decodeChunks(
+  chunks: AsyncIterable<Uint8Array | string>
+): AsyncGenerator<string> {
+  const decoder = new TextDecoder();
+  for await (const chunk of chunks) {
+    yield typeof chunk === 'string' ? chunk : decoder.decode(chunk, { stream: true });
+  }
+  const rest = decoder.decode();
+  if (rest) yield rest;
+}
+
+/**
+ * Split streamed text into lines, numbering them from 1
+ */
+export async function* readLines(
+  chunks: AsyncIterable<Uint8Array | string>
+): AsyncGenerator<{ line: number; text: string }> {
+  let buffer = '';
+  let line = 0;
+
+  for await (const text of decodeChunks(chunks)) {
+    buffer += text;
+    let newline: number;
+    while ((newline = buffer.indexOf('\n')) !== -1) {
+      yield { line: ++line, text: buffer.slice(0, newline).replace(/\r$/, '') };
+      buffer = buffer.slice(newline + 1);
+    }
+  }
+  if (buffer) yield { line: ++line, text: buffer.replace(/\r$/, '') };
+}
+
+/**
+ * Parse streamed RFC 4180 CSV into records (quoted fields may contain commas,
+ * doubled quotes and newlines). `line` is where the record starts.
+ */
+export async function* readCsvRecords(
+  chunks: AsyncIterable<Uint8Array | string>
+): AsyncGenerator<{ line: number; fields: string[] }> {
+  let fields: string[] = [];
+  let field = '';
+  let inQuotes = false;
+  let pendingQuote = false; // saw a quote inside a quoted field; next char decides
+  let line = 1;
+  let recordLine = 1;
+
+  const endRecord = () => {
+    fields.push(field);
+    const record = { line: recordLine, fields };
+    fields = [];
+    field = '';
+    return record;
+  };
+
+  for await (const text of decodeChunks(chunks)) {
+    for (const char of text) {
+      if (pendingQuote) {
+        pendingQuote = false;
+        if (char === '"') {
+          field += '"';
+          continue;
+        }
+        inQuotes = false;
+      }
+
+      if (inQuotes) {
+        if (char === '"') pendingQuote = true;
+        else {
+          if (char === '\n') line++;
+          field += char;
+        }
+        continue;
+      }
+
+      if (char === '"' && field === '') {
+        inQuotes = true;
+      } else if (char === ',') {
+        fields.push(field);
+        field = '';
+      } else if (char === '\n') {
+        const record = endRecord();
+        line++;
+        recordLine = line;
+        if (record.fields.length > 1 || record.fields[0] !== '') yield record;
+      } else if (char !== '\r') {
+        field += char;
+      }
+    }
+  }
+
+  if (field !== '' || fields.length > 0) yield endRecord();
+}
+
+async function* readSourceRecords(
+  chunks: AsyncIterable<Uint8Array | string>,
+  format: ImportFormat
+): AsyncGenerator<SourceRecord> {
+  if (format === 'jsonl') {
+    for await (const { line, text } of readLines(chunks)) {
+      if (!text.trim()) continue;
+      try {
+        yield { line, data: JSON.parse(text) };
+      } catch {
+        yield { line, error: 'Invalid JSON' };
+      }
+    }
+    return;
+  }
+
+  let header: string[] | undefined;
+  for await (const { line, fields } of readCsvRecords(chunks)) {
+    if (!header) {
+      header = fields.map((name) => name.trim());
+      continue;
+    }
+
+    const data: Record<string, unknown> = {};
+    const affiliateLinks: Array<{ merchant: string; url: string }> = [];
+    header.forEach((name, i) => {
+      const value = fields[i]?.trim();
+      if (!value) return;
+      if (AFFILIATE_COLUMNS[name]) {
+        affiliateLinks.push({ merchant: AFFILIATE_COLUMNS[name], url: value });
+      } else {
+        data[name] = value;
+      }
+    });
+    if (affiliateLinks.length > 0) data.affiliateLinks = affiliateLinks;
+
+    yield { line, data };
+  }
+}
+
+/**
+ * Validate one source record, returning the row or an error message
+ */
+export function parseImportRow(data: unknown): { row?: ImportRow; error?: string } {
+  const result = importRowSchema.safeParse(data);
+  if (!result.success) {
+    const issue = result.error.errors[0];
+    const path = issue.path.join('.');
+    return { error: path ? `${path}: ${issue.message}` : issue.message };
+  }
+  return { row: result.data };
+}
+
+// ============================================================================
+// SLUG LOOKUP
+// ============================================================================
+
+/**
+ * Brand, category and badge ids by slug/code, loaded once per import so rows
+ * resolve without a query each
+ */
+class CatalogLookup {
+  brands = new Map<string, string>();
+  categories = new Map<string, string>();
+  badges = new Map<string, string>();
+
+  async load() {
+    const [brands, categories, badges] = await Promise.all([
+      prisma.brand.findMany({ select: { id: true, slug: true } }),
+      prisma.category.findMany({ select: { id: true, slug: true } }),
+      prisma.badge.findMany({ select: { id: true, code: true } }),
+    ]);
+    brands.forEach((brand) => this.brands.set(brand.slug, brand.id));
+    categories.forEach((category) => this.categories.set(category.slug, category.id));
+    badges.forEach((badge) => this.badges.set(badge.code.toUpperCase(), badge.id));
+  }
+}
+
+// ============================================================================
+// BATCH WRITES
+// ============================================================================
+
+/**
+ * Create brands/categories referenced by name but missing from the lookup.
+ * ON CONFLICT keeps this safe if another import created them meanwhile.
+ */
+async function createMissingTaxonomy(
+  table: 'brands' | 'categories',
+  lookup: Map<string, string>,
+  missing: Map<string, string> // slug -> name
+): Promise<number> {
+  if (missing.size === 0) return 0;
+
+  const values = [...missing].map(
+    ([slug, name]) => Prisma.sql`(${randomUUID()}, ${name}, ${slug}, NOW(), NOW())`
+  );
+  const created = await prisma.$executeRaw`
+    INSERT INTO ${Prisma.raw(`"${table}"`)} ("id", "name", "slug", "createdAt", "updatedAt")
+    VALUES ${Prisma.join(values)}
+    ON CONFLICT ("slug") DO NOTHING
+  `;
+
+  const rows = await prisma.$queryRaw<Array<{ id: string; slug: string }>>`
+    SELECT "id", "slug" FROM ${Prisma.raw(`"${table}"`)}
+    WHERE "slug" IN (${Prisma.join([...missing.keys()])})
+  `;
+  rows.forEach((row) => lookup.set(row.slug, row.id));
+  return created;
+}
+
+function jsonValue(value: unknown) {
+  return value === undefined ? null : JSON.stringify(value);
+}
+
+/**
+ * Upsert a batch of products (plus badges and affiliate links) in one
+ * transaction. Returns how many products were created and updated.
+ */
+async function writeBatch(rows: ResolvedRow[]): Promise<{ created: number; updated: number }> {
+  const productValues = rows.map(
+    ({ row, brandId, categoryId }) => Prisma.sql`(
+      ${randomUUID()}, ${row.slug}, ${row.title}, ${brandId}, ${categoryId},
+      ${row.description ?? null}, ${row.heroImage ?? null}, ${jsonValue(row.galleryJson)}::jsonb,
+      ${row.shortSummary ?? null}, ${jsonValue(row.nutritionJson)}::jsonb,
+      ${row.ingredientsText ?? null}, ${row.allergensText ?? null}, ${row.healthScore ?? null}::int,
+      ${Prisma.join(FLAG_FIELDS.map((flag) => Prisma.sql`${row[flag] ?? null}::boolean`))}
+    )`
+  );
+  const valuesTable = Prisma.sql`(VALUES ${Prisma.join(productValues)}) AS v(
+    "id", "slug", "title", "brandId", "categoryId", "description", "heroImage", "galleryJson",
+    "shortSummary", "nutritionJson", "ingredientsText", "allergensText", "healthScore",
+    "isPalmOilFree", "isArtificialColorFree", "isLowSugar", "isWholeGrain", "isMeetsStandard"
+  )`;
+
+  return prisma.$transaction(async (tx) => {
+    // Update existing slugs first; omitted (null) fields keep their value
+    const updated = await tx.$queryRaw<Array<{ id: string; slug: string }>>`
+      UPDATE "products" p SET
+        "title" = v."title",
+        "brandId" = v."brandId",
+        "categoryId" = v."categoryId",
+        "description" = COALESCE(v."description", p."description"),
+        "heroImage" = COALESCE(v."heroImage", p."heroImage"),
+        "galleryJson" = COALESCE(v."galleryJson", p."galleryJson"),
+        "shortSummary" = COALESCE(v."shortSummary", p."shortSummary"),
+        "nutritionJson" = COALESCE(v."nutritionJson", p."nutritionJson"),
+        "ingredientsText" = COALESCE(v."ingredientsText", p."ingredientsText"),
+        "allergensText" = COALESCE(v."allergensText", p."allergensText"),
+        "healthScore" = COALESCE(v."healthScore", p."healthScore"),
+        "isPalmOilFree" = COALESCE(v."isPalmOilFree", p."isPalmOilFree"),
+        "isArtificialColorFree" = COALESCE(v."isArtificialColorFree", p."isArtificialColorFree"),
+        "isLowSugar" = COALESCE(v."isLowSugar", p."isLowSugar"),
+        "isWholeGrain" = COALESCE(v."isWholeGrain", p."isWholeGrain"),
+        "isMeetsStandard" = COALESCE(v."isMeetsStandard", p."isMeetsStandard"),
+        "updatedAt" = NOW()
+      FROM ${valuesTable}
+      WHERE p."slug" = v."slug"
+      RETURNING p."id", p."slug"
+    `;
+
+    const created = await tx.$queryRaw<Array<{ id: string; slug: string }>>`
+      INSERT INTO "products" (
+        "id", "slug", "title", "brandId", "categoryId", "description", "heroImage", "galleryJson",
+        "shortSummary", "nutritionJson", "ingredientsText", "allergensText", "healthScore",
+        "isPalmOilFree", "isArtificialColorFree", "isLowSugar", "isWholeGrain", "isMeetsStandard",
+        "createdAt", "updatedAt"
+      )
+      SELECT
+        v."id", v."slug", v."title", v."brandId", v."categoryId", v."description", v."heroImage",
+        v."galleryJson", v."shortSummary", v."nutritionJson", v."ingredientsText",
+        v."allergensText", COALESCE(v."healthScore", 0),
+        COALESCE(v."isPalmOilFree", false), COALESCE(v."isArtificialColorFree", false),
+        COALESCE(v."isLowSugar", false), COALESCE(v."isWholeGrain", false),
+        COALESCE(v."isMeetsStandard", false), NOW(), NOW()
+      FROM ${valuesTable}
+      WHERE NOT EXISTS (SELECT 1 FROM "products" p WHERE p."slug" = v."slug")
+      RETURNING "id", "slug"
+    `;
+
+    const productIds = new Map([...updated, ...created].map((p) => [p.slug, p.id]));
+
+    // Badges: make each listed product's badges exactly the listed set
+    const withBadges = rows.filter((r) => r.badgeIds !== undefined);
+    if (withBadges.length > 0) {
+      const ids = withBadges.map((r) => productIds.get(r.row.slug)!);
+      const pairs = withBadges.flatMap((r) =>
+        r.badgeIds!.map((badgeId) => [productIds.get(r.row.slug)!, badgeId])
+      );
+
+      await tx.$executeRaw`
+        DELETE FROM "product_badges" pb
+        WHERE pb."productId" IN (${Prisma.join(ids)})
+        ${
+          pairs.length > 0
+            ? Prisma.sql`AND ("productId", "badgeId") NOT IN (${Prisma.join(
+                pairs.map(([productId, badgeId]) => Prisma.sql`(${productId}, ${badgeId})`)
+              )})`
+            : Prisma.empty
+        }
+      `;
+
+      if (pairs.length > 0) {
+        await tx.$executeRaw`
+          INSERT INTO "product_badges" ("id", "productId", "badgeId", "createdAt")
+          VALUES ${Prisma.join(
+            pairs.map(
+              ([productId, badgeId]) =>
+                Prisma.sql`(${randomUUID()}, ${productId}, ${badgeId}, NOW())`
+            )
+          )}
+          ON CONFLICT ("productId", "badgeId") DO NOTHING
+        `;
+      }
+    }
+
+    // Affiliate links: update the product's link for each merchant in place
+    // (keeping its id, which /api/affiliate/[id] URLs point at) or add one
+    const links = rows.flatMap(({ row }) => {
+      const byMerchant = new Map((row.affiliateLinks ?? []).map((l) => [l.merchant, l.url]));
+      return [...byMerchant].map(([merchant, url]) => ({
+        productId: productIds.get(row.slug)!,
+        merchant,
+        url,
+      }));
+    });
+
+    if (links.length > 0) {
+      const linkValues = Prisma.sql`(VALUES ${Prisma.join(
+        links.map(
+          (link) => Prisma.sql`(
+            ${randomUUID()}, ${link.productId}, ${link.merchant}::"AffiliateMerchant", ${link.url}
+          )`
+        )
+      )}) AS v("id", "productId", "merchant", "url")`;
+
+      await tx.$executeRaw`
+        UPDATE "affiliate_links" a SET "url" = v."url", "isActive" = true, "updatedAt" = NOW()
+        FROM ${linkValues}
+        WHERE a."productId" = v."productId" AND a."merchant" = v."merchant"
+      `;
+      await tx.$executeRaw`
+        INSERT INTO "affiliate_links" (
+          "id", "productId", "merchant", "url", "isActive", "createdAt", "updatedAt"
+        )
+        SELECT v."id", v."productId", v."merchant", v."url", true, NOW(), NOW()
+        FROM ${linkValues}
+        WHERE NOT EXISTS (
+          SELECT 1 FROM "affiliate_links" a
+          WHERE a."productId" = v."productId" AND a."merchant" = v."merchant"
+        )
+      `;
+    }
+
+    return { created: created.length, updated: updated.length };
+  });
+}
+
+// ============================================================================
+// IMPORT
+// ============================================================================
+
+/**
+ * Stream a CSV or JSONL catalog into the database. Rows are upserted by slug,
+ * so re-running an import (or resuming with `skip`) is safe.
+ */
+export async function importCatalog(
+  chunks: AsyncIterable<Uint8Array | string>,
+  options: ImportOptions
+): Promise<ImportReport> {
+  const start = performance.now();
+  const batchSize = options.batchSize ?? BATCH_SIZE;
+  const dryRun = options.dryRun ?? false;
+  const report: ImportReport = {
+    processed: 0,
+    created: 0,
+    updated: 0,
+    failed: 0,
+    skipped: 0,
+    brandsCreated: 0,
+    categoriesCreated: 0,
+    lastLine: 0,
+    durationMs: 0,
+    dryRun,
+    errors: [],
+  };
+
+  const fail = (line: number, error: string, slug?: string) => {
+    report.failed++;
+    if (report.errors.length < MAX_REPORTED_ERRORS) report.errors.push({ line, slug, error });
+  };
+
+  const lookup = new CatalogLookup();
+  await lookup.load();
+
+  let batch: Array<{ line: number; row: ImportRow }> = [];
+  const batchSlugs = new Set<string>();
+
+  const flush = async () => {
+    if (batch.length === 0) return;
+    const rows = batch;
+    batch = [];
+    batchSlugs.clear();
+
+    // Create brands/categories named in this batch that do not exist yet
+    const missingBrands = new Map<string, string>();
+    const missingCategories = new Map<string, string>();
+    for (const { row } of rows) {
+      if (!lookup.brands.has(row.brand) && row.brandName) {
+        missingBrands.set(row.brand, row.brandName);
+      }
+      if (!lookup.categories.has(row.category) && row.categoryName) {
+        missingCategories.set(row.category, row.categoryName);
+      }
+    }
+    if (dryRun) {
+      report.brandsCreated += missingBrands.size;
+      report.categoriesCreated += missingCategories.size;
+      missingBrands.forEach((_, slug) => lookup.brands.set(slug, `dry-run:${slug}`));
+      missingCategories.forEach((_, slug) => lookup.categories.set(slug, `dry-run:${slug}`));
+    } else {
+      report.brandsCreated += await createMissingTaxonomy('brands', lookup.brands, missingBrands);
+      report.categoriesCreated += await createMissingTaxonomy(
+        'categories',
+        lookup.categories,
+        missingCategories
+      );
+    }
+
+    const resolved: ResolvedRow[] = [];
+    for (const { line, row } of rows) {
+      const brandId = lookup.brands.get(row.brand);
+      const categoryId = lookup.categories.get(row.category);
+      const unknownBadge = row.badges?.find((code) => !lookup.badges.has(code.toUpperCase()));
+
+      if (!brandId) {
+        fail(line, `Unknown brand "${row.brand}" (add brandName to create it)`, row.slug);
+      } else if (!categoryId) {
+        fail(line, `Unknown category "${row.category}" (add categoryName to create it)`, row.slug);
+      } else if (unknownBadge) {
+        fail(line, `Unknown badge "${unknownBadge}"`, row.slug);
+      } else {
+        const badgeIds = row.badges?.map((code) => lookup.badges.get(code.toUpperCase())!);
+        resolved.push({ line, row, brandId, categoryId, badgeIds });
+      }
+    }
+
+    if (dryRun || resolved.length === 0) {
+      report.processed += resolved.length;
+      return;
+    }
+
+    try {
+      const result = await writeBatch(resolved);
+      report.created += result.created;
+      report.updated += result.updated;
+      report.processed += resolved.length;
+    } catch (error) {
+      // Retry row by row so one bad row does not sink the whole batch
+      console.warn('⚠️ Catalog import batch failed, retrying rows individually:', error);
+      for (const row of resolved) {
+        try {
+          const result = await writeBatch([row]);
+          report.created += result.created;
+          report.updated += result.updated;
+          report.processed++;
+        } catch (rowError: any) {
+          fail(row.line, rowError.message?.split('\n').pop() || 'Database error', row.row.slug);
+        }
+      }
+    }
+
+    options.onProgress?.({ ...report, durationMs: Math.round(performance.now() - start) });
+  };
+
+  let seen = 0;
+  for await (const record of readSourceRecords(chunks, options.format)) {
+    report.lastLine = record.line;
+    if (seen++ < (options.skip ?? 0)) {
+      report.skipped++;
+      continue;
+    }
+
+    if (record.error) {
+      fail(record.line, record.error);
+      continue;
+    }
+
+    const { row, error } = parseImportRow(record.data);
+    if (!row) {
+      const slug = record.data?.slug;
+      fail(record.line, error!, typeof slug === 'string' ? slug : undefined);
+      continue;
+    }
+
+    // A repeated slug must land in a later batch so the last occurrence wins
+    if (batchSlugs.has(row.slug)) await flush();
+
+    batch.push({ line: record.line, row });
+    batchSlugs.add(row.slug);
+    if (batch.length >= batchSize) await flush();
+  }
+  await flush();
+
+  report.durationMs = Math.round(performance.now() - start);
+  console.log(
+    `📦 Catalog import${dryRun ? ' (dry run)' : ''}: ${report.created} created, ` +
+      `${report.updated} updated, ${report.failed} failed in ${report.durationMs}ms`
+  );
+  return report;
+}
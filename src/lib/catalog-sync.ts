@@ -0,0 +1,239 @@
+import { createHash } from 'crypto';
+import { prisma } from '@/lib/prisma';
+
+// Catalog sync configuration
+const PAGE_SIZE = parseInt(process.env.SYNC_PAGE_SIZE || '500');
+// Rows newer than this wait for the next sync, so a slow transaction that
+// commits late cannot land behind a cursor that has already moved past it
+const SETTLE_MS = parseInt(process.env.SYNC_SETTLE_SECONDS || '10') * 1000;
+export const TOMBSTONE_RETENTION_DAYS = parseInt(
+  process.env.SYNC_TOMBSTONE_RETENTION_DAYS || '90'
+);
+
+export const SYNC_ENTITIES = ['brands', 'categories', 'products', 'articles'] as const;
+export type SyncEntity = (typeof SYNC_ENTITIES)[number];
+
+// Last (timestamp, id) seen per entity, plus the tombstone position and the
+// time up to which every tombstone has been read
+type Position = [string, string];
+export type SyncCursor = Record<SyncEntity | 'deleted', Position> & { synced: string };
+
+export interface CatalogChanges {
+  reset: boolean; // client must drop its cache before applying this page
+  brands: unknown[];
+  categories: unknown[];
+  products: unknown[];
+  articles: unknown[];
+  deleted: Record<SyncEntity, string[]>;
+  cursor: string;
+  hasMore: boolean;
+}
+
+const EPOCH = new Date(0).toISOString();
+
+// Only what the app renders; badge and affiliate edits also touch the product
+const PRODUCT_SELECT = {
+  id: true,
+  slug: true,
+  title: true,
+  brandId: true,
+  categoryId: true,
+  description: true,
+  heroImage: true,
+  galleryJson: true,
+  shortSummary: true,
+  nutritionJson: true,
+  ingredientsText: true,
+  allergensText: true,
+  healthScore: true,
+  isPalmOilFree: true,
+  isArtificialColorFree: true,
+  isLowSugar: true,
+  isWholeGrain: true,
+  isMeetsStandard: true,
+  createdAt: true,
+  updatedAt: true,
+  badges: { select: { badge: { select: { id: true, code: true, name: true } } } },
+  affiliateLinks: {
+    where: { isActive: true },
+    select: { id: true, merchant: true, url: true },
+  },
+};
+
+const ARTICLE_SELECT = {
+  id: true,
+  slug: true,
+  title: true,
+  excerpt: true,
+  bodyMarkdown: true,
+  coverImage: true,
+  videoUrl: true,
+  category: true,
+  tags: true,
+  status: true,
+  publishedAt: true,
+  createdAt: true,
+  updatedAt: true,
+};
+
+const TAXONOMY_SELECT = { id: true, name: true, slug: true, createdAt: true, updatedAt: true };
+
+export function encodeSyncCursor(cursor: SyncCursor): string {
+  return Buffer.from(JSON.stringify(cursor)).toString('base64url');
+}
+
+/**
+ * Parse a client cursor, or null if it is malformed (the client then resyncs)
+ */
+export function decodeSyncCursor(value: string): SyncCursor | null {
+  try {
+    const cursor = JSON.parse(Buffer.from(value, 'base64url').toString());
+    for (const key of [...SYNC_ENTITIES, 'deleted'] as const) {
+      const position = cursor?.[key];
+      if (
+        !Array.isArray(position) ||
+        typeof position[1] !== 'string' ||
+        isNaN(new Date(position[0]).getTime())
+      ) {
+        return null;
+      }
+    }
+    // Cursors issued before `synced` existed are only known to be synced
+    // up to their last tombstone
+    cursor.synced ??= cursor.deleted[0];
+    if (typeof cursor.synced !== 'string' || isNaN(new Date(cursor.synced).getTime())) {
+      return null;
+    }
+    return cursor;
+  } catch {
+    return null;
+  }
+}
+
+/**
+ * Weak ETag for the state a client reaches at this cursor. A client sending
+ * it back with an unchanged cursor gets a 304. `synced` advances on every
+ * request, so only the positions go into the hash.
+ */
+export function syncEtag(cursor: string): string {
+  const decoded = decodeSyncCursor(cursor);
+  const positions = decoded ? JSON.stringify({ ...decoded, synced: undefined }) : cursor;
+  return `W/"${createHash('sha256').update(positions).digest('base64url').slice(0, 22)}"`;
+}
+
+/**
+ * Rows strictly after `position` by (field, id), up to `until`
+ */
+function changedSince(field: string, position: Position, until: Date) {
+  const [at, id] = [new Date(position[0]), position[1]];
+  return {
+    AND: [
+      { [field]: { gte: at, lte: until } },
+      { OR: [{ [field]: { gt: at } }, { [field]: at, id: { gt: id } }] },
+    ],
+  };
+}
+
+function lastPosition(
+  rows: Array<{ id: string } & Record<string, any>>,
+  field: string,
+  fallback: Position
+): Position {
+  const last = rows[rows.length - 1];
+  return last ? [(last[field] as Date).toISOString(), last.id] : fallback;
+}
+
+/**
+ * One page of catalog changes since `cursor` (null for a full sync). Each
+ * entity is read in (updatedAt, id) order from its own index, so an
+ * unchanged catalog costs one index probe per table.
+ */
+export async function getCatalogChanges(cursor: SyncCursor | null): Promise<CatalogChanges> {
+  const until = new Date(Date.now() - SETTLE_MS);
+
+  // Tombstones older than retention may be purged, so a client that has not
+  // read them for that long could have missed deletes; start it over instead.
+  // (A 304 leaves the client's cursor as is, so only a catalog unchanged for
+  // the whole retention period resets a client that syncs regularly.)
+  const horizon = Date.now() - TOMBSTONE_RETENTION_DAYS * 24 * 60 * 60 * 1000;
+  const reset = !cursor || new Date(cursor.synced).getTime() < horizon;
+
+  // A full sync has nothing to delete, so it skips the tombstones up to now
+  const from: SyncCursor =
+    cursor && !reset
+      ? cursor
+      : {
+          brands: [EPOCH, ''],
+          categories: [EPOCH, ''],
+          products: [EPOCH, ''],
+          articles: [EPOCH, ''],
+          deleted: [until.toISOString(), ''],
+          synced: until.toISOString(),
+        };
+  const page = (position: Position) => ({
+    where: changedSince('updatedAt', position, until),
+    orderBy: [{ updatedAt: 'asc' as const }, { id: 'asc' as const }],
+    take: PAGE_SIZE,
+  });
+
+  const [brands, categories, products, articles, tombstones] = await Promise.all([
+    prisma.brand.findMany({ ...page(from.brands), select: TAXONOMY_SELECT }),
+    prisma.category.findMany({ ...page(from.categories), select: TAXONOMY_SELECT }),
+    prisma.product.findMany({ ...page(from.products), select: PRODUCT_SELECT }),
+    prisma.article.findMany({ ...page(from.articles), select: ARTICLE_SELECT }),
+    prisma.syncTombstone.findMany({
+      where: changedSince('deletedAt', from.deleted, until),
+      orderBy: [{ deletedAt: 'asc' }, { id: 'asc' }],
+      take: PAGE_SIZE,
+    }),
+  ]);
+
+  const deleted: Record<SyncEntity, string[]> = {
+    brands: [],
+    categories: [],
+    products: [],
+    articles: [],
+  };
+  for (const tombstone of tombstones) {
+    deleted[tombstone.entity as SyncEntity]?.push(tombstone.entityId);
+  }
+  // Unpublishing an article removes it from the app just like deleting it
+  for (const article of articles) {
+    if (article.status !== 'PUBLISHED') deleted.articles.push(article.id);
+  }
+
+  const next: SyncCursor = {
+    brands: lastPosition(brands, 'updatedAt', from.brands),
+    categories: lastPosition(categories, 'updatedAt', from.categories),
+    products: lastPosition(products, 'updatedAt', from.products),
+    articles: lastPosition(articles, 'updatedAt', from.articles),
+    deleted: lastPosition(tombstones, 'deletedAt', from.deleted),
+    // A short tombstone page means every delete up to `until` has been read
+    synced: tombstones.length < PAGE_SIZE ? until.toISOString() : from.synced,
+  };
+
+  return {
+    reset,
+    brands,
+    categories,
+    products,
+    articles: articles.filter((article) => article.status === 'PUBLISHED'),
+    deleted,
+    cursor: encodeSyncCursor(next),
+    hasMore: [brands, categories, products, articles, tombstones].some(
+      (rows) => rows.length === PAGE_SIZE
+    ),
+  };
+}
+
+/**
+ * True if a page carries nothing for the client to apply
+ */
+export function isEmptyChanges(changes: CatalogChanges): boolean {
+  return (
+    !changes.reset &&
+    SYNC_ENTITIES.every(
+      (entity) => changes[entity].length === 0 && changes.deleted[entity].length === 0
+    )
+  );
+}
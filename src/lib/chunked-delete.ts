@@ -0,0 +1,45 @@
+// Chunked delete configuration
+const DEFAULT_CHUNK_SIZE = parseInt(process.env.MAINTENANCE_CHUNK_SIZE || '1000');
+const DEFAULT_PAUSE_MS = parseInt(process.env.MAINTENANCE_CHUNK_PAUSE_MS || '200');
+const DEFAULT_MAX_CHUNKS = parseInt(process.env.MAINTENANCE_MAX_CHUNKS || '500');
+
+export interface ChunkedDeleteOptions<T> {
+  /** Load up to `take` rows that should be deleted */
+  findBatch: (take: number) => Promise<T[]>;
+  /** Delete the given rows, returning how many were removed */
+  deleteBatch: (rows: T[]) => Promise<number>;
+  chunkSize?: number;
+  pauseMs?: number;
+  maxChunks?: number;
+}
+
+const sleep = (ms: number) => new Promise((resolve) => setTimeout(resolve, ms));
+
+/**
+ * Delete rows in small batches with a pause between them, so a large cleanup
+ * never holds locks (or saturates I/O) the way one big DELETE would.
+ * Stops when a batch comes back short or after maxChunks batches.
+ */
+export async function deleteInChunks<T>(options: ChunkedDeleteOptions<T>): Promise<number> {
+  const {
+    findBatch,
+    deleteBatch,
+    chunkSize = DEFAULT_CHUNK_SIZE,
+    pauseMs = DEFAULT_PAUSE_MS,
+    maxChunks = DEFAULT_MAX_CHUNKS,
+  } = options;
+
+  let deleted = 0;
+
+  for (let chunk = 0; chunk < maxChunks; chunk++) {
+    const rows = await findBatch(chunkSize);
+    if (rows.length === 0) break;
+
+    deleted += await deleteBatch(rows);
+
+    if (rows.length < chunkSize) break;
+    await sleep(pauseMs);
+  }
+
+  return deleted;
+}
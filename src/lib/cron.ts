@@ -0,0 +1,87 @@
+/**
+ * Minimal 5-field cron expressions (minute hour day-of-month month day-of-week),
+ * evaluated in UTC. Supports `*`, `*\/n`, numbers, ranges (`a-b`, `a-b/n`) and
+ * comma lists. Day-of-week is 0-6 with 0 = Sunday.
+ */
+
+const FIELD_RANGES: Array<[number, number]> = [
+  [0, 59], // minute
+  [0, 23], // hour
+  [1, 31], // day of month
+  [1, 12], // month
+  [0, 6], // day of week
+];
+
+export type CronSchedule = Array<Set<number>>;
+
+function parseField(field: string, [min, max]: [number, number]): Set<number> {
+  const values = new Set<number>();
+
+  for (const part of field.split(',')) {
+    const [range, stepText] = part.split('/');
+    const step = stepText ? parseInt(stepText) : 1;
+    let start = min;
+    let end = max;
+
+    if (range !== '*') {
+      const [from, to] = range.split('-').map((n) => parseInt(n));
+      start = from;
+      end = to ?? (stepText ? max : from);
+    }
+
+    if ([start, end, step].some(isNaN) || start < min || end > max || step < 1) {
+      throw new Error(`Invalid cron field "${field}"`);
+    }
+
+    for (let value = start; value <= end; value += step) {
+      values.add(value);
+    }
+  }
+
+  return values;
+}
+
+/**
+ * Parse a cron expression, throwing on invalid input
+ */
+export function parseCron(expression: string): CronSchedule {
+  const fields = expression.trim().split(/\s+/);
+  if (fields.length !== 5) {
+    throw new Error(`Cron expression must have 5 fields: "${expression}"`);
+  }
+  return fields.map((field, i) => parseField(field, FIELD_RANGES[i]));
+}
+
+/**
+ * Whether the schedule fires in the (UTC) minute containing `date`
+ */
+export function matchesCron(schedule: CronSchedule, date: Date): boolean {
+  const [minutes, hours, days, months, weekdays] = schedule;
+  return (
+    minutes.has(date.getUTCMinutes()) &&
+    hours.has(date.getUTCHours()) &&
+    days.has(date.getUTCDate()) &&
+    months.has(date.getUTCMonth() + 1) &&
+    weekdays.has(date.getUTCDay())
+  );
+}
+
+/**
+ * Most recent time at or before `now` the schedule fired, looking back at most
+ * `lookbackMinutes`. Returns null if it did not fire in that window.
+ */
+export function lastScheduledTime(
+  expression: string,
+  now: Date = new Date(),
+  lookbackMinutes: number = 7 * 24 * 60
+): Date | null {
+  const schedule = parseCron(expression);
+  const minute = new Date(now);
+  minute.setUTCSeconds(0, 0);
+
+  for (let i = 0; i <= lookbackMinutes; i++) {
+    if (matchesCron(schedule, minute)) return minute;
+    minute.setUTCMinutes(minute.getUTCMinutes() - 1);
+  }
+  return null;
+}
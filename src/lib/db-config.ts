@@ -0,0 +1,90 @@
+import os from 'os';
+
+/**
+ * How the app reaches Postgres.
+ * - direct: straight to the server, Prisma manages the pool
+ * - pgbouncer: through a transaction-mode pooler (pgbouncer, Neon "-pooler" host);
+ *   prepared statements are disabled because pooled connections are shared
+ */
+export type PoolMode = 'direct' | 'pgbouncer';
+
+export interface DatabaseConfig {
+  url: string | undefined; // undefined: let Prisma read DATABASE_URL itself
+  mode: PoolMode;
+  connectionLimit: number;
+  poolTimeoutSeconds: number;
+  serverless: boolean;
+}
+
+/**
+ * True on Vercel / Lambda, where every warm instance holds its own pool
+ */
+export function isServerlessRuntime(): boolean {
+  return Boolean(process.env.VERCEL || process.env.AWS_LAMBDA_FUNCTION_NAME);
+}
+
+function detectPoolMode(url: URL): PoolMode {
+  const configured = process.env.DB_POOL_MODE;
+  if (configured === 'direct' || configured === 'pgbouncer') return configured;
+
+  if (url.searchParams.get('pgbouncer') === 'true') return 'pgbouncer';
+  if (url.hostname.includes('-pooler.')) return 'pgbouncer'; // Neon pooled endpoint
+  if (url.port === '6432') return 'pgbouncer'; // pgbouncer default port
+  return 'direct';
+}
+
+function defaultConnectionLimit(serverless: boolean): number {
+  // One connection per function instance: concurrency comes from instances,
+  // and the pooler (or Postgres max_connections) is the real limit
+  if (serverless) return 1;
+  return os.cpus().length * 2 + 1; // Prisma's own default
+}
+
+/**
+ * Resolve DATABASE_URL plus pool settings into the URL handed to PrismaClient.
+ *
+ * Precedence for each setting: DB_* env var, then the value already in the
+ * URL, then the runtime default.
+ */
+export function getDatabaseConfig(): DatabaseConfig {
+  const raw = process.env.DATABASE_URL || '';
+  const serverless = isServerlessRuntime();
+
+  let url: URL;
+  try {
+    url = new URL(raw);
+  } catch {
+    // Let Prisma report the invalid/missing URL itself
+    return {
+      url: undefined,
+      mode: 'direct',
+      connectionLimit: defaultConnectionLimit(serverless),
+      poolTimeoutSeconds: 10,
+      serverless,
+    };
+  }
+
+  const mode = detectPoolMode(url);
+  const connectionLimit =
+    parseInt(process.env.DB_CONNECTION_LIMIT || '') ||
+    parseInt(url.searchParams.get('connection_limit') || '') ||
+    defaultConnectionLimit(serverless);
+  const poolTimeoutSeconds =
+    parseInt(process.env.DB_POOL_TIMEOUT_SECONDS || '') ||
+    parseInt(url.searchParams.get('pool_timeout') || '') ||
+    10;
+
+  url.searchParams.set('connection_limit', String(connectionLimit));
+  url.searchParams.set('pool_timeout', String(poolTimeoutSeconds));
+  if (mode === 'pgbouncer') {
+    url.searchParams.set('pgbouncer', 'true');
+  }
+
+  return {
+    url: url.toString(),
+    mode,
+    connectionLimit,
+    poolTimeoutSeconds,
+    serverless,
+  };
+}
@@ -0,0 +1,194 @@
+import { Prisma } from '@prisma/client';
+import { prisma } from '@/lib/prisma';
+import { recordPoolTimeout } from '@/lib/db-pool';
+
+// Health probe configuration
+const PROBE_INTERVAL_MS = parseInt(process.env.DB_HEALTH_PROBE_INTERVAL_MS || '15000');
+// Longer than the pool wait (DB_POOL_TIMEOUT_SECONDS) so a probe queued behind
+// a busy pool reports the pool timeout rather than a false outage
+const PROBE_TIMEOUT_MS = parseInt(process.env.DB_HEALTH_PROBE_TIMEOUT_MS || '15000');
+// Consecutive connection errors before the circuit opens
+const FAILURE_THRESHOLD = parseInt(process.env.DB_HEALTH_FAILURE_THRESHOLD || '3');
+
+// Prisma error codes that mean the database itself is unreachable. Pool
+// timeouts (P2024) are left out: a saturated pool only fails that request.
+const CONNECTION_ERROR_CODES = ['P1001', 'P1002', 'P1008', 'P1017'];
+const POOL_TIMEOUT_CODE = 'P2024';
+
+/**
+ * Current view of database availability
+ */
+export interface DatabaseHealth {
+  status: 'up' | 'down' | 'unknown';
+  circuit: 'closed' | 'open';
+  latencyMs: number | null;
+  lastCheckedAt: string | null;
+  consecutiveFailures: number;
+  circuitOpens: number; // times the circuit opened since startup
+  lastError: string | null;
+}
+
+class ProbeTimeoutError extends Error {
+  constructor() {
+    super(`Database probe timed out after ${PROBE_TIMEOUT_MS}ms`);
+    this.name = 'ProbeTimeoutError';
+  }
+}
+
+const globalForHealth = globalThis as unknown as {
+  databaseHealth: DatabaseHealth | undefined;
+  databaseProbeTimer: ReturnType<typeof setInterval> | undefined;
+  databaseProbeInFlight: boolean | undefined;
+};
+
+const health: DatabaseHealth = (globalForHealth.databaseHealth ??= {
+  status: 'unknown',
+  circuit: 'closed',
+  latencyMs: null,
+  lastCheckedAt: null,
+  consecutiveFailures: 0,
+  circuitOpens: 0,
+  lastError: null,
+});
+
+/**
+ * True for errors caused by the database being unreachable, as opposed to
+ * bad queries, pool timeouts or slow probes (which should not trip the circuit)
+ */
+export function isConnectionError(error: unknown): boolean {
+  if (error instanceof Prisma.PrismaClientInitializationError) return true;
+  if (error instanceof Prisma.PrismaClientRustPanicError) return true;
+  if (error instanceof Prisma.PrismaClientKnownRequestError) {
+    return CONNECTION_ERROR_CODES.includes(error.code);
+  }
+  return false;
+}
+
+function markHealthy(latencyMs: number) {
+  if (health.circuit === 'open') {
+    console.log('✅ Database reachable again, closing circuit');
+  }
+  health.status = 'up';
+  health.circuit = 'closed';
+  health.latencyMs = Math.round(latencyMs * 10) / 10;
+  health.lastCheckedAt = new Date().toISOString();
+  health.consecutiveFailures = 0;
+  health.lastError = null;
+}
+
+/**
+ * Count a connection error; the circuit opens once FAILURE_THRESHOLD of them
+ * arrive in a row
+ */
+function markUnavailable(error: unknown) {
+  health.consecutiveFailures += 1;
+  health.lastCheckedAt = new Date().toISOString();
+  health.lastError = error instanceof Error ? error.message : String(error);
+
+  if (health.consecutiveFailures < FAILURE_THRESHOLD) return;
+
+  if (health.circuit === 'closed') {
+    console.error('❌ Database unreachable, opening circuit:', error);
+    health.circuitOpens += 1;
+  }
+  health.status = 'down';
+  health.circuit = 'open';
+  health.latencyMs = null;
+}
+
+/**
+ * Record a probe that failed without proving the database is unreachable
+ * (timeout, pool timeout); the circuit is left as it is
+ */
+function markInconclusive(error: unknown) {
+  health.lastCheckedAt = new Date().toISOString();
+  health.lastError = error instanceof Error ? error.message : String(error);
+}
+
+/**
+ * Run `SELECT 1` with a timeout and update the circuit state. Only
+ * connection errors count towards opening the circuit.
+ */
+export async function probeDatabase(): Promise<DatabaseHealth> {
+  const start = performance.now();
+  let timeout: ReturnType<typeof setTimeout> | undefined;
+
+  try {
+    await Promise.race([
+      prisma.$queryRaw`SELECT 1`,
+      new Promise((_, reject) => {
+        timeout = setTimeout(() => reject(new ProbeTimeoutError()), PROBE_TIMEOUT_MS);
+      }),
+    ]);
+    markHealthy(performance.now() - start);
+  } catch (error) {
+    if (isConnectionError(error)) {
+      markUnavailable(error);
+    } else {
+      markInconclusive(error);
+    }
+  } finally {
+    clearTimeout(timeout);
+  }
+
+  return getDatabaseHealth();
+}
+
+function ensureProbeRunning() {
+  if (globalForHealth.databaseProbeTimer) return;
+
+  globalForHealth.databaseProbeTimer = setInterval(() => {
+    // The probe timeout can exceed the interval; never stack probes
+    if (globalForHealth.databaseProbeInFlight) return;
+    globalForHealth.databaseProbeInFlight = true;
+    probeDatabase()
+      .catch(() => {})
+      .finally(() => {
+        globalForHealth.databaseProbeInFlight = false;
+      });
+  }, PROBE_INTERVAL_MS);
+  globalForHealth.databaseProbeTimer.unref?.();
+}
+
+/**
+ * Snapshot of the last known database state
+ */
+export function getDatabaseHealth(): DatabaseHealth {
+  return { ...health };
+}
+
+/**
+ * False while the circuit is open. Starts the background probe on first use.
+ */
+export function isDatabaseAvailable(): boolean {
+  ensureProbeRunning();
+  return health.circuit === 'closed';
+}
+
+/**
+ * Run a query, or return the fallback immediately while the database is
+ * known to be down. Repeated connection failures open the circuit so the next
+ * requests skip the connection timeout until the probe succeeds again.
+ */
+export async function withDatabase<T, F>(query: () => Promise<T>, fallback: F): Promise<T | F> {
+  if (!isDatabaseAvailable()) {
+    return fallback;
+  }
+
+  try {
+    const result = await query();
+    health.consecutiveFailures = 0;
+    return result;
+  } catch (error) {
+    if (isConnectionError(error)) {
+      markUnavailable(error);
+    } else if (
+      error instanceof Prisma.PrismaClientKnownRequestError &&
+      error.code === POOL_TIMEOUT_CODE
+    ) {
+      recordPoolTimeout();
+    }
+    console.log('Database not available, using mock data');
+    return fallback;
+  }
+}
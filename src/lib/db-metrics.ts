@@ -0,0 +1,139 @@
+import { AsyncLocalStorage } from 'async_hooks';
+import type { NextRequest, NextResponse } from 'next/server';
+
+// DB metrics configuration
+const LOG_SAMPLE_RATE = parseFloat(process.env.DB_METRICS_LOG_SAMPLE_RATE || '0.05');
+const RECENT_LIMIT = 200;
+
+/**
+ * Query count and cumulative DB time attributed to one request (or job)
+ */
+export interface QueryMetrics {
+  route: string;
+  queryCount: number;
+  dbTimeMs: number;
+  totalMs: number;
+  operations: Record<string, number>; // "Product.findMany" -> count
+  startedAt: string;
+}
+
+const storage = new AsyncLocalStorage<QueryMetrics>();
+
+/**
+ * Whether internal metrics endpoints may respond (always outside production)
+ */
+export function areMetricsExposed(): boolean {
+  return process.env.NODE_ENV !== 'production' || process.env.DB_METRICS_EXPOSE === 'true';
+}
+
+const globalForMetrics = globalThis as unknown as {
+  recentQueryMetrics: QueryMetrics[] | undefined;
+};
+
+const recent = (globalForMetrics.recentQueryMetrics ??= []);
+
+/**
+ * Attribute one Prisma operation to the current request (called by the
+ * middleware registered in src/lib/prisma.ts; no-op outside a request scope)
+ */
+export function recordQuery(model: string | undefined, action: string, durationMs: number) {
+  const metrics = storage.getStore();
+  if (!metrics) return;
+
+  const key = model ? `${model}.${action}` : action;
+  metrics.queryCount += 1;
+  metrics.dbTimeMs += durationMs;
+  metrics.operations[key] = (metrics.operations[key] || 0) + 1;
+}
+
+/**
+ * Metrics for the request currently executing, if any
+ */
+export function getQueryMetrics(): QueryMetrics | undefined {
+  return storage.getStore();
+}
+
+/**
+ * Run fn with its Prisma queries attributed to `route`. Nested calls share
+ * the outer scope so a request is only recorded once.
+ */
+export async function runWithQueryMetrics<T>(route: string, fn: () => Promise<T>): Promise<T> {
+  if (storage.getStore()) return fn();
+
+  const metrics: QueryMetrics = {
+    route,
+    queryCount: 0,
+    dbTimeMs: 0,
+    totalMs: 0,
+    operations: {},
+    startedAt: new Date().toISOString(),
+  };
+  const start = performance.now();
+
+  try {
+    return await storage.run(metrics, fn);
+  } finally {
+    metrics.totalMs = performance.now() - start;
+    finishMetrics(metrics);
+  }
+}
+
+/**
+ * Wrap a route handler so its response carries Server-Timing and query-count headers
+ */
+export function withDbMetrics<Args extends unknown[]>(
+  route: string,
+  handler: (request: NextRequest, ...args: Args) => Promise<NextResponse>
+) {
+  return async (request: NextRequest, ...args: Args): Promise<NextResponse> => {
+    let metrics: QueryMetrics | undefined;
+    const response = await runWithQueryMetrics(route, async () => {
+      metrics = storage.getStore();
+      return handler(request, ...args);
+    });
+
+    if (metrics) {
+      response.headers.set('Server-Timing', formatServerTiming(metrics));
+      response.headers.set('X-DB-Query-Count', String(metrics.queryCount));
+    }
+    return response;
+  };
+}
+
+/**
+ * Format metrics as a Server-Timing header value
+ */
+export function formatServerTiming(metrics: QueryMetrics): string {
+  return [
+    `db;dur=${metrics.dbTimeMs.toFixed(1)};desc="${metrics.queryCount} queries"`,
+    `total;dur=${metrics.totalMs.toFixed(1)}`,
+  ].join(', ');
+}
+
+/**
+ * Most recent recorded requests, newest first, optionally for one route
+ */
+export function getRecentQueryMetrics(route?: string): QueryMetrics[] {
+  const records = route ? recent.filter((m) => m.route === route) : recent;
+  return [...records].reverse();
+}
+
+function finishMetrics(metrics: QueryMetrics) {
+  recent.push(metrics);
+  if (recent.length > RECENT_LIMIT) {
+    recent.splice(0, recent.length - RECENT_LIMIT);
+  }
+
+  if (Math.random() < LOG_SAMPLE_RATE) {
+    console.log(
+      '🗄️ DB metrics',
+      JSON.stringify({
+        route: metrics.route,
+        queryCount: metrics.queryCount,
+        dbTimeMs: Math.round(metrics.dbTimeMs * 10) / 10,
+        totalMs: Math.round(metrics.totalMs * 10) / 10,
+        operations: metrics.operations,
+      })
+    );
+  }
+}
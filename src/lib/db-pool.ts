@@ -0,0 +1,70 @@
+import { prisma } from '@/lib/prisma';
+import { getDatabaseConfig, PoolMode } from '@/lib/db-config';
+
+/**
+ * Connection pool snapshot from Prisma's metrics preview feature
+ */
+export interface PoolStats {
+  mode: PoolMode;
+  open: number;
+  busy: number; // active connections
+  idle: number;
+  waiting: number; // queries waiting for a free connection
+  limit: number;
+  saturation: number; // busy / limit, 0-1
+  waitTime: {
+    count: number; // queries that went through the pool since startup
+    avgMs: number;
+  };
+  timeouts: number; // queries that gave up waiting for a connection (P2024)
+}
+
+const globalForPool = globalThis as unknown as { poolTimeouts: number | undefined };
+
+/**
+ * Count a query that timed out waiting for a free connection
+ */
+export function recordPoolTimeout() {
+  globalForPool.poolTimeouts = (globalForPool.poolTimeouts ?? 0) + 1;
+}
+
+/**
+ * Read current pool gauges and wait-time histogram. Returns null if metrics
+ * are unavailable.
+ */
+export async function getPoolStats(): Promise<PoolStats | null> {
+  try {
+    const { gauges, histograms } = await prisma.$metrics.json();
+    const gauge = (key: string) => gauges.find((g) => g.key === key)?.value ?? 0;
+    const wait = histograms.find((h) => h.key === 'prisma_client_queries_wait_histogram_ms');
+
+    const { mode, connectionLimit } = getDatabaseConfig();
+    const busy = gauge('prisma_pool_connections_busy');
+    const waitCount = wait?.value.count ?? 0;
+
+    return {
+      mode,
+      open: gauge('prisma_pool_connections_open'),
+      busy,
+      idle: gauge('prisma_pool_connections_idle'),
+      waiting: gauge('prisma_client_queries_wait'),
+      limit: connectionLimit,
+      saturation: Math.round((busy / connectionLimit) * 100) / 100,
+      waitTime: {
+        count: waitCount,
+        avgMs: waitCount > 0 ? Math.round(((wait?.value.sum ?? 0) / waitCount) * 10) / 10 : 0,
+      },
+      timeouts: globalForPool.poolTimeouts ?? 0,
+    };
+  } catch (error) {
+    console.error('Pool metrics error:', error);
+    return null;
+  }
+}
+
+/**
+ * All Prisma client/pool metrics in Prometheus text format
+ */
+export async function getPoolMetricsPrometheus(): Promise<string> {
+  return prisma.$metrics.prometheus();
+}
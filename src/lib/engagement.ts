@@ -0,0 +1,221 @@
+import { Prisma } from '@prisma/client';
+import { prisma } from '@/lib/prisma';
+
+// Engagement counter configuration
+const BUCKET_MINUTES = parseInt(process.env.ENGAGEMENT_BUCKET_MINUTES || '60');
+const FLUSH_INTERVAL_MS = parseInt(process.env.ENGAGEMENT_FLUSH_INTERVAL_MS || '10000');
+const MAX_PENDING_KEYS = parseInt(process.env.ENGAGEMENT_MAX_PENDING_KEYS || '5000');
+
+/**
+ * Merchant value used for page views (clicks use the AffiliateMerchant value)
+ */
+export const NO_MERCHANT = 'NONE';
+
+export type EngagementKind = 'view' | 'click';
+
+/**
+ * One coalesced counter row: all views/clicks for a (product, merchant, bucket)
+ */
+export interface EngagementRow {
+  productId: string;
+  merchant: string;
+  bucketStart: Date;
+  views: number;
+  clicks: number;
+}
+
+export type EngagementSink = (rows: EngagementRow[]) => Promise<void>;
+
+export interface EngagementCounterOptions {
+  bucketMs: number;
+  flushIntervalMs: number;
+  maxPendingKeys: number;
+}
+
+/**
+ * In-process aggregator for product views and affiliate clicks.
+ *
+ * Every record() call only bumps an in-memory counter. Counters are flushed
+ * to the sink periodically (or when too many keys are pending), so the
+ * database sees one upsert per (product, merchant, bucket) per interval
+ * instead of one insert per page view.
+ *
+ * Counts are best-effort: anything recorded since the last flush (up to
+ * flushIntervalMs, or maxPendingKeys counters) is lost if the process exits
+ * first. The timer does not keep the process alive, so on serverless hosts
+ * an instance frozen or recycled between requests drops its pending counts.
+ */
+export class EngagementCounter {
+  private pending = new Map<string, EngagementRow>();
+  private timer: ReturnType<typeof setInterval> | null = null;
+  private flushing: Promise<void> | null = null;
+  private lastFlushFailed = false;
+
+  constructor(
+    private readonly sink: EngagementSink,
+    private readonly options: EngagementCounterOptions
+  ) {}
+
+  /**
+   * Number of distinct counters waiting to be flushed
+   */
+  get size(): number {
+    return this.pending.size;
+  }
+
+  /**
+   * Count a view or click. Never touches the database.
+   */
+  record(kind: EngagementKind, productId: string, merchant: string = NO_MERCHANT, at: Date = new Date()) {
+    const bucketStart = this.bucketFor(at);
+    const key = `${productId}|${merchant}|${bucketStart.getTime()}`;
+
+    let row = this.pending.get(key);
+    if (!row) {
+      row = { productId, merchant, bucketStart, views: 0, clicks: 0 };
+      this.pending.set(key, row);
+    }
+
+    if (kind === 'view') {
+      row.views += 1;
+    } else {
+      row.clicks += 1;
+    }
+
+    this.start();
+
+    if (this.pending.size >= this.options.maxPendingKeys) {
+      this.flush().catch(() => {});
+    }
+  }
+
+  /**
+   * Write all pending counters to the sink. Concurrent calls share one flush.
+   */
+  flush(): Promise<void> {
+    if (this.flushing) return this.flushing;
+    if (this.pending.size === 0) return Promise.resolve();
+
+    const batch = this.pending;
+    this.pending = new Map();
+
+    this.flushing = this.sink(Array.from(batch.values()))
+      .then(() => {
+        this.lastFlushFailed = false;
+      })
+      .catch((error) => {
+        this.lastFlushFailed = true;
+        // Put the counts back so they are retried on the next flush
+        console.error('Engagement flush error:', error);
+        batch.forEach((row, key) => {
+          const current = this.pending.get(key);
+          if (current) {
+            current.views += row.views;
+            current.clicks += row.clicks;
+          } else {
+            this.pending.set(key, row);
+          }
+        });
+      })
+      .finally(() => {
+        this.flushing = null;
+      });
+
+    return this.flushing;
+  }
+
+  /**
+   * Start the periodic flush timer (idempotent)
+   */
+  start() {
+    if (this.timer) return;
+    this.timer = setInterval(() => {
+      this.flush().catch(() => {});
+    }, this.options.flushIntervalMs);
+    // Don't keep the process alive just for counters
+    this.timer.unref?.();
+  }
+
+  /**
+   * Stop the timer and flush until nothing is left, including counts recorded
+   * while an earlier flush was in flight. Gives up after a failed flush; its
+   * counts stay pending.
+   */
+  async stop(): Promise<void> {
+    if (this.timer) {
+      clearInterval(this.timer);
+      this.timer = null;
+    }
+
+    while (this.flushing || this.pending.size > 0) {
+      await (this.flushing ?? this.flush());
+      if (this.lastFlushFailed) return;
+    }
+  }
+
+  private bucketFor(at: Date): Date {
+    const { bucketMs } = this.options;
+    return new Date(Math.floor(at.getTime() / bucketMs) * bucketMs);
+  }
+}
+
+/**
+ * Upsert coalesced rows in a single statement. Rows for products deleted
+ * since they were counted are skipped by the join instead of failing the batch.
+ */
+async function writeEngagementRows(rows: EngagementRow[]): Promise<void> {
+  if (rows.length === 0) return;
+
+  const values = rows.map(
+    (row) => Prisma.sql`(
+      ${`eng_${Date.now()}_${Math.random().toString(36).substr(2, 9)}`},
+      ${row.productId},
+      ${row.merchant},
+      ${row.bucketStart}::timestamp(3),
+      ${row.views}::int,
+      ${row.clicks}::int
+    )`
+  );
+
+  await prisma.$executeRaw`
+    INSERT INTO "product_engagement" ("id", "productId", "merchant", "bucketStart", "views", "clicks", "updatedAt")
+    SELECT v."id", v."productId", v."merchant", v."bucketStart", v."views", v."clicks", NOW()
+    FROM (VALUES ${Prisma.join(values)}) AS v("id", "productId", "merchant", "bucketStart", "views", "clicks")
+    JOIN "products" p ON p."id" = v."productId"
+    ON CONFLICT ("productId", "merchant", "bucketStart") DO UPDATE SET
+      "views" = "product_engagement"."views" + EXCLUDED."views",
+      "clicks" = "product_engagement"."clicks" + EXCLUDED."clicks",
+      "updatedAt" = NOW()
+  `;
+
+  console.log(`📊 Engagement: flushed ${rows.length} counters`);
+}
+
+const globalForEngagement = globalThis as unknown as {
+  engagementCounter: EngagementCounter | undefined;
+};
+
+export const engagementCounter =
+  globalForEngagement.engagementCounter ??
+  new EngagementCounter(writeEngagementRows, {
+    bucketMs: BUCKET_MINUTES * 60 * 1000,
+    flushIntervalMs: FLUSH_INTERVAL_MS,
+    maxPendingKeys: MAX_PENDING_KEYS,
+  });
+
+// Keep a single aggregator across hot reloads and route bundles
+globalForEngagement.engagementCounter = engagementCounter;
+
+/**
+ * Count a product page view
+ */
+export function recordProductView(productId: string): void {
+  engagementCounter.record('view', productId);
+}
+
+/**
+ * Count an outbound affiliate click
+ */
+export function recordAffiliateClick(productId: string, merchant: string): void {
+  engagementCounter.record('click', productId, merchant);
+}
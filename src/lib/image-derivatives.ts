@@ -0,0 +1,307 @@
+import { createHash } from 'crypto';
+import { mkdir, readFile, readdir, rename, stat, unlink, utimes, writeFile } from 'fs/promises';
+import { extname, join, normalize, sep } from 'path';
+import { JobQueue } from '@/lib/job-queue';
+import { isServerlessRuntime } from '@/lib/db-config';
+
+// Image derivative configuration
+export const DERIVATIVE_WIDTHS = [160, 320, 480, 640, 960, 1280];
+export const DERIVATIVE_FORMATS = ['avif', 'webp'] as const;
+const IMAGE_CONCURRENCY = parseInt(process.env.IMAGE_CONCURRENCY || '2');
+// Beyond this many waiting jobs, requests get the original image instead
+const MAX_QUEUED = parseInt(process.env.IMAGE_MAX_QUEUED || '50');
+const CACHE_MAX_BYTES = parseInt(process.env.IMAGE_CACHE_MAX_MB || '512') * 1024 * 1024;
+const CACHE_DIR =
+  process.env.IMAGE_CACHE_DIR ||
+  (isServerlessRuntime()
+    ? '/tmp/image-derivatives'
+    : join(process.cwd(), '.next', 'cache', 'derivatives'));
+const PUBLIC_DIR = join(process.cwd(), 'public');
+const SOURCE_EXTENSIONS = ['.jpg', '.jpeg', '.png', '.webp', '.avif', '.gif', '.tif', '.tiff'];
+const QUALITY = { avif: 50, webp: 75 };
+const SOURCE_INFO_LIMIT = 5000;
+
+export type DerivativeFormat = (typeof DERIVATIVE_FORMATS)[number];
+
+/**
+ * srcset strings for each format, for a <picture> element
+ */
+export interface ImageVariants {
+  avif: string;
+  webp: string;
+}
+
+/**
+ * Content hash and intrinsic width of a source image (what derivative URLs
+ * are built from)
+ */
+export interface SourceInfo {
+  hash: string;
+  width: number;
+}
+
+export interface Derivative {
+  body: Buffer;
+  contentType: string;
+  current: boolean; // false if the URL's hash no longer matches the source
+}
+
+/**
+ * Size-capped derivative cache on disk. Map order is recency (oldest first);
+ * after a restart it is rebuilt from file mtimes, which hits refresh.
+ */
+export class DiskLru {
+  private entries = new Map<string, number>(); // file name -> bytes
+  private totalBytes = 0;
+  private loaded: Promise<void> | null = null;
+
+  constructor(
+    private readonly dir: string,
+    private readonly maxBytes: number
+  ) {}
+
+  private load(): Promise<void> {
+    this.loaded ??= (async () => {
+      await mkdir(this.dir, { recursive: true });
+      const names = await readdir(this.dir);
+      const files = await Promise.all(
+        names
+          .filter((name) => !name.endsWith('.tmp'))
+          .map(async (name) => ({ name, info: await stat(join(this.dir, name)) }))
+      );
+      files.sort((a, b) => a.info.mtimeMs - b.info.mtimeMs);
+      for (const { name, info } of files) {
+        this.entries.set(name, info.size);
+        this.totalBytes += info.size;
+      }
+    })();
+    return this.loaded;
+  }
+
+  async get(name: string): Promise<Buffer | null> {
+    await this.load();
+    const size = this.entries.get(name);
+    if (size === undefined) return null;
+
+    try {
+      const body = await readFile(join(this.dir, name));
+      this.entries.delete(name);
+      this.entries.set(name, size);
+      const now = new Date();
+      utimes(join(this.dir, name), now, now).catch(() => {});
+      return body;
+    } catch {
+      this.remove(name, size);
+      return null;
+    }
+  }
+
+  async put(name: string, body: Buffer): Promise<void> {
+    await this.load();
+    const path = join(this.dir, name);
+    // Write then rename so readers never see a partial file
+    await writeFile(`${path}.tmp`, body);
+    await rename(`${path}.tmp`, path);
+
+    const previous = this.entries.get(name);
+    if (previous !== undefined) this.remove(name, previous, false);
+    this.entries.set(name, body.length);
+    this.totalBytes += body.length;
+    await this.evict();
+  }
+
+  private remove(name: string, size: number, unlinkFile = true) {
+    this.entries.delete(name);
+    this.totalBytes -= size;
+    if (unlinkFile) unlink(join(this.dir, name)).catch(() => {});
+  }
+
+  private async evict() {
+    while (this.totalBytes > this.maxBytes && this.entries.size > 1) {
+      const [oldest, size] = this.entries.entries().next().value as [string, number];
+      this.remove(oldest, size);
+    }
+  }
+
+  get stats() {
+    return { files: this.entries.size, bytes: this.totalBytes, maxBytes: this.maxBytes };
+  }
+}
+
+const globalForImages = globalThis as unknown as {
+  imageQueue: JobQueue | undefined;
+  imageCache: DiskLru | undefined;
+  imageSourceInfo: Map<string, SourceInfo> | undefined;
+  imageInFlight: Map<string, Promise<Buffer>> | undefined;
+};
+
+// sharp is multi-threaded itself, so a small pool keeps CPU use bounded
+const queue = (globalForImages.imageQueue ??= new JobQueue(IMAGE_CONCURRENCY));
+const cache = (globalForImages.imageCache ??= new DiskLru(CACHE_DIR, CACHE_MAX_BYTES));
+// "path:mtime:size" -> content hash and intrinsic width
+const sourceInfo = (globalForImages.imageSourceInfo ??= new Map());
+const inFlight = (globalForImages.imageInFlight ??= new Map());
+
+/**
+ * Filesystem path for a public image URL, or null if it is not a local
+ * image inside public/
+ */
+export function resolveImageSource(src: string): string | null {
+  if (!src.startsWith('/') || src.startsWith('//')) return null;
+
+  let decoded: string;
+  try {
+    decoded = decodeURIComponent(src.split('?')[0]);
+  } catch {
+    return null;
+  }
+
+  const path = join(PUBLIC_DIR, normalize(decoded));
+  if (!path.startsWith(PUBLIC_DIR + sep)) return null;
+  if (!SOURCE_EXTENSIONS.includes(extname(path).toLowerCase())) return null;
+  return path;
+}
+
+async function getSourceInfo(path: string): Promise<SourceInfo | null> {
+  const info = await stat(path).catch(() => null);
+  if (!info?.isFile()) return null;
+
+  const key = `${path}:${info.mtimeMs}:${info.size}`;
+  const cached = sourceInfo.get(key);
+  if (cached) return cached;
+
+  const body = await readFile(path);
+  const sharp = (await import('sharp')).default;
+  const metadata = await sharp(body).metadata();
+  const result = {
+    hash: createHash('sha256').update(body).digest('hex').slice(0, 16),
+    width: metadata.width ?? 0,
+  };
+
+  if (sourceInfo.size >= SOURCE_INFO_LIMIT) sourceInfo.clear();
+  sourceInfo.set(key, result);
+  return result;
+}
+
+function derivativeUrl(src: string, hash: string, width: number, format: DerivativeFormat) {
+  return `/img/${hash}/${width}.${format}?src=${encodeURIComponent(src)}`;
+}
+
+/**
+ * Hash and width of a public image, or null if it is remote or missing.
+ * Reads and hashes the whole file unless it is cached for this process.
+ */
+export async function getImageInfo(src: string): Promise<SourceInfo | null> {
+  const path = resolveImageSource(src);
+  return path ? getSourceInfo(path) : null;
+}
+
+/**
+ * srcsets for an image whose hash and width are already known (e.g. stored
+ * at upload time), without touching the file
+ */
+export function imageVariantsFromInfo(src: string, info: SourceInfo): ImageVariants | null {
+  const widths = DERIVATIVE_WIDTHS.filter((width) => width <= info.width);
+  if (widths.length === 0) return null;
+
+  const srcSet = (format: DerivativeFormat) =>
+    widths.map((width) => `${derivativeUrl(src, info.hash, width, format)} ${width}w`).join(', ');
+  return { avif: srcSet('avif'), webp: srcSet('webp') };
+}
+
+/**
+ * srcsets of content-hashed derivative URLs for a public image, or null if
+ * the image is remote, missing or too small to be worth resizing
+ */
+export async function getImageVariants(
+  src: string | null | undefined
+): Promise<ImageVariants | null> {
+  const info = src ? await getImageInfo(src).catch(() => null) : null;
+  return src && info ? imageVariantsFromInfo(src, info) : null;
+}
+
+/**
+ * Add heroImageVariants to each item (products for ProductCard)
+ */
+export async function withImageVariants<T extends { heroImage?: string | null }>(
+  items: T[]
+): Promise<Array<T & { heroImageVariants: ImageVariants | null }>> {
+  const variants = await Promise.all(items.map((item) => getImageVariants(item.heroImage)));
+  return items.map((item, i) => ({ ...item, heroImageVariants: variants[i] }));
+}
+
+async function generate(path: string, width: number, format: DerivativeFormat): Promise<Buffer> {
+  const sharp = (await import('sharp')).default;
+  return sharp(path)
+    .rotate() // apply EXIF orientation before stripping metadata
+    .resize({ width, withoutEnlargement: true })
+    .toFormat(format, { quality: QUALITY[format] })
+    .toBuffer();
+}
+
+/**
+ * Load a derivative from the cache, generating it on the worker pool on a
+ * miss. Returns null for invalid requests, or 'busy' when the pool is backed up.
+ */
+export async function getDerivative(
+  src: string,
+  hash: string,
+  width: number,
+  format: string
+): Promise<Derivative | 'busy' | null> {
+  if (!DERIVATIVE_WIDTHS.includes(width)) return null;
+  if (!DERIVATIVE_FORMATS.includes(format as DerivativeFormat)) return null;
+
+  const path = resolveImageSource(src);
+  const info = path ? await getSourceInfo(path).catch(() => null) : null;
+  if (!path || !info) return null;
+
+  const derivativeFormat = format as DerivativeFormat;
+  const name = `${info.hash}-${width}.${derivativeFormat}`;
+  const contentType = `image/${derivativeFormat}`;
+  const current = info.hash === hash;
+
+  const cached = await cache.get(name);
+  if (cached) return { body: cached, contentType, current };
+
+  let pending = inFlight.get(name);
+  if (!pending) {
+    if (queue.pendingCount >= MAX_QUEUED) return 'busy';
+
+    pending = queue
+      .run(() => generate(path, width, derivativeFormat))
+      .then(async (body) => {
+        await cache.put(name, body);
+        return body;
+      })
+      .finally(() => inFlight.delete(name));
+    inFlight.set(name, pending);
+  }
+
+  return { body: await pending, contentType, current };
+}
+
+/**
+ * Pre-generate derivatives in the background (e.g. right after an upload)
+ */
+export function warmImageDerivatives(src: string, widths: number[] = [160, 480]): void {
+  const path = resolveImageSource(src);
+  if (!path) return;
+
+  getSourceInfo(path)
+    .then((info) => {
+      if (!info) return;
+      const jobs = widths.flatMap((width) =>
+        DERIVATIVE_FORMATS.map((format) => getDerivative(src, info.hash, width, format))
+      );
+      return Promise.all(jobs);
+    })
+    .catch((error) => console.error('Image warm-up failed:', error));
+}
+
+/**
+ * Derivative cache size and worker pool depth, for /api/health
+ */
+export function getImageCacheStats() {
+  return { ...cache.stats, active: queue.activeCount, waiting: queue.pendingCount };
+}
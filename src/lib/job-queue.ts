@@ -0,0 +1,45 @@
+/**
+ * Minimal in-process job queue with a concurrency limit.
+ *
+ * Jobs beyond the limit wait in FIFO order; a finishing job hands its slot
+ * directly to the next waiter so the limit is never exceeded.
+ */
+export class JobQueue {
+  private active = 0;
+  private waiting: Array<() => void> = [];
+
+  constructor(private readonly concurrency: number) {}
+
+  /**
+   * Jobs currently running
+   */
+  get activeCount(): number {
+    return this.active;
+  }
+
+  /**
+   * Jobs waiting for a free slot
+   */
+  get pendingCount(): number {
+    return this.waiting.length;
+  }
+
+  async run<T>(job: () => Promise<T>): Promise<T> {
+    if (this.active < this.concurrency) {
+      this.active++;
+    } else {
+      await new Promise<void>((resolve) => this.waiting.push(resolve));
+    }
+
+    try {
+      return await job();
+    } finally {
+      const next = this.waiting.shift();
+      if (next) {
+        next();
+      } else {
+        this.active--;
+      }
+    }
+  }
+}
@@ -1,8 +1,10 @@
+import { Ingredient } from '@prisma/client';
 import { prisma } from './prisma';
 import { normalizeIngredientName } from './ocr';
 
 export interface IngredientAnalysis {
   name: string;
+  ingredientId?: string; // matched Ingredient row, if any
   status: 'good' | 'moderate' | 'bad' | 'unknown';
   riskLevel?: 'LOW' | 'MODERATE' | 'HIGH';
   description?: string;
@@ -25,14 +27,27 @@ export interface LabelAnalysisResult {
   };
 }
 
-/**
- * Analyze extracted label data and generate health insights
- */
-export async function analyzeLabelData(data: {
+export interface LabelData {
   ingredients: string[];
   nutritionFacts: Record<string, string>;
   warnings: string[];
-}): Promise<LabelAnalysisResult> {
+}
+
+/**
+ * Analyze extracted label data and generate health insights
+ */
+export async function analyzeLabelData(data: LabelData): Promise<LabelAnalysisResult> {
+  // Load every candidate match in one query instead of one per ingredient
+  const candidates = await findIngredientCandidates(data.ingredients);
+  return scoreLabelData(data, candidates);
+}
+
+/**
+ * Score label data against already-loaded ingredients, ordered by id. Any
+ * superset of the matching candidates in that order gives the same result,
+ * so a batch can load them once.
+ */
+export function scoreLabelData(data: LabelData, candidates: Ingredient[]): LabelAnalysisResult {
   const ingredientAnalyses: IngredientAnalysis[] = [];
   const positives: string[] = [];
   const concerns: string[] = [];
@@ -43,14 +58,7 @@ export async function analyzeLabelData(data: {
     const normalized = normalizeIngredientName(ingredient);
 
     // Try to match with our ingredient database
-    const dbIngredient = await prisma.ingredient.findFirst({
-      where: {
-        OR: [
-          { name: { contains: normalized, mode: 'insensitive' } },
-          { slug: { contains: normalized, mode: 'insensitive' } },
-        ],
-      },
-    });
+    const dbIngredient = matchIngredient(normalized, candidates);
 
     if (dbIngredient) {
       const status =
@@ -62,6 +70,7 @@ export async function analyzeLabelData(data: {
 
       ingredientAnalyses.push({
         name: ingredient,
+        ingredientId: dbIngredient.id,
         status,
         riskLevel: dbIngredient.riskLevel,
         description: dbIngredient.description || undefined,
@@ -148,6 +157,50 @@ export async function analyzeLabelData(data: {
   };
 }
 
+/**
+ * Fetch all ingredients whose name or slug contains any of the given names
+ */
+async function findIngredientCandidates(ingredients: string[]): Promise<Ingredient[]> {
+  const names = Array.from(new Set(ingredients.map(normalizeIngredientName))).filter(Boolean);
+  if (names.length === 0) return [];
+
+  return prisma.ingredient.findMany({
+    where: {
+      OR: names.flatMap((name) => [
+        { name: { contains: name, mode: 'insensitive' as const } },
+        { slug: { contains: name, mode: 'insensitive' as const } },
+      ]),
+    },
+    // matchIngredient takes the first hit, so the order must not vary
+    orderBy: { id: 'asc' },
+  });
+}
+
+/**
+ * Reverse index rows for a scan: each distinct ingredient name on the label
+ * and the Ingredient it matched, so changes to that Ingredient (or a new one
+ * containing the name) can find the scans to re-score
+ */
+export function labelIngredientTerms(
+  analysis: LabelAnalysisResult
+): Array<{ term: string; ingredientId: string | null }> {
+  const terms = new Map<string, string | null>();
+  for (const ingredient of analysis.ingredients) {
+    const term = normalizeIngredientName(ingredient.name);
+    if (term && !terms.has(term)) terms.set(term, ingredient.ingredientId ?? null);
+  }
+  return Array.from(terms, ([term, ingredientId]) => ({ term, ingredientId }));
+}
+
+function matchIngredient(normalized: string, candidates: Ingredient[]): Ingredient | undefined {
+  if (!normalized) return undefined;
+  return candidates.find(
+    (candidate) =>
+      candidate.name.toLowerCase().includes(normalized) ||
+      candidate.slug.toLowerCase().includes(normalized)
+  );
+}
+
 function getRating(score: number): 'excellent' | 'good' | 'fair' | 'poor' | 'very_poor' {
   if (score >= 80) return 'excellent';
   if (score >= 65) return 'good';
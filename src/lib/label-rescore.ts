@@ -0,0 +1,277 @@
+import { Ingredient, Prisma } from '@prisma/client';
+import { prisma } from '@/lib/prisma';
+import { TOMBSTONE_RETENTION_DAYS } from '@/lib/catalog-sync';
+import {
+  LabelAnalysisResult,
+  LabelData,
+  labelIngredientTerms,
+  scoreLabelData,
+} from '@/lib/label-analysis';
+
+// Label re-scoring configuration
+const CHUNK_SIZE = parseInt(process.env.LABEL_RESCORE_CHUNK_SIZE || '200');
+const CONCURRENCY = parseInt(process.env.LABEL_RESCORE_CONCURRENCY || '4');
+
+export interface RescoreOptions {
+  // Re-score every completed scan (after a change to the scoring rules)
+  all?: boolean;
+  // Ingredient changes up to this time are already reflected in the scores
+  // (null on the first run: only scans missing from the index are scored)
+  since?: Date | null;
+  chunkSize?: number;
+  onProgress?: (result: RescoreResult) => void;
+}
+
+export interface RescoreResult {
+  scanned: number;
+  updated: number; // score or analysis changed (or the scan was first indexed)
+  unchanged: number;
+  conflicts: number; // re-scored concurrently by someone else; left as is
+}
+
+interface StoredScan {
+  id: string;
+  extractedData: Prisma.JsonValue;
+  analysisResult: Prisma.JsonValue;
+  scoredAt: Date | null;
+}
+
+interface ScanUpdate {
+  scan: StoredScan;
+  analysis: LabelAnalysisResult;
+}
+
+/**
+ * JSON with sorted keys. JSONB reorders object keys, so a stored analysis
+ * only compares equal to a fresh one in canonical form.
+ */
+function canonicalJson(value: unknown): string {
+  if (Array.isArray(value)) return `[${value.map(canonicalJson).join(',')}]`;
+  if (value && typeof value === 'object') {
+    const entries = Object.entries(value)
+      .filter(([, v]) => v !== undefined)
+      .sort(([a], [b]) => (a < b ? -1 : a > b ? 1 : 0));
+    return `{${entries.map(([k, v]) => `${JSON.stringify(k)}:${canonicalJson(v)}`).join(',')}}`;
+  }
+  return JSON.stringify(value);
+}
+
+/**
+ * Parsed label data as stored at scan time, or null for scans without it
+ */
+function storedLabelData(value: Prisma.JsonValue): LabelData | null {
+  const data = value as Partial<LabelData> | null;
+  if (!data || !Array.isArray(data.ingredients)) return null;
+  return {
+    ingredients: data.ingredients,
+    nutritionFacts: data.nutritionFacts ?? {},
+    warnings: data.warnings ?? [],
+  };
+}
+
+/**
+ * Re-score one chunk from its stored extractedData (no OCR) and write the
+ * changed ones back in a single transaction. A scan re-scored by someone else
+ * since it was read keeps their result.
+ */
+async function rescoreChunk(
+  ids: string[],
+  ingredients: Ingredient[]
+): Promise<RescoreResult> {
+  const scans: StoredScan[] = await prisma.labelScan.findMany({
+    where: { id: { in: ids }, status: 'COMPLETED' },
+    select: { id: true, extractedData: true, analysisResult: true, scoredAt: true },
+  });
+
+  const updates: ScanUpdate[] = [];
+  for (const scan of scans) {
+    const data = storedLabelData(scan.extractedData);
+    if (!data) continue;
+
+    const analysis = scoreLabelData(data, ingredients);
+    if (scan.scoredAt && canonicalJson(analysis) === canonicalJson(scan.analysisResult)) continue;
+    updates.push({ scan, analysis });
+  }
+
+  const result = {
+    scanned: scans.length,
+    updated: 0,
+    unchanged: scans.length - updates.length,
+    conflicts: 0,
+  };
+  if (updates.length === 0) return result;
+
+  const values = updates.map(
+    ({ scan, analysis }) => Prisma.sql`(
+      ${scan.id},
+      ${analysis.overallScore}::int,
+      ${JSON.stringify(analysis)}::jsonb,
+      ${scan.scoredAt}::timestamp(3)
+    )`
+  );
+
+  const written = await prisma.$transaction(async (tx) => {
+    const rows = await tx.$queryRaw<Array<{ id: string }>>`
+      UPDATE "label_scans" s SET
+        "healthScore" = v."healthScore",
+        "analysisResult" = v."analysisResult",
+        "scoredAt" = NOW(),
+        "updatedAt" = NOW()
+      FROM (VALUES ${Prisma.join(values)}) AS v("id", "healthScore", "analysisResult", "scoredAt")
+      WHERE s."id" = v."id"
+        AND s."status" = 'COMPLETED'
+        AND s."scoredAt" IS NOT DISTINCT FROM v."scoredAt"
+      RETURNING s."id"
+    `;
+    const writtenIds = new Set(rows.map((row) => row.id));
+    if (writtenIds.size === 0) return writtenIds;
+
+    await tx.labelScanIngredient.deleteMany({ where: { scanId: { in: [...writtenIds] } } });
+    const terms = updates
+      .filter(({ scan }) => writtenIds.has(scan.id))
+      .flatMap(({ scan, analysis }) =>
+        labelIngredientTerms(analysis).map((term) => ({ scanId: scan.id, ...term }))
+      );
+    if (terms.length > 0) await tx.labelScanIngredient.createMany({ data: terms });
+    return writtenIds;
+  });
+
+  result.updated = written.size;
+  result.conflicts = updates.length - written.size;
+  return result;
+}
+
+/**
+ * Ids of completed scans matching `where`, in id order
+ */
+async function* completedScanIds(
+  where: Prisma.LabelScanWhereInput,
+  chunkSize: number
+): AsyncGenerator<string[]> {
+  let after = '';
+  for (;;) {
+    const rows = await prisma.labelScan.findMany({
+      where: { ...where, status: 'COMPLETED', id: { gt: after } },
+      orderBy: { id: 'asc' },
+      take: chunkSize,
+      select: { id: true },
+    });
+    if (rows.length === 0) return;
+    yield rows.map((row) => row.id);
+    after = rows[rows.length - 1].id;
+  }
+}
+
+/**
+ * Scans whose score an ingredient change can affect, from the reverse index:
+ * scans that matched a changed or deleted Ingredient, plus scans with a name
+ * a changed Ingredient now contains (what matchIngredient would pick up)
+ */
+async function* affectedScanIds(
+  ingredients: Ingredient[],
+  since: Date,
+  chunkSize: number
+): AsyncGenerator<string[]> {
+  const changed = ingredients.filter((ingredient) => ingredient.updatedAt > since);
+  const deleted = await prisma.syncTombstone.findMany({
+    where: { entity: 'ingredients', deletedAt: { gt: since } },
+    select: { entityId: true },
+  });
+
+  const ingredientIds = [
+    ...changed.map((ingredient) => ingredient.id),
+    ...deleted.map((tombstone) => tombstone.entityId),
+  ];
+  if (ingredientIds.length === 0) return;
+
+  const names = changed.flatMap((ingredient) => [
+    ingredient.name.toLowerCase(),
+    ingredient.slug.toLowerCase(),
+  ]);
+  const terms = (
+    await prisma.$queryRaw<Array<{ term: string }>>`
+      SELECT DISTINCT "term" FROM "label_scan_ingredients"
+    `
+  )
+    .map((row) => row.term)
+    .filter((term) => names.some((name) => name.includes(term)));
+
+  const matches = [Prisma.sql`"ingredientId" IN (${Prisma.join(ingredientIds)})`];
+  if (terms.length > 0) matches.push(Prisma.sql`"term" IN (${Prisma.join(terms)})`);
+
+  let after = '';
+  for (;;) {
+    const rows = await prisma.$queryRaw<Array<{ scanId: string }>>`
+      SELECT DISTINCT "scanId" FROM "label_scan_ingredients"
+      WHERE (${Prisma.join(matches, ' OR ')}) AND "scanId" > ${after}
+      ORDER BY "scanId"
+      LIMIT ${chunkSize}
+    `;
+    if (rows.length === 0) return;
+    yield rows.map((row) => row.scanId);
+    after = rows[rows.length - 1].scanId;
+  }
+}
+
+/**
+ * Re-score historical label scans against the current Ingredient table,
+ * reusing each scan's stored extractedData instead of redoing OCR. Only scans
+ * an ingredient change since `since` can affect are re-scored (plus any not
+ * yet in the reverse index), unless `all` is set; chunks run in parallel.
+ */
+export async function rescoreLabelScans(options: RescoreOptions = {}): Promise<RescoreResult> {
+  const chunkSize = options.chunkSize ?? CHUNK_SIZE;
+  const since = options.since ?? null;
+  // Same order as findIngredientCandidates, so matches agree with scan time
+  const ingredients = await prisma.ingredient.findMany({ orderBy: { id: 'asc' } });
+
+  // Tombstones of deleted ingredients only go back so far; past that, a
+  // full pass is the only way to be sure nothing was missed
+  const horizon = Date.now() - TOMBSTONE_RETENTION_DAYS * 24 * 60 * 60 * 1000;
+  const all = options.all || (since !== null && since.getTime() < horizon);
+
+  const total: RescoreResult = { scanned: 0, updated: 0, unchanged: 0, conflicts: 0 };
+  const inFlight = new Set<Promise<void>>();
+  let failure: unknown = null;
+
+  const run = async (ids: string[]) => {
+    const result = await rescoreChunk(ids, ingredients);
+    total.scanned += result.scanned;
+    total.updated += result.updated;
+    total.unchanged += result.unchanged;
+    total.conflicts += result.conflicts;
+    options.onProgress?.({ ...total });
+  };
+
+  // Scans scored before the index existed have no index rows yet
+  const sources = all
+    ? [completedScanIds({}, chunkSize)]
+    : [
+        completedScanIds({ scoredAt: null }, chunkSize),
+        ...(since ? [affectedScanIds(ingredients, since, chunkSize)] : []),
+      ];
+
+  for (const source of sources) {
+    for await (const ids of source) {
+      // At most CONCURRENCY chunks in flight; the next is read once one finishes
+      while (inFlight.size >= CONCURRENCY) await Promise.race(inFlight);
+      if (failure) break;
+
+      const promise: Promise<void> = run(ids)
+        .catch((error) => {
+          failure ??= error;
+        })
+        .finally(() => inFlight.delete(promise));
+      inFlight.add(promise);
+    }
+    if (failure) break;
+  }
+  await Promise.all(inFlight);
+  if (failure) throw failure;
+
+  console.log(
+    `🔁 Re-scored label scans: ${total.updated} updated, ${total.unchanged} unchanged, ` +
+      `${total.conflicts} skipped (of ${total.scanned})`
+  );
+  return total;
+}
@@ -0,0 +1,379 @@
+import { randomUUID } from 'crypto';
+import { readdir, stat, unlink } from 'fs/promises';
+import { join } from 'path';
+import { prisma } from '@/lib/prisma';
+import { cleanupExpiredOTPs } from '@/lib/otp';
+import { cleanupOldTelemetry } from '@/lib/telemetry';
+import { deleteInChunks } from '@/lib/chunked-delete';
+import { lastScheduledTime } from '@/lib/cron';
+import { LABEL_UPLOAD_DIR, labelUploadPath, labelUploadUrl } from '@/lib/uploads';
+import { TOMBSTONE_RETENTION_DAYS } from '@/lib/catalog-sync';
+import { rescoreLabelScans } from '@/lib/label-rescore';
+
+// Maintenance configuration
+const LOCK_NAME = 'maintenance';
+const LOCK_TTL_MINUTES = parseInt(process.env.MAINTENANCE_LOCK_TTL_MINUTES || '15');
+const FAILED_SCAN_RETENTION_DAYS = parseInt(process.env.FAILED_SCAN_RETENTION_DAYS || '7');
+const TELEMETRY_RETENTION_DAYS = parseInt(process.env.TELEMETRY_RETENTION_DAYS || '90');
+// Uploads younger than this may belong to a scan that is still being created
+const ORPHAN_GRACE_MINUTES = parseInt(process.env.ORPHAN_UPLOAD_GRACE_MINUTES || '60');
+const ORPHAN_LOOKUP_BATCH = 500;
+
+/**
+ * What one job run reclaimed (or, for non-cleanup jobs, updated)
+ */
+export interface JobResult {
+  rowsDeleted: number;
+  rowsUpdated?: number;
+  bytesReclaimed: number;
+}
+
+export interface MaintenanceJob {
+  name: string;
+  description: string;
+  schedule: string; // cron expression, UTC
+  run: () => Promise<JobResult>;
+}
+
+export interface JobReport extends JobResult {
+  job: string;
+  status: 'SUCCESS' | 'FAILED' | 'SKIPPED';
+  durationMs: number;
+  error?: string;
+}
+
+export interface MaintenanceReport {
+  locked: boolean; // false if another runner held the lock
+  jobs: JobReport[];
+}
+
+async function fileSize(path: string): Promise<number> {
+  try {
+    return (await stat(path)).size;
+  } catch {
+    return 0;
+  }
+}
+
+/**
+ * Remove a file, returning the bytes freed (0 if it was already gone)
+ */
+async function removeFile(path: string): Promise<number> {
+  const size = await fileSize(path);
+  try {
+    await unlink(path);
+    return size;
+  } catch (error: any) {
+    if (error.code !== 'ENOENT') throw error;
+    return 0;
+  }
+}
+
+/**
+ * Delete FAILED scans past retention, along with their uploaded images
+ */
+async function cleanupFailedScans(): Promise<JobResult> {
+  const cutoff = new Date();
+  cutoff.setDate(cutoff.getDate() - FAILED_SCAN_RETENTION_DAYS);
+  let bytesReclaimed = 0;
+
+  const rowsDeleted = await deleteInChunks({
+    findBatch: (take) =>
+      prisma.labelScan.findMany({
+        where: { status: 'FAILED', createdAt: { lt: cutoff } },
+        select: { id: true, imageUrl: true },
+        orderBy: { createdAt: 'asc' },
+        take,
+      }),
+    deleteBatch: async (rows) => {
+      const result = await prisma.labelScan.deleteMany({
+        where: { id: { in: rows.map((row) => row.id) } },
+      });
+
+      for (const row of rows) {
+        const path = labelUploadPath(row.imageUrl);
+        if (path) bytesReclaimed += await removeFile(path);
+      }
+      return result.count;
+    },
+  });
+
+  console.log(`🧹 Cleaned up ${rowsDeleted} failed label scans`);
+  return { rowsDeleted, bytesReclaimed };
+}
+
+/**
+ * Delete uploaded label images that no LabelScan row refers to
+ */
+async function cleanupOrphanedUploads(): Promise<JobResult> {
+  let fileNames: string[];
+  try {
+    fileNames = await readdir(LABEL_UPLOAD_DIR);
+  } catch (error: any) {
+    if (error.code === 'ENOENT') return { rowsDeleted: 0, bytesReclaimed: 0 };
+    throw error;
+  }
+
+  const graceCutoff = Date.now() - ORPHAN_GRACE_MINUTES * 60 * 1000;
+  let bytesReclaimed = 0;
+  let filesDeleted = 0;
+
+  for (let i = 0; i < fileNames.length; i += ORPHAN_LOOKUP_BATCH) {
+    const batch = fileNames.slice(i, i + ORPHAN_LOOKUP_BATCH);
+    const urls = batch.map(labelUploadUrl);
+
+    const referenced = await prisma.labelScan.findMany({
+      where: { imageUrl: { in: urls } },
+      select: { imageUrl: true },
+    });
+    const referencedUrls = new Set(referenced.map((scan) => scan.imageUrl));
+
+    for (const fileName of batch) {
+      if (referencedUrls.has(labelUploadUrl(fileName))) continue;
+
+      const path = join(LABEL_UPLOAD_DIR, fileName);
+      const info = await stat(path).catch(() => null);
+      if (!info || !info.isFile() || info.mtimeMs > graceCutoff) continue;
+
+      bytesReclaimed += await removeFile(path);
+      filesDeleted++;
+    }
+  }
+
+  console.log(`🧹 Removed ${filesDeleted} orphaned label uploads`);
+  return { rowsDeleted: 0, bytesReclaimed };
+}
+
+/**
+ * Delete shared rate limit buckets that have been idle long enough to be full again
+ */
+async function cleanupRateLimitBuckets(): Promise<JobResult> {
+  const rowsDeleted = await prisma.$executeRaw`
+    DELETE FROM "rate_limit_buckets" WHERE "updatedAt" < NOW() - INTERVAL '1 day'
+  `;
+  console.log(`🧹 Cleaned up ${rowsDeleted} idle rate limit buckets`);
+  return { rowsDeleted, bytesReclaimed: 0 };
+}
+
+/**
+ * Delete sync tombstones past retention; clients whose cursor is older than
+ * that resync from scratch instead
+ */
+async function cleanupSyncTombstones(): Promise<JobResult> {
+  const rowsDeleted = await prisma.$executeRaw`
+    DELETE FROM "sync_tombstones"
+    WHERE "deletedAt" < NOW() - make_interval(days => ${TOMBSTONE_RETENTION_DAYS}::int)
+  `;
+  console.log(`🧹 Cleaned up ${rowsDeleted} sync tombstones`);
+  return { rowsDeleted, bytesReclaimed: 0 };
+}
+
+/**
+ * Re-score label scans affected by Ingredient changes since the last
+ * successful run of this job
+ */
+async function rescoreStaleLabelScans(): Promise<JobResult> {
+  const lastRun = await prisma.maintenanceRun.findFirst({
+    where: { job: 'label-rescore', status: 'SUCCESS' },
+    orderBy: { startedAt: 'desc' },
+    select: { startedAt: true },
+  });
+
+  const { updated } = await rescoreLabelScans({ since: lastRun?.startedAt ?? null });
+  return { rowsDeleted: 0, rowsUpdated: updated, bytesReclaimed: 0 };
+}
+
+/**
+ * Registered maintenance jobs
+ */
+export const MAINTENANCE_JOBS: MaintenanceJob[] = [
+  {
+    name: 'expired-otps',
+    description: 'Delete expired login OTPs',
+    schedule: '*/30 * * * *',
+    run: async () => ({ rowsDeleted: await cleanupExpiredOTPs(), bytesReclaimed: 0 }),
+  },
+  {
+    name: 'failed-scans',
+    description: `Delete FAILED label scans older than ${FAILED_SCAN_RETENTION_DAYS} days`,
+    schedule: '15 3 * * *',
+    run: cleanupFailedScans,
+  },
+  {
+    name: 'orphaned-uploads',
+    description: 'Delete label images with no matching scan',
+    schedule: '30 3 * * *',
+    run: cleanupOrphanedUploads,
+  },
+  {
+    name: 'telemetry',
+    description: `Delete telemetry events older than ${TELEMETRY_RETENTION_DAYS} days`,
+    schedule: '45 3 * * *',
+    run: async () => ({
+      rowsDeleted: await cleanupOldTelemetry(TELEMETRY_RETENTION_DAYS),
+      bytesReclaimed: 0,
+    }),
+  },
+  {
+    name: 'rate-limit-buckets',
+    description: 'Delete rate limit buckets idle for over a day',
+    schedule: '0 4 * * *',
+    run: cleanupRateLimitBuckets,
+  },
+  {
+    name: 'sync-tombstones',
+    description: `Delete catalog sync tombstones older than ${TOMBSTONE_RETENTION_DAYS} days`,
+    schedule: '15 4 * * *',
+    run: cleanupSyncTombstones,
+  },
+  {
+    name: 'label-rescore',
+    description: 'Re-score label scans whose matched ingredients changed',
+    schedule: '50 3 * * *',
+    run: rescoreStaleLabelScans,
+  },
+];
+
+/**
+ * Take the single-runner lease. Succeeds if the lock is free or expired.
+ */
+export async function acquireLock(owner: string): Promise<boolean> {
+  const acquired = await prisma.$executeRaw`
+    INSERT INTO "maintenance_locks" ("name", "lockedBy", "lockedUntil")
+    VALUES (${LOCK_NAME}, ${owner}, NOW() + make_interval(mins => ${LOCK_TTL_MINUTES}::int))
+    ON CONFLICT ("name") DO UPDATE SET
+      "lockedBy" = EXCLUDED."lockedBy",
+      "lockedUntil" = EXCLUDED."lockedUntil"
+    WHERE "maintenance_locks"."lockedUntil" < NOW()
+  `;
+  return acquired === 1;
+}
+
+/**
+ * Extend the lease if this runner still holds it. False once it expired and
+ * another runner took it over.
+ */
+export async function renewLock(owner: string): Promise<boolean> {
+  const renewed = await prisma.$executeRaw`
+    UPDATE "maintenance_locks"
+    SET "lockedUntil" = NOW() + make_interval(mins => ${LOCK_TTL_MINUTES}::int)
+    WHERE "name" = ${LOCK_NAME} AND "lockedBy" = ${owner}
+  `;
+  return renewed === 1;
+}
+
+async function releaseLock(owner: string): Promise<void> {
+  await prisma.maintenanceLock.deleteMany({
+    where: { name: LOCK_NAME, lockedBy: owner },
+  });
+}
+
+/**
+ * A job is due if its schedule fired since its last run started
+ */
+export async function isJobDue(job: MaintenanceJob, now: Date): Promise<boolean> {
+  const scheduledAt = lastScheduledTime(job.schedule, now);
+  if (!scheduledAt) return false;
+
+  const lastRun = await prisma.maintenanceRun.findFirst({
+    where: { job: job.name },
+    orderBy: { startedAt: 'desc' },
+    select: { startedAt: true },
+  });
+
+  return !lastRun || lastRun.startedAt < scheduledAt;
+}
+
+async function runJob(job: MaintenanceJob): Promise<JobReport> {
+  const startedAt = new Date();
+  const start = performance.now();
+  let report: JobReport;
+
+  try {
+    const result = await job.run();
+    report = { job: job.name, status: 'SUCCESS', durationMs: 0, ...result };
+  } catch (error: any) {
+    console.error(`❌ Maintenance job ${job.name} failed:`, error);
+    report = {
+      job: job.name,
+      status: 'FAILED',
+      durationMs: 0,
+      rowsDeleted: 0,
+      bytesReclaimed: 0,
+      error: error.message,
+    };
+  }
+  report.durationMs = Math.round(performance.now() - start);
+
+  await prisma.maintenanceRun.create({
+    data: {
+      job: job.name,
+      status: report.status === 'SUCCESS' ? 'SUCCESS' : 'FAILED',
+      rowsDeleted: report.rowsDeleted,
+      rowsUpdated: report.rowsUpdated ?? 0,
+      bytesReclaimed: BigInt(report.bytesReclaimed),
+      error: report.error,
+      startedAt,
+      finishedAt: new Date(),
+    },
+  });
+
+  return report;
+}
+
+/**
+ * Run every due job (or the named ones with force) under the single-runner lock
+ */
+export async function runMaintenance(
+  options: { jobs?: string[]; force?: boolean } = {}
+): Promise<MaintenanceReport> {
+  const owner = `${process.pid}-${randomUUID()}`;
+
+  if (!(await acquireLock(owner))) {
+    console.log('⏭️ Maintenance already running elsewhere, skipping');
+    return { locked: false, jobs: [] };
+  }
+
+  const now = new Date();
+  const jobs = options.jobs
+    ? MAINTENANCE_JOBS.filter((job) => options.jobs!.includes(job.name))
+    : MAINTENANCE_JOBS;
+  const reports: JobReport[] = [];
+  // Keep the lease alive while a long job runs
+  const heartbeat = setInterval(
+    () => renewLock(owner).catch(() => {}),
+    (LOCK_TTL_MINUTES * 60 * 1000) / 3
+  );
+
+  try {
+    for (const job of jobs) {
+      if (!options.force && !(await isJobDue(job, now))) {
+        reports.push({
+          job: job.name,
+          status: 'SKIPPED',
+          durationMs: 0,
+          rowsDeleted: 0,
+          bytesReclaimed: 0,
+        });
+        continue;
+      }
+
+      if (!(await renewLock(owner))) {
+        console.warn('⚠️ Maintenance lock lost to another runner, stopping');
+        break;
+      }
+
+      const report = await runJob(job);
+      console.log(
+        `🧹 ${job.name}: ${report.status}, ${report.rowsDeleted} rows, ` +
+          `${report.bytesReclaimed} bytes in ${report.durationMs}ms`
+      );
+      reports.push(report);
+    }
+  } finally {
+    clearInterval(heartbeat);
+    await releaseLock(owner);
+  }
+
+  return { locked: true, jobs: reports };
+}
@@ -0,0 +1,12 @@
+import { JobQueue } from '@/lib/job-queue';
+
+// Each OCR job spawns a tesseract process, so cap how many run at once
+const OCR_CONCURRENCY = parseInt(process.env.OCR_CONCURRENCY || '2');
+
+const globalForOcr = globalThis as unknown as {
+  ocrQueue: JobQueue | undefined;
+};
+
+export const ocrQueue = globalForOcr.ocrQueue ?? new JobQueue(OCR_CONCURRENCY);
+
+globalForOcr.ocrQueue = ocrQueue;
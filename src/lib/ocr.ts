@@ -1,5 +1,3 @@
-import tesseract from 'node-tesseract-ocr';
-
 /**
  * Extract text from an image using Tesseract CLI
  * No worker threads - direct CLI execution for maximum compatibility
@@ -28,6 +26,10 @@ export async function extractTextFromImage(
       psm: 3, // Automatic page segmentation
     };
 
+    // Load the tesseract wrapper only when OCR actually runs, so routes that
+    // just parse text (e.g. label analysis) don't pay for it at cold start
+    const { default: tesseract } = await import('node-tesseract-ocr');
+
     // Run OCR using tesseract CLI
     const text = await tesseract.recognize(imagePath, config);
 
@@ -1,5 +1,6 @@
 import { prisma } from '@/lib/prisma';
 import { sendEmail } from '@/lib/email';
+import { deleteInChunks } from '@/lib/chunked-delete';
 
 /**
  * Generate a 6-digit OTP
@@ -183,16 +184,26 @@ export async function verifyOTP(email: string, otp: string): Promise<boolean> {
 }
 
 /**
- * Clean up expired OTPs (run periodically)
+ * Clean up expired OTPs (run by the maintenance scheduler)
  */
-export async function cleanupExpiredOTPs(): Promise<void> {
-  const result = await prisma.loginOtp.deleteMany({
-    where: {
-      expiresAt: {
-        lt: new Date(),
-      },
+export async function cleanupExpiredOTPs(): Promise<number> {
+  const cutoff = new Date();
+
+  const count = await deleteInChunks({
+    findBatch: (take) =>
+      prisma.loginOtp.findMany({
+        where: { expiresAt: { lt: cutoff } },
+        select: { id: true },
+        take,
+      }),
+    deleteBatch: async (rows) => {
+      const result = await prisma.loginOtp.deleteMany({
+        where: { id: { in: rows.map((row) => row.id) } },
+      });
+      return result.count;
     },
   });
 
-  console.log(`🧹 Cleaned up ${result.count} expired OTPs`);
+  console.log(`🧹 Cleaned up ${count} expired OTPs`);
+  return count;
 }
@@ -0,0 +1,366 @@
+import { gzipSync } from 'zlib';
+
+/**
+ * Minimal streaming Parquet writer: flat schemas, PLAIN-encoded gzip data
+ * pages, one page per column per row group. Enough for tabular exports that
+ * pandas, DuckDB, Spark and BigQuery read natively; no nesting, dictionaries
+ * or string statistics.
+ *
+ * Format reference: https://github.com/apache/parquet-format
+ */
+
+export type ParquetColumnType = 'string' | 'json' | 'int32' | 'timestamp';
+
+export interface ParquetColumn {
+  name: string;
+  type: ParquetColumnType;
+  optional?: boolean;
+}
+
+const MAGIC = Buffer.from('PAR1');
+
+// parquet.thrift enums
+const PhysicalType = { INT32: 1, INT64: 2, BYTE_ARRAY: 6 };
+const ConvertedType = { UTF8: 0, TIMESTAMP_MILLIS: 9, JSON: 19 };
+const Encoding = { PLAIN: 0, RLE: 3 };
+const CODEC_GZIP = 2;
+const PAGE_DATA = 0;
+
+// Thrift compact protocol type ids
+const T_I32 = 5;
+const T_I64 = 6;
+const T_BINARY = 8;
+const T_LIST = 9;
+const T_STRUCT = 12;
+
+/**
+ * Thrift compact protocol encoder, covering the field types parquet.thrift
+ * metadata needs
+ */
+class CompactWriter {
+  private bytes: number[] = [];
+  private lastFieldIds: number[] = [0];
+
+  private varint(value: bigint) {
+    while (value >= 0x80n) {
+      this.bytes.push(Number(value & 0x7fn) | 0x80);
+      value >>= 7n;
+    }
+    this.bytes.push(Number(value));
+  }
+
+  private zigzag(value: number) {
+    const n = BigInt(value);
+    this.varint(n >= 0n ? n << 1n : (-n << 1n) - 1n);
+  }
+
+  private fieldHeader(id: number, type: number) {
+    const last = this.lastFieldIds[this.lastFieldIds.length - 1];
+    const delta = id - last;
+    if (delta > 0 && delta <= 15) {
+      this.bytes.push((delta << 4) | type);
+    } else {
+      this.bytes.push(type);
+      this.zigzag(id);
+    }
+    this.lastFieldIds[this.lastFieldIds.length - 1] = id;
+  }
+
+  private rawBinary(value: Buffer) {
+    this.varint(BigInt(value.length));
+    for (const byte of value) this.bytes.push(byte);
+  }
+
+  private rawStruct(write: () => void) {
+    this.lastFieldIds.push(0);
+    write();
+    this.bytes.push(0); // stop field
+    this.lastFieldIds.pop();
+  }
+
+  private listHeader(id: number, elementType: number, size: number) {
+    this.fieldHeader(id, T_LIST);
+    if (size < 15) {
+      this.bytes.push((size << 4) | elementType);
+    } else {
+      this.bytes.push(0xf0 | elementType);
+      this.varint(BigInt(size));
+    }
+  }
+
+  i32(id: number, value: number) {
+    this.fieldHeader(id, T_I32);
+    this.zigzag(value);
+  }
+
+  i64(id: number, value: number) {
+    this.fieldHeader(id, T_I64);
+    this.zigzag(value);
+  }
+
+  binary(id: number, value: Buffer | string) {
+    this.fieldHeader(id, T_BINARY);
+    this.rawBinary(typeof value === 'string' ? Buffer.from(value) : value);
+  }
+
+  struct(id: number, write: () => void) {
+    this.fieldHeader(id, T_STRUCT);
+    this.rawStruct(write);
+  }
+
+  i32List(id: number, values: number[]) {
+    this.listHeader(id, T_I32, values.length);
+    values.forEach((value) => this.zigzag(value));
+  }
+
+  stringList(id: number, values: string[]) {
+    this.listHeader(id, T_BINARY, values.length);
+    values.forEach((value) => this.rawBinary(Buffer.from(value)));
+  }
+
+  structList<T>(id: number, items: T[], write: (item: T) => void) {
+    this.listHeader(id, T_STRUCT, items.length);
+    items.forEach((item) => this.rawStruct(() => write(item)));
+  }
+
+  /**
+   * The encoded top-level struct (including its stop field)
+   */
+  finish(): Buffer {
+    this.bytes.push(0);
+    return Buffer.from(this.bytes);
+  }
+}
+
+interface ColumnChunkInfo {
+  column: ParquetColumn;
+  offset: number;
+  numValues: number;
+  nullCount: number;
+  uncompressedSize: number;
+  compressedSize: number;
+  min?: Buffer;
+  max?: Buffer;
+}
+
+interface RowGroupInfo {
+  numRows: number;
+  totalByteSize: number;
+  columns: ColumnChunkInfo[];
+}
+
+function physicalType(type: ParquetColumnType): number {
+  if (type === 'int32') return PhysicalType.INT32;
+  if (type === 'timestamp') return PhysicalType.INT64;
+  return PhysicalType.BYTE_ARRAY;
+}
+
+function convertedType(type: ParquetColumnType): number | undefined {
+  if (type === 'string') return ConvertedType.UTF8;
+  if (type === 'json') return ConvertedType.JSON;
+  if (type === 'timestamp') return ConvertedType.TIMESTAMP_MILLIS;
+  return undefined;
+}
+
+/**
+ * PLAIN encoding of the non-null values, plus min/max for numeric columns
+ */
+function encodeValues(type: ParquetColumnType, values: unknown[]) {
+  if (type === 'int32' || type === 'timestamp') {
+    const width = type === 'int32' ? 4 : 8;
+    const buffer = Buffer.alloc(values.length * width);
+    let min = Infinity;
+    let max = -Infinity;
+    values.forEach((value, i) => {
+      const n = value instanceof Date ? value.getTime() : Number(value);
+      if (width === 4) buffer.writeInt32LE(n, i * 4);
+      else buffer.writeBigInt64LE(BigInt(n), i * 8);
+      min = Math.min(min, n);
+      max = Math.max(max, n);
+    });
+
+    if (values.length === 0) return { buffer };
+    const stat = (n: number) => {
+      const out = Buffer.alloc(width);
+      if (width === 4) out.writeInt32LE(n);
+      else out.writeBigInt64LE(BigInt(n));
+      return out;
+    };
+    return { buffer, min: stat(min), max: stat(max) };
+  }
+
+  const parts: Buffer[] = [];
+  for (const value of values) {
+    const bytes = Buffer.from(type === 'json' ? JSON.stringify(value) : String(value));
+    const length = Buffer.alloc(4);
+    length.writeUInt32LE(bytes.length);
+    parts.push(length, bytes);
+  }
+  return { buffer: Buffer.concat(parts) };
+}
+
+/**
+ * Definition levels (1 = present, 0 = null) as RLE runs of the
+ * RLE/bit-packed hybrid encoding, with the v1 page's 4-byte length prefix
+ */
+function encodeDefinitionLevels(present: boolean[]): Buffer {
+  const bytes: number[] = [];
+  let i = 0;
+  while (i < present.length) {
+    let run = 1;
+    while (i + run < present.length && present[i + run] === present[i]) run++;
+
+    let header = run << 1; // low bit 0 marks an RLE run
+    while (header >= 0x80) {
+      bytes.push((header & 0x7f) | 0x80);
+      header >>>= 7;
+    }
+    bytes.push(header, present[i] ? 1 : 0);
+    i += run;
+  }
+
+  const length = Buffer.alloc(4);
+  length.writeUInt32LE(bytes.length);
+  return Buffer.concat([length, Buffer.from(bytes)]);
+}
+
+export class ParquetWriter {
+  private offset = 0;
+  private rows: Array<Record<string, unknown>> = [];
+  private rowGroups: RowGroupInfo[] = [];
+  private totalRows = 0;
+
+  constructor(
+    private readonly columns: ParquetColumn[],
+    private readonly options: { rowGroupSize?: number; createdBy?: string } = {}
+  ) {}
+
+  /**
+   * Bytes to write before any rows
+   */
+  start(): Buffer {
+    this.offset = MAGIC.length;
+    return MAGIC;
+  }
+
+  /**
+   * Buffer rows; returns the bytes of any row groups that filled up
+   */
+  write(rows: Array<Record<string, unknown>>): Buffer {
+    const rowGroupSize = this.options.rowGroupSize ?? 100000;
+    const out: Buffer[] = [];
+    for (const row of rows) {
+      this.rows.push(row);
+      if (this.rows.length >= rowGroupSize) out.push(this.flushRowGroup());
+    }
+    return Buffer.concat(out);
+  }
+
+  /**
+   * Flush buffered rows and return the remaining bytes, including the footer
+   */
+  end(): Buffer {
+    const rowGroup = this.rows.length > 0 ? this.flushRowGroup() : Buffer.alloc(0);
+    const footer = this.encodeFooter();
+    const length = Buffer.alloc(4);
+    length.writeUInt32LE(footer.length);
+    return Buffer.concat([rowGroup, footer, length, MAGIC]);
+  }
+
+  private flushRowGroup(): Buffer {
+    const rows = this.rows;
+    this.rows = [];
+    const parts: Buffer[] = [];
+    const chunks: ColumnChunkInfo[] = [];
+
+    for (const column of this.columns) {
+      const raw = rows.map((row) => row[column.name]);
+      const present = raw.map((value) => value !== null && value !== undefined);
+      if (!column.optional && present.includes(false)) {
+        throw new Error(`Parquet column "${column.name}" is required but got a null value`);
+      }
+
+      const values = raw.filter((_, i) => present[i]);
+      const { buffer, min, max } = encodeValues(column.type, values);
+      const body = column.optional
+        ? Buffer.concat([encodeDefinitionLevels(present), buffer])
+        : buffer;
+      const compressed = gzipSync(body);
+
+      const header = new CompactWriter();
+      header.i32(1, PAGE_DATA);
+      header.i32(2, body.length);
+      header.i32(3, compressed.length);
+      header.struct(5, () => {
+        header.i32(1, rows.length);
+        header.i32(2, Encoding.PLAIN);
+        header.i32(3, Encoding.RLE);
+        header.i32(4, Encoding.RLE);
+      });
+      const headerBytes = header.finish();
+
+      chunks.push({
+        column,
+        offset: this.offset,
+        numValues: rows.length,
+        nullCount: rows.length - values.length,
+        uncompressedSize: headerBytes.length + body.length,
+        compressedSize: headerBytes.length + compressed.length,
+        min,
+        max,
+      });
+      parts.push(headerBytes, compressed);
+      this.offset += headerBytes.length + compressed.length;
+    }
+
+    this.rowGroups.push({
+      numRows: rows.length,
+      totalByteSize: chunks.reduce((sum, chunk) => sum + chunk.uncompressedSize, 0),
+      columns: chunks,
+    });
+    this.totalRows += rows.length;
+    return Buffer.concat(parts);
+  }
+
+  private encodeFooter(): Buffer {
+    const meta = new CompactWriter();
+    meta.i32(1, 1); // version
+    meta.structList(2, [null, ...this.columns], (column) => {
+      if (!column) {
+        meta.binary(4, 'schema');
+        meta.i32(5, this.columns.length);
+        return;
+      }
+      meta.i32(1, physicalType(column.type));
+      meta.i32(3, column.optional ? 1 : 0); // OPTIONAL : REQUIRED
+      meta.binary(4, column.name);
+      const converted = convertedType(column.type);
+      if (converted !== undefined) meta.i32(6, converted);
+    });
+    meta.i64(3, this.totalRows);
+    meta.structList(4, this.rowGroups, (rowGroup) => {
+      meta.structList(1, rowGroup.columns, (chunk) => {
+        meta.i64(2, chunk.offset);
+        meta.struct(3, () => {
+          meta.i32(1, physicalType(chunk.column.type));
+          meta.i32List(2, [Encoding.PLAIN, Encoding.RLE]);
+          meta.stringList(3, [chunk.column.name]);
+          meta.i32(4, CODEC_GZIP);
+          meta.i64(5, chunk.numValues);
+          meta.i64(6, chunk.uncompressedSize);
+          meta.i64(7, chunk.compressedSize);
+          meta.i64(9, chunk.offset);
+          meta.struct(12, () => {
+            meta.i64(3, chunk.nullCount);
+            if (chunk.max) meta.binary(5, chunk.max);
+            if (chunk.min) meta.binary(6, chunk.min);
+          });
+        });
+      });
+      meta.i64(2, rowGroup.totalByteSize);
+      meta.i64(3, rowGroup.numRows);
+    });
+    meta.binary(6, this.options.createdBy ?? 'healthpedhyan');
+    return meta.finish();
+  }
+}
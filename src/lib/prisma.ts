@@ -1,13 +1,33 @@
 import { PrismaClient } from '@prisma/client';
+import { recordQuery } from '@/lib/db-metrics';
+import { getDatabaseConfig } from '@/lib/db-config';
 
 const globalForPrisma = globalThis as unknown as {
   prisma: PrismaClient | undefined;
 };
 
-export const prisma =
-  globalForPrisma.prisma ??
-  new PrismaClient({
+function createPrismaClient() {
+  const client = new PrismaClient({
+    // Adds connection_limit / pool_timeout / pgbouncer params (see src/lib/db-config.ts)
+    datasourceUrl: getDatabaseConfig().url,
     log: process.env.NODE_ENV === 'development' ? ['query', 'error', 'warn'] : ['error'],
   });
 
-if (process.env.NODE_ENV !== 'production') globalForPrisma.prisma = prisma;
+  // Attribute every operation to the current request (see src/lib/db-metrics.ts)
+  client.$use(async (params, next) => {
+    const start = performance.now();
+    try {
+      return await next(params);
+    } finally {
+      recordQuery(params.model, params.action, performance.now() - start);
+    }
+  });
+
+  return client;
+}
+
+export const prisma = globalForPrisma.prisma ?? createPrismaClient();
+
+// Reuse one client (and one pool) per process: across hot reloads in
+// development, and across route bundles on warm serverless instances
+globalForPrisma.prisma = prisma;
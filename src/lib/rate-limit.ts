@@ -0,0 +1,245 @@
+import { NextRequest, NextResponse } from 'next/server';
+import { Prisma } from '@prisma/client';
+import { prisma } from '@/lib/prisma';
+
+// Rate limit configuration
+const STORE = process.env.RATE_LIMIT_STORE === 'postgres' ? 'postgres' : 'memory';
+const MAX_MEMORY_KEYS = parseInt(process.env.RATE_LIMIT_MAX_KEYS || '50000');
+// Scales every limit, e.g. raise it for load tests or CI
+const MULTIPLIER = parseFloat(process.env.RATE_LIMIT_MULTIPLIER || '1');
+const ENABLED = process.env.RATE_LIMIT_ENABLED !== 'false';
+// Reverse proxies in front of the app that append to X-Forwarded-For (1
+// behind nginx). Entries left of theirs are client-supplied and ignored.
+const TRUSTED_PROXY_COUNT = parseInt(process.env.TRUSTED_PROXY_COUNT || '0');
+// Shared bucket for requests without a trusted identifier
+const UNKNOWN_IDENTIFIER = 'unknown';
+
+/**
+ * Token bucket: `limit` requests per `windowSeconds`, refilled continuously,
+ * so a client can burst up to `limit` and then sustain limit/window per second
+ */
+export interface RateLimitPolicy {
+  limit: number;
+  windowSeconds: number;
+}
+
+export const RATE_LIMITS = {
+  'otp-ip': { limit: 20, windowSeconds: 15 * 60 },
+  'otp-email': { limit: 5, windowSeconds: 15 * 60 },
+  'signup-ip': { limit: 10, windowSeconds: 60 * 60 },
+  'signup-email': { limit: 3, windowSeconds: 60 * 60 },
+  'telemetry-ip': { limit: 300, windowSeconds: 60 },
+  'label-scan-ip': { limit: 10, windowSeconds: 10 * 60 },
+} satisfies Record<string, RateLimitPolicy>;
+
+export type RateLimitName = keyof typeof RATE_LIMITS;
+
+export interface RateLimitResult {
+  allowed: boolean;
+  limit: number;
+  remaining: number;
+  retryAfterSeconds: number;
+}
+
+interface BucketStore {
+  take(
+    key: string,
+    capacity: number,
+    refillPerSecond: number
+  ): Promise<{ allowed: boolean; tokens: number }>;
+  reset(): Promise<void>;
+}
+
+/**
+ * In-process buckets kept as [tokens, updatedAtMs] in an LRU-ordered Map
+ */
+class MemoryBucketStore implements BucketStore {
+  private buckets = new Map<string, [number, number]>();
+
+  async take(key: string, capacity: number, refillPerSecond: number) {
+    const now = Date.now();
+    const bucket = this.buckets.get(key);
+    let tokens = capacity;
+
+    if (bucket) {
+      tokens = Math.min(capacity, bucket[0] + ((now - bucket[1]) / 1000) * refillPerSecond);
+      this.buckets.delete(key); // re-inserted below to mark as recently used
+    }
+
+    const allowed = tokens >= 1;
+    if (allowed) tokens -= 1;
+    this.buckets.set(key, [tokens, now]);
+
+    // Evict least recently used keys; an evicted bucket just starts full again
+    while (this.buckets.size > MAX_MEMORY_KEYS) {
+      const oldest = this.buckets.keys().next().value;
+      if (oldest === undefined) break;
+      this.buckets.delete(oldest);
+    }
+
+    return { allowed, tokens };
+  }
+
+  async reset() {
+    this.buckets.clear();
+  }
+}
+
+/**
+ * Shared buckets in Postgres for multi-instance deployments. One atomic
+ * upsert per check; the table is UNLOGGED since losing it only resets limits.
+ */
+class PostgresBucketStore implements BucketStore {
+  async take(key: string, capacity: number, refillPerSecond: number) {
+    // Tokens in the existing row after refilling for the time elapsed
+    const refilled = Prisma.sql`LEAST(
+      ${capacity}::float8,
+      "rate_limit_buckets"."tokens" +
+        EXTRACT(EPOCH FROM (NOW() - "rate_limit_buckets"."updatedAt"))::float8 *
+        ${refillPerSecond}::float8
+    )`;
+
+    const rows = await prisma.$queryRaw<Array<{ tokens: number; allowed: boolean }>>`
+      INSERT INTO "rate_limit_buckets" ("key", "tokens", "allowed", "updatedAt")
+      VALUES (${key}, ${capacity - 1}::float8, true, NOW())
+      ON CONFLICT ("key") DO UPDATE SET
+        "allowed" = ${refilled} >= 1,
+        "tokens" = ${refilled} - CASE WHEN ${refilled} >= 1 THEN 1 ELSE 0 END,
+        "updatedAt" = NOW()
+      RETURNING "tokens", "allowed"
+    `;
+    return { allowed: rows[0].allowed, tokens: Number(rows[0].tokens) };
+  }
+
+  async reset() {
+    await prisma.$executeRaw`DELETE FROM "rate_limit_buckets"`;
+  }
+}
+
+const globalForRateLimit = globalThis as unknown as {
+  rateLimitStore: BucketStore | undefined;
+  rateLimitCounters: Record<string, { allowed: number; blocked: number }> | undefined;
+};
+
+const store = (globalForRateLimit.rateLimitStore ??=
+  STORE === 'postgres' ? new PostgresBucketStore() : new MemoryBucketStore());
+const counters = (globalForRateLimit.rateLimitCounters ??= {});
+
+/**
+ * Client IP as seen by the nearest trusted hop: the platform's address on
+ * Vercel, else the X-Forwarded-For entry added by the outermost of
+ * TRUSTED_PROXY_COUNT proxies. Undefined when no trusted address is known.
+ */
+export function getClientIp(request: NextRequest): string | undefined {
+  if (request.ip) return request.ip;
+  if (TRUSTED_PROXY_COUNT <= 0) return undefined;
+
+  const hops = (request.headers.get('x-forwarded-for') ?? '')
+    .split(',')
+    .map((hop) => hop.trim())
+    .filter(Boolean);
+  return hops[hops.length - TRUSTED_PROXY_COUNT] || request.headers.get('x-real-ip') || undefined;
+}
+
+/**
+ * Bucket capacity for a policy after applying RATE_LIMIT_MULTIPLIER
+ */
+export function effectiveLimit(name: RateLimitName): number {
+  return Math.max(1, Math.round(RATE_LIMITS[name].limit * MULTIPLIER));
+}
+
+/**
+ * Consume one token from the named policy's bucket for `identifier`
+ */
+export async function checkRateLimit(
+  name: RateLimitName,
+  identifier: string
+): Promise<RateLimitResult> {
+  const capacity = effectiveLimit(name);
+  const refillPerSecond = capacity / RATE_LIMITS[name].windowSeconds;
+
+  if (!ENABLED) {
+    return { allowed: true, limit: capacity, remaining: capacity, retryAfterSeconds: 0 };
+  }
+
+  let result: { allowed: boolean; tokens: number };
+  try {
+    result = await store.take(`${name}:${identifier.toLowerCase()}`, capacity, refillPerSecond);
+  } catch (error) {
+    // Fail open: a broken shared store must not take the endpoint down
+    console.error('Rate limit store error:', error);
+    return { allowed: true, limit: capacity, remaining: capacity, retryAfterSeconds: 0 };
+  }
+
+  const counter = (counters[name] ??= { allowed: 0, blocked: 0 });
+  if (result.allowed) {
+    counter.allowed++;
+  } else {
+    counter.blocked++;
+  }
+
+  return {
+    allowed: result.allowed,
+    limit: capacity,
+    remaining: Math.floor(result.tokens),
+    retryAfterSeconds: result.allowed ? 0 : Math.ceil((1 - result.tokens) / refillPerSecond),
+  };
+}
+
+/**
+ * Check several limits; returns a 429 response for the first one exceeded,
+ * or null if the request may proceed. Checks with no identifier (e.g. no
+ * trusted client IP) share one bucket per policy.
+ */
+export async function enforceRateLimits(
+  checks: Array<[RateLimitName, string | null | undefined]>
+): Promise<NextResponse | null> {
+  for (const [name, identifier] of checks) {
+    const result = await checkRateLimit(name, identifier || UNKNOWN_IDENTIFIER);
+    if (!result.allowed) {
+      return NextResponse.json(
+        { error: 'Too many requests. Please try again later.' },
+        {
+          status: 429,
+          headers: {
+            'Retry-After': String(result.retryAfterSeconds),
+            'X-RateLimit-Limit': String(result.limit),
+            'X-RateLimit-Remaining': '0',
+            'X-RateLimit-Policy': name,
+          },
+        }
+      );
+    }
+  }
+  return null;
+}
+
+/**
+ * Refill every bucket (the counters are kept), e.g. between load tests
+ */
+export async function resetRateLimits(): Promise<void> {
+  await store.reset();
+}
+
+/**
+ * Effective limits and allowed/blocked counts per policy since the process started
+ */
+export function getRateLimitCounters() {
+  const names = Object.keys(RATE_LIMITS) as RateLimitName[];
+  return {
+    enabled: ENABLED,
+    store: STORE,
+    multiplier: MULTIPLIER,
+    policies: Object.fromEntries(
+      names.map((name) => [
+        name,
+        {
+          limit: effectiveLimit(name),
+          windowSeconds: RATE_LIMITS[name].windowSeconds,
+          allowed: counters[name]?.allowed ?? 0,
+          blocked: counters[name]?.blocked ?? 0,
+        },
+      ])
+    ),
+  };
+}
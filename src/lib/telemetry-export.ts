@@ -0,0 +1,229 @@
+import { TelemetryEventType } from '@prisma/client';
+import { prisma } from '@/lib/prisma';
+import { ParquetColumn, ParquetWriter } from '@/lib/parquet-writer';
+
+// Telemetry export configuration
+const BATCH_SIZE = parseInt(process.env.TELEMETRY_EXPORT_BATCH_SIZE || '5000');
+// Breathing room between batches so an export never crowds out live traffic
+const BATCH_PAUSE_MS = parseInt(process.env.TELEMETRY_EXPORT_BATCH_PAUSE_MS || '20');
+const ROW_GROUP_SIZE = parseInt(process.env.TELEMETRY_EXPORT_ROW_GROUP_SIZE || '100000');
+
+export type ExportFormat = 'ndjson' | 'csv' | 'parquet';
+
+export const EXPORT_FORMATS: Record<ExportFormat, { contentType: string; extension: string }> = {
+  ndjson: { contentType: 'application/x-ndjson', extension: 'ndjson' },
+  csv: { contentType: 'text/csv; charset=utf-8', extension: 'csv' },
+  parquet: { contentType: 'application/vnd.apache.parquet', extension: 'parquet' },
+};
+
+/**
+ * Keyset position of the last exported event. Every exported row carries its
+ * createdAt and id, so the position to resume from is just the last row.
+ */
+export interface ExportPosition {
+  createdAt: Date;
+  id: string;
+}
+
+export interface ExportOptions {
+  from: Date;
+  to: Date; // exclusive
+  eventType?: TelemetryEventType;
+  after?: ExportPosition | null;
+  limit?: number; // stop after this many rows
+  deadline?: number; // epoch ms; stop at the next batch boundary after this
+  batchSize?: number;
+  header?: boolean; // CSV header row (off when appending to an existing file)
+}
+
+export interface ExportChunk {
+  bytes: Buffer;
+  rows: number; // total rows exported so far
+  // Last row read so far. For NDJSON/CSV the bytes up to here end exactly at
+  // that row; Parquet may still be holding it in an unflushed row group.
+  position: ExportPosition | null;
+}
+
+// IP addresses are left out of exports on purpose
+const EXPORT_SELECT = {
+  id: true,
+  createdAt: true,
+  eventType: true,
+  eventName: true,
+  userId: true,
+  sessionId: true,
+  path: true,
+  referrer: true,
+  duration: true,
+  userAgent: true,
+  properties: true,
+} as const;
+
+type ExportRow = {
+  id: string;
+  createdAt: Date;
+  eventType: string;
+  eventName: string;
+  userId: string | null;
+  sessionId: string | null;
+  path: string | null;
+  referrer: string | null;
+  duration: number | null;
+  userAgent: string | null;
+  properties: unknown;
+};
+
+const COLUMNS = Object.keys(EXPORT_SELECT) as Array<keyof ExportRow>;
+
+const PARQUET_COLUMNS: ParquetColumn[] = [
+  { name: 'id', type: 'string' },
+  { name: 'createdAt', type: 'timestamp' },
+  { name: 'eventType', type: 'string' },
+  { name: 'eventName', type: 'string' },
+  { name: 'userId', type: 'string', optional: true },
+  { name: 'sessionId', type: 'string', optional: true },
+  { name: 'path', type: 'string', optional: true },
+  { name: 'referrer', type: 'string', optional: true },
+  { name: 'duration', type: 'int32', optional: true },
+  { name: 'userAgent', type: 'string', optional: true },
+  { name: 'properties', type: 'json', optional: true },
+];
+
+const sleep = (ms: number) => new Promise((resolve) => setTimeout(resolve, ms));
+
+/**
+ * "2026-10-01T12:00:00.000Z,<id>" — the createdAt and id of the last row
+ */
+export function formatExportPosition(position: ExportPosition): string {
+  return `${position.createdAt.toISOString()},${position.id}`;
+}
+
+export function parseExportPosition(value: string): ExportPosition | null {
+  const [createdAt, id] = value.split(',');
+  const date = new Date(createdAt);
+  if (!id || isNaN(date.getTime())) return null;
+  return { createdAt: date, id };
+}
+
+/**
+ * Events in (createdAt, id) order, one bounded batch at a time. Each batch is
+ * an index range scan starting after the previous one, so memory stays flat
+ * and no query or transaction stays open between batches.
+ */
+export async function* readTelemetryBatches(
+  options: ExportOptions
+): AsyncGenerator<ExportRow[]> {
+  const batchSize = options.batchSize ?? BATCH_SIZE;
+  let after = options.after ?? null;
+  let remaining = options.limit ?? Infinity;
+
+  while (remaining > 0) {
+    const rows = await prisma.telemetryEvent.findMany({
+      where: {
+        createdAt: { gte: options.from, lt: options.to },
+        ...(options.eventType && { eventType: options.eventType }),
+        ...(after && {
+          AND: [
+            { createdAt: { gte: after.createdAt } },
+            {
+              OR: [
+                { createdAt: { gt: after.createdAt } },
+                { createdAt: after.createdAt, id: { gt: after.id } },
+              ],
+            },
+          ],
+        }),
+      },
+      orderBy: [{ createdAt: 'asc' }, { id: 'asc' }],
+      take: Math.min(batchSize, remaining),
+      select: EXPORT_SELECT,
+    });
+    if (rows.length === 0) return;
+
+    yield rows;
+
+    const last = rows[rows.length - 1];
+    after = { createdAt: last.createdAt, id: last.id };
+    remaining -= rows.length;
+    if (rows.length < batchSize) return;
+    if (options.deadline && Date.now() > options.deadline) return;
+    if (BATCH_PAUSE_MS > 0) await sleep(BATCH_PAUSE_MS);
+  }
+}
+
+function csvField(value: unknown): string {
+  if (value === null || value === undefined) return '';
+  const text =
+    value instanceof Date
+      ? value.toISOString()
+      : typeof value === 'object'
+        ? JSON.stringify(value)
+        : String(value);
+  return /[",\r\n]/.test(text) ? `"${text.replace(/"/g, '""')}"` : text;
+}
+
+function csvRow(row: ExportRow): string {
+  return COLUMNS.map((column) => csvField(row[column])).join(',') + '\n';
+}
+
+/**
+ * Turns batches of rows into bytes of one output format
+ */
+interface ExportEncoder {
+  start(): Buffer;
+  write(rows: ExportRow[]): Buffer;
+  end(): Buffer;
+}
+
+function createEncoder(format: ExportFormat, options: ExportOptions): ExportEncoder {
+  if (format === 'ndjson') {
+    return {
+      start: () => Buffer.alloc(0),
+      write: (rows) => Buffer.from(rows.map((row) => JSON.stringify(row) + '\n').join('')),
+      end: () => Buffer.alloc(0),
+    };
+  }
+
+  if (format === 'csv') {
+    return {
+      start: () => Buffer.from(options.header === false ? '' : COLUMNS.join(',') + '\n'),
+      write: (rows) => Buffer.from(rows.map(csvRow).join('')),
+      end: () => Buffer.alloc(0),
+    };
+  }
+
+  const writer = new ParquetWriter(PARQUET_COLUMNS, {
+    rowGroupSize: ROW_GROUP_SIZE,
+    createdBy: 'healthpedhyan telemetry export',
+  });
+  return {
+    start: () => writer.start(),
+    write: (rows) => writer.write(rows),
+    end: () => writer.end(),
+  };
+}
+
+/**
+ * Stream an export as byte chunks. Parquet buffers one row group at a time,
+ * so memory is bounded by TELEMETRY_EXPORT_ROW_GROUP_SIZE; the file is only
+ * complete (readable) once the final chunk has been written.
+ */
+export async function* exportTelemetry(
+  format: ExportFormat,
+  options: ExportOptions
+): AsyncGenerator<ExportChunk> {
+  const encoder = createEncoder(format, options);
+  let rows = 0;
+  let position: ExportPosition | null = options.after ?? null;
+
+  yield { bytes: encoder.start(), rows, position };
+
+  for await (const batch of readTelemetryBatches(options)) {
+    rows += batch.length;
+    const last = batch[batch.length - 1];
+    position = { createdAt: last.createdAt, id: last.id };
+    yield { bytes: encoder.write(batch), rows, position };
+  }
+
+  yield { bytes: encoder.end(), rows, position };
+}
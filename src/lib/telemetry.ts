@@ -1,5 +1,6 @@
 import { prisma } from '@/lib/prisma';
 import { TelemetryEventType } from '@prisma/client';
+import { deleteInChunks } from '@/lib/chunked-delete';
 
 // Telemetry configuration
 const TELEMETRY_ENABLED = process.env.TELEMETRY_ENABLED !== 'false';
@@ -296,19 +297,29 @@ export async function getTelemetryStats(options: {
 }
 
 /**
- * Clean up old telemetry data (run periodically)
+ * Clean up old telemetry data (run by the maintenance scheduler)
  */
-export async function cleanupOldTelemetry(daysToKeep: number = 90): Promise<void> {
+export async function cleanupOldTelemetry(daysToKeep: number = 90): Promise<number> {
   const cutoffDate = new Date();
   cutoffDate.setDate(cutoffDate.getDate() - daysToKeep);
 
-  const result = await prisma.telemetryEvent.deleteMany({
-    where: {
-      createdAt: {
-        lt: cutoffDate,
-      },
+  // Oldest first via the createdAt index, one chunk at a time
+  const count = await deleteInChunks({
+    findBatch: (take) =>
+      prisma.telemetryEvent.findMany({
+        where: { createdAt: { lt: cutoffDate } },
+        select: { id: true },
+        orderBy: { createdAt: 'asc' },
+        take,
+      }),
+    deleteBatch: async (rows) => {
+      const result = await prisma.telemetryEvent.deleteMany({
+        where: { id: { in: rows.map((row) => row.id) } },
+      });
+      return result.count;
     },
   });
 
-  console.log(`🧹 Cleaned up ${result.count} telemetry events older than ${daysToKeep} days`);
+  console.log(`🧹 Cleaned up ${count} telemetry events older than ${daysToKeep} days`);
+  return count;
 }
@@ -0,0 +1,24 @@
+import { basename, join } from 'path';
+
+/**
+ * Where uploaded label images are stored and served from
+ */
+export const LABEL_UPLOAD_DIR = join(process.cwd(), 'public', 'uploads', 'labels');
+export const LABEL_UPLOAD_URL_PREFIX = '/uploads/labels/';
+
+/**
+ * Public URL for a stored label image
+ */
+export function labelUploadUrl(fileName: string): string {
+  return `${LABEL_UPLOAD_URL_PREFIX}${fileName}`;
+}
+
+/**
+ * Filesystem path for a label image URL, or null if the URL does not point at
+ * a local upload (basename() keeps crafted URLs inside the upload directory)
+ */
+export function labelUploadPath(imageUrl: string): string | null {
+  if (!imageUrl.startsWith(LABEL_UPLOAD_URL_PREFIX)) return null;
+  const fileName = basename(imageUrl.slice(LABEL_UPLOAD_URL_PREFIX.length));
+  return fileName ? join(LABEL_UPLOAD_DIR, fileName) : null;
+}
@@ -0,0 +1,227 @@
+"""
+Cold-start benchmark
+Measures first-request vs steady-state latency for every route the test
+suite covers, starting a fresh `next start` process per route so each first
+request pays the full module-load cost.
+
+Requires a production build (`npm run build`). Uses only the standard
+library so it can run without the Playwright dependencies.
+
+Usage:
+    python benchmark_cold_start.py                     # all routes
+    python benchmark_cold_start.py --routes / /shop    # selected routes
+    python benchmark_cold_start.py --shared            # one server, first hit per route
+    python benchmark_cold_start.py --fail-on-regression
+
+Results are appended to benchmark-results/cold-start.jsonl and compared
+against the previous run.
+"""
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from datetime import datetime, timezone
+from pathlib import Path
+
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+RESULTS_FILE = Path(__file__).resolve().parent / "benchmark-results" / "cold-start.jsonl"
+
+# Routes exercised by the test suite. API routes that only accept POST are
+# still requested with GET: the 405 response requires loading the module.
+ROUTES = [
+    "/",
+    "/shop",
+    "/product/pintola-peanut-butter",  # seeded product (prisma/seed.ts)
+    "/blog",
+    "/about",
+    "/standards",
+    "/evidence",
+    "/ingredients",
+    "/scan-label",
+    "/contact",
+    "/login",
+    "/signup",
+    "/admin/login",
+    "/api/health",
+    "/api/telemetry",
+    "/api/label-scan",
+    "/api/auth/providers",
+    "/api/auth/request-otp",
+    "/api/auth/signup",
+]
+
+# First-hit regression threshold: slower than previous * ratio + slack
+REGRESSION_RATIO = 1.25
+REGRESSION_SLACK_MS = 50
+
+
+def wait_for_port(port: int, timeout: float) -> None:
+    """Wait until the server accepts TCP connections (without sending a request)"""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.5):
+                return
+        except OSError:
+            time.sleep(0.1)
+    raise TimeoutError(f"Server did not start on port {port} within {timeout}s")
+
+
+def timed_get(url: str) -> tuple:
+    """Return (status, elapsed_ms) for a GET request"""
+    start = time.perf_counter()
+    try:
+        with urllib.request.urlopen(url, timeout=60) as response:
+            response.read()
+            status = response.status
+    except urllib.error.HTTPError as error:
+        error.read()
+        status = error.code
+    return status, (time.perf_counter() - start) * 1000
+
+
+class NextServer:
+    """A fresh `next start` process"""
+
+    def __init__(self, port: int):
+        self.port = port
+        self.process = None
+
+    def __enter__(self):
+        env = {**os.environ, "PORT": str(self.port), "NODE_ENV": "production"}
+        self.process = subprocess.Popen(
+            ["npx", "next", "start", "-p", str(self.port)],
+            cwd=REPO_ROOT,
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        wait_for_port(self.port, timeout=60)
+        return self
+
+    def __exit__(self, *exc):
+        self.process.terminate()
+        try:
+            self.process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+
+
+def measure_route(base_url: str, route: str, steady_runs: int) -> dict:
+    status, first_ms = timed_get(f"{base_url}{route}")
+    steady = [timed_get(f"{base_url}{route}")[1] for _ in range(steady_runs)]
+    steady_ms = statistics.median(steady)
+    return {
+        "status": status,
+        "firstMs": round(first_ms, 1),
+        "steadyMs": round(steady_ms, 1),
+        "coldPenaltyMs": round(first_ms - steady_ms, 1),
+    }
+
+
+def run_benchmark(routes: list, port: int, steady_runs: int, shared: bool) -> dict:
+    base_url = f"http://127.0.0.1:{port}"
+    results = {}
+
+    if shared:
+        with NextServer(port):
+            for route in routes:
+                results[route] = measure_route(base_url, route, steady_runs)
+                print_result(route, results[route])
+        return results
+
+    for route in routes:
+        with NextServer(port):
+            results[route] = measure_route(base_url, route, steady_runs)
+        print_result(route, results[route])
+    return results
+
+
+def print_result(route: str, result: dict) -> None:
+    print(
+        f"{route:<28} {result['status']:>4}  first {result['firstMs']:>8.1f}ms"
+        f"  steady {result['steadyMs']:>7.1f}ms  penalty {result['coldPenaltyMs']:>8.1f}ms"
+    )
+
+
+def load_previous_run(mode: str):
+    if not RESULTS_FILE.exists():
+        return None
+    runs = [json.loads(line) for line in RESULTS_FILE.read_text().splitlines() if line.strip()]
+    runs = [run for run in runs if run.get("mode") == mode]
+    return runs[-1] if runs else None
+
+
+def find_regressions(previous: dict, results: dict) -> list:
+    regressions = []
+    for route, result in results.items():
+        before = previous["routes"].get(route)
+        if not before:
+            continue
+        limit = before["firstMs"] * REGRESSION_RATIO + REGRESSION_SLACK_MS
+        if result["firstMs"] > limit:
+            regressions.append((route, before["firstMs"], result["firstMs"]))
+    return regressions
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Cold-start latency benchmark")
+    parser.add_argument("--routes", nargs="+", default=ROUTES)
+    parser.add_argument("--port", type=int, default=3100)
+    parser.add_argument("--steady-runs", type=int, default=5)
+    parser.add_argument("--shared", action="store_true", help="reuse one server for all routes")
+    parser.add_argument("--fail-on-regression", action="store_true")
+    args = parser.parse_args()
+
+    if not (REPO_ROOT / ".next").exists():
+        print("No production build found - run `npm run build` first")
+        return 2
+
+    mode = "shared" if args.shared else "per-route"
+    previous = load_previous_run(mode)
+
+    print(f"Cold-start benchmark ({mode}, {len(args.routes)} routes)\n")
+    results = run_benchmark(args.routes, args.port, args.steady_runs, args.shared)
+
+    record = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "commit": git_commit(),
+        "mode": mode,
+        "routes": results,
+    }
+    RESULTS_FILE.parent.mkdir(parents=True, exist_ok=True)
+    with RESULTS_FILE.open("a") as f:
+        f.write(json.dumps(record) + "\n")
+
+    total_first = sum(r["firstMs"] for r in results.values())
+    print(f"\nTotal first-hit time: {total_first:.0f}ms")
+
+    if previous:
+        regressions = find_regressions(previous, results)
+        print(f"Compared with {previous['commit']} ({previous['timestamp']})")
+        for route, before, after in regressions:
+            print(f"  REGRESSION {route}: {before:.1f}ms -> {after:.1f}ms")
+        if regressions and args.fail_on_regression:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,18 +1,88 @@
 """
 Pytest configuration and fixtures for Playwright tests
 """
+import logging
+
 import pytest
 from playwright.sync_api import Page, Browser, BrowserContext
 
+from perf_artifacts import PerfRecording, artifact_dir
 
-@pytest.fixture(scope="session")
-def browser_context_args(browser_context_args):
+logger = logging.getLogger(__name__)
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--perf-artifacts",
+        choices=("on-failure", "always", "off"),
+        default="on-failure",
+        help="Keep trace/HAR/CPU profile of perf_browser tests (default: on-failure)",
+    )
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Expose each phase's report to fixtures as item.rep_setup/rep_call/rep_teardown"""
+    outcome = yield
+    report = outcome.get_result()
+    setattr(item, f"rep_{report.when}", report)
+    if report.when == "call":
+        # Budgets are plain asserts; errors like a dead server are not evidence
+        item.budget_exceeded = report.failed and call.excinfo.errisinstance(AssertionError)
+
+
+@pytest.fixture
+def perf_recording(request, pytestconfig):
+    """Artifact recorder for perf_browser tests (None for all other tests)"""
+    mode = pytestconfig.getoption("--perf-artifacts")
+    if (
+        mode == "off"
+        or request.node.get_closest_marker("perf_browser") is None
+        or "page" not in request.fixturenames
+    ):
+        yield None
+        return
+
+    # Looked up lazily: requesting browser_name in the signature would make
+    # pytest-playwright parametrize every test (this fixture is autouse'd)
+    browser_name = request.getfixturevalue("browser_name")
+    recording = PerfRecording(artifact_dir(request.node.nodeid), browser_name)
+    yield recording
+
+    # Torn down after the context has closed, so the HAR is complete
+    exceeded = getattr(request.node, "budget_exceeded", False)
+    summary = recording.finish(keep=exceeded or mode == "always")
+    if exceeded and summary:
+        logger.warning("Performance budget exceeded in %s\n%s", request.node.nodeid, summary)
+
+
+@pytest.fixture
+def browser_context_args(browser_context_args, perf_recording):
     """Configure browser context with custom settings"""
-    return {
+    args = {
         **browser_context_args,
         "viewport": {"width": 1920, "height": 1080},
         "ignore_https_errors": True,
     }
+    if perf_recording:
+        # Timings and sizes only; bodies would make the HAR huge
+        args["record_har_path"] = str(perf_recording.har_path)
+        args["record_har_content"] = "omit"
+    return args
+
+
+@pytest.fixture(autouse=True)
+def record_perf_artifacts(request, perf_recording, pytestconfig):
+    """Trace and CPU-profile the page of perf_browser tests"""
+    if perf_recording is None:
+        yield
+        return
+
+    page = request.getfixturevalue("page")
+    # pytest-playwright's own --tracing would conflict with a second trace
+    perf_recording.start(page, tracing=pytestconfig.getoption("--tracing", "off") == "off")
+    yield
+    perf_recording.stop(page)
 
 
 @pytest.fixture(scope="session")
@@ -0,0 +1,271 @@
+"""
+Performance test artifacts
+For perf_browser tests, records a Playwright trace, a HAR of every request and
+(Chromium only) a CPU profile. When a budget assertion fails, they are kept
+under test-results/perf/<test>/ together with a request waterfall summary;
+otherwise (passes, or errors unrelated to timing) they are deleted.
+
+    playwright show-trace test-results/perf/<test>/trace.zip
+    Chrome DevTools > Performance > Load profile... > cpu.cpuprofile
+    Chrome DevTools > Network > Import HAR... > network.har
+"""
+import json
+import re
+import shutil
+from datetime import datetime
+from pathlib import Path
+
+from playwright.sync_api import Error as PlaywrightError
+from playwright.sync_api import Page
+
+
+ARTIFACTS_DIR = Path(__file__).parent / "test-results" / "perf"
+
+TOP_N = 10
+WATERFALL_ROWS = 40
+WATERFALL_WIDTH = 48
+URL_WIDTH = 60
+
+# Sampling interval for the CPU profile, in microseconds
+PROFILE_INTERVAL_US = 200
+
+# Resource Timing of the current document. renderBlockingStatus (Chromium)
+# says which scripts and stylesheets held up the first render.
+RESOURCE_TIMING_JS = """() => performance.getEntriesByType('resource').map((entry) => ({
+    name: entry.name,
+    initiatorType: entry.initiatorType,
+    startTime: entry.startTime,
+    duration: entry.duration,
+    renderBlockingStatus: entry.renderBlockingStatus || null,
+}))"""
+
+
+def artifact_dir(nodeid: str) -> Path:
+    """Directory for one test's artifacts, named after its node id"""
+    return ARTIFACTS_DIR / re.sub(r"[^\w.-]+", "-", nodeid).strip("-")
+
+
+class PerfRecording:
+    """Trace, HAR and CPU profile for one test"""
+
+    def __init__(self, directory: Path, browser_name: str):
+        self.directory = directory
+        self.browser_name = browser_name
+        self.har_path = directory / "network.har"
+        self.trace_path = directory / "trace.zip"
+        self.profile_path = directory / "cpu.cpuprofile"
+        self.summary_path = directory / "waterfall.txt"
+        self.resources: list = []
+        self._cdp = None
+        self._tracing = False
+
+        shutil.rmtree(directory, ignore_errors=True)
+        directory.mkdir(parents=True)
+
+    def start(self, page: Page, tracing: bool = True):
+        """Start the trace and CPU profile (the HAR is recorded by the context)"""
+        if tracing:
+            page.context.tracing.start(screenshots=True, snapshots=True)
+            self._tracing = True
+        if self.browser_name == "chromium":
+            self._cdp = page.context.new_cdp_session(page)
+            self._cdp.send("Profiler.enable")
+            self._cdp.send("Profiler.setSamplingInterval", {"interval": PROFILE_INTERVAL_US})
+            self._cdp.send("Profiler.start")
+
+    def stop(self, page: Page):
+        """Stop recording; must run before the context closes"""
+        try:
+            self.resources = page.evaluate(RESOURCE_TIMING_JS)
+        except PlaywrightError:
+            self.resources = []  # page closed or mid-navigation
+
+        if self._cdp:
+            try:
+                profile = self._cdp.send("Profiler.stop")["profile"]
+                self.profile_path.write_text(json.dumps(profile))
+            except PlaywrightError:
+                pass
+            self._cdp = None
+
+        if self._tracing:
+            page.context.tracing.stop(path=str(self.trace_path))
+            self._tracing = False
+
+    def finish(self, keep: bool):
+        """
+        After the context has closed (HAR written): keep the artifacts with a
+        summary and return it, or delete them and return None
+        """
+        if not keep:
+            shutil.rmtree(self.directory, ignore_errors=True)
+            return None
+
+        summary = summarize_recording(self)
+        self.summary_path.write_text(summary)
+        return summary
+
+
+def summarize_recording(recording: PerfRecording) -> str:
+    sections = []
+    if recording.har_path.exists():
+        har = json.loads(recording.har_path.read_text())
+        sections.append(summarize_har(har, recording.resources))
+    if recording.profile_path.exists():
+        profile = json.loads(recording.profile_path.read_text())
+        sections.append(summarize_profile(profile))
+    sections.append(f"Artifacts: {recording.directory}")
+    return "\n\n".join(sections) + "\n"
+
+
+def _timestamp(value: str) -> float:
+    """HAR startedDateTime in ms (fromisoformat only accepts 'Z' from 3.11)"""
+    return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp() * 1000
+
+
+def _size(entry: dict) -> int:
+    """Bytes over the wire, falling back to the body size"""
+    response = entry["response"]
+    for size in (
+        response.get("_transferSize", -1),
+        response.get("bodySize", -1),
+        response.get("content", {}).get("size", -1),
+    ):
+        if size and size > 0:
+            return size
+    return 0
+
+
+def _format_bytes(size: float) -> str:
+    for unit in ("B", "KB", "MB"):
+        if size < 1024 or unit == "MB":
+            return f"{size:,.0f} {unit}" if unit == "B" else f"{size:,.1f} {unit}"
+        size /= 1024
+
+
+def _short_url(url: str) -> str:
+    url = re.sub(r"^https?://", "", url)
+    return url if len(url) <= URL_WIDTH else url[: URL_WIDTH - 1] + "…"
+
+
+def _is_script_or_style(entry: dict) -> bool:
+    mime = entry["response"].get("content", {}).get("mimeType", "")
+    return "javascript" in mime or "css" in mime
+
+
+def summarize_har(har: dict, resources: list = None) -> str:
+    """
+    Request waterfall summary: page timings, slowest requests, largest
+    payloads, render-blocking scripts/stylesheets and a text waterfall
+    """
+    log = har["log"]
+    entries = sorted(log["entries"], key=lambda entry: _timestamp(entry["startedDateTime"]))
+    if not entries:
+        return "No requests recorded"
+
+    origin = _timestamp(entries[0]["startedDateTime"])
+    rows = [
+        {
+            "start": _timestamp(entry["startedDateTime"]) - origin,
+            "time": max(entry.get("time", 0), 0),
+            "wait": max(entry.get("timings", {}).get("wait", 0), 0),
+            "status": entry["response"].get("status", 0),
+            "method": entry["request"]["method"],
+            "url": entry["request"]["url"],
+            "size": _size(entry),
+            "mime": entry["response"].get("content", {}).get("mimeType", ""),
+            "entry": entry,
+        }
+        for entry in entries
+    ]
+    end = max(row["start"] + row["time"] for row in rows)
+    total = sum(row["size"] for row in rows)
+
+    lines = [
+        f"Requests: {len(rows)}, {_format_bytes(total)} transferred, "
+        f"{end:,.0f} ms from first request to last response"
+    ]
+    for page in log.get("pages", []):
+        timings = page.get("pageTimings", {})
+        content_loaded = timings.get("onContentLoad", -1)
+        load = timings.get("onLoad", -1)
+        lines.append(
+            f"  {page.get('title') or page.get('id')}: "
+            f"DOMContentLoaded {'?' if content_loaded < 0 else f'{content_loaded:,.0f} ms'}, "
+            f"load {'?' if load < 0 else f'{load:,.0f} ms'}"
+        )
+
+    lines += ["", f"Slowest requests (top {TOP_N}):"]
+    for row in sorted(rows, key=lambda row: row["time"], reverse=True)[:TOP_N]:
+        lines.append(
+            f"  {row['time']:>8,.0f} ms  wait {row['wait']:>7,.0f} ms  {row['status']:>3}  "
+            f"{_format_bytes(row['size']):>9}  {row['method']} {_short_url(row['url'])}"
+        )
+
+    lines += ["", f"Largest payloads (top {TOP_N}):"]
+    for row in sorted(rows, key=lambda row: row["size"], reverse=True)[:TOP_N]:
+        mime = row["mime"].split(";")[0] or "?"
+        lines.append(f"  {_format_bytes(row['size']):>9}  {mime:<24}  {_short_url(row['url'])}")
+
+    lines += ["", "Render-blocking scripts and stylesheets:"]
+    blocking = [
+        resource
+        for resource in resources or []
+        if resource.get("renderBlockingStatus") == "blocking"
+    ]
+    if blocking:
+        for resource in blocking:
+            lines.append(
+                f"  start {resource['startTime']:>7,.0f} ms  {resource['duration']:>7,.0f} ms  "
+                f"{_short_url(resource['name'])}"
+            )
+    else:
+        # No Resource Timing data (page closed, non-Chromium): scripts and
+        # stylesheets requested before DOMContentLoaded are the candidates
+        pages = log.get("pages", [])
+        content_loaded = pages[0].get("pageTimings", {}).get("onContentLoad", -1) if pages else -1
+        candidates = [
+            row
+            for row in rows
+            if _is_script_or_style(row["entry"])
+            and (content_loaded < 0 or row["start"] < content_loaded)
+        ]
+        for row in candidates[:TOP_N]:
+            lines.append(
+                f"  start {row['start']:>7,.0f} ms  {row['time']:>7,.0f} ms  "
+                f"{_short_url(row['url'])}  (before DOMContentLoaded)"
+            )
+        if not candidates:
+            lines.append("  none")
+
+    lines += ["", f"Waterfall (first {min(len(rows), WATERFALL_ROWS)} of {len(rows)} requests):"]
+    scale = WATERFALL_WIDTH / end if end > 0 else 0
+    for row in rows[:WATERFALL_ROWS]:
+        offset = int(row["start"] * scale)
+        width = max(1, int(row["time"] * scale))
+        bar = (" " * offset + "█" * width)[:WATERFALL_WIDTH].ljust(WATERFALL_WIDTH)
+        lines.append(f"  {_short_url(row['url']):<{URL_WIDTH}} |{bar}| {row['time']:,.0f} ms")
+
+    return "\n".join(lines)
+
+
+def summarize_profile(profile: dict) -> str:
+    """Functions with the most self time in a CDP CPU profile"""
+    samples = profile.get("samples", [])
+    if not samples:
+        return "CPU profile: no samples"
+
+    sample_ms = (profile["endTime"] - profile["startTime"]) / len(samples) / 1000
+    self_time: dict = {}
+    for node in profile["nodes"]:
+        frame = node["callFrame"]
+        name = frame["functionName"] or "(anonymous)"
+        if frame.get("url"):
+            name += f"  {_short_url(frame['url'])}:{frame['lineNumber'] + 1}"
+        self_time[name] = self_time.get(name, 0) + node.get("hitCount", 0) * sample_ms
+
+    busy = {name: ms for name, ms in self_time.items() if name != "(idle)"}
+    lines = [f"CPU self time (top {TOP_N}, {sum(busy.values()):,.0f} ms busy):"]
+    for name, ms in sorted(busy.items(), key=lambda item: item[1], reverse=True)[:TOP_N]:
+        lines.append(f"  {ms:>8,.0f} ms  {name}")
+    return "\n".join(lines)
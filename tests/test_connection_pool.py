@@ -0,0 +1,80 @@
+"""
+Connection pool tests
+Checks the Prisma pool stays within its limit under a burst of requests
+without queries timing out on it.
+
+To exercise pgbouncer mode locally, run the app against the pooler stand-in
+(docker compose --profile pooler up -d postgres pgbouncer) and set
+EXPECTED_DB_POOL_MODE=pgbouncer.
+"""
+import os
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from playwright.sync_api import Page
+
+
+BURST_SIZE = 40
+
+
+def fetch_status(url: str) -> int:
+    """GET a URL and return the status code (thread-safe, no browser)"""
+    try:
+        with urllib.request.urlopen(url, timeout=30) as response:
+            return response.status
+    except urllib.error.HTTPError as error:
+        return error.code
+
+
+def get_health(page: Page, base_url: str) -> dict:
+    response = page.request.get(f"{base_url}/api/health")
+    health = response.json()
+    if health.get("pool") is None:
+        pytest.skip("Pool metrics unavailable")
+    return health
+
+
+def get_pool(page: Page, base_url: str) -> dict:
+    return get_health(page, base_url)["pool"]
+
+
+@pytest.mark.perf
+class TestConnectionPool:
+    """Test connection pool configuration and behaviour under load"""
+
+    def test_pool_reports_mode_and_limit(self, page: Page, base_url: str):
+        """Health endpoint reports pool mode and a positive connection limit"""
+        pool = get_pool(page, base_url)
+
+        assert pool["mode"] in ["direct", "pgbouncer"]
+        assert pool["limit"] > 0
+        assert "avgMs" in pool["waitTime"]
+
+        expected_mode = os.environ.get("EXPECTED_DB_POOL_MODE")
+        if expected_mode:
+            assert pool["mode"] == expected_mode
+
+    def test_burst_does_not_exhaust_pool(self, page: Page, base_url: str):
+        """A burst of concurrent page loads queues on the pool instead of failing"""
+        before = get_health(page, base_url)
+
+        with ThreadPoolExecutor(max_workers=BURST_SIZE) as executor:
+            statuses = list(executor.map(fetch_status, [f"{base_url}/shop"] * BURST_SIZE))
+
+        # /shop falls back to mock data on query errors, so a 200 alone
+        # proves nothing: no query may have timed out waiting for a
+        # connection, and the database circuit must not have opened
+        assert all(status == 200 for status in statuses), statuses
+        after = get_health(page, base_url)
+        assert after["pool"]["timeouts"] == before["pool"]["timeouts"]
+        assert after["database"]["circuitOpens"] == before["database"]["circuitOpens"]
+        assert after["database"]["circuit"] == "closed"
+        assert after["pool"]["open"] <= after["pool"]["limit"]
+
+    def test_pool_metrics_prometheus_format(self, logged_in_page: Page, base_url: str):
+        """Pool metrics can be scraped in Prometheus format"""
+        response = logged_in_page.request.get(f"{base_url}/api/metrics/pool?format=prometheus")
+        assert response.ok
+        assert "prisma_pool_connections_busy" in response.text()
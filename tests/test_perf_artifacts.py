@@ -0,0 +1,105 @@
+"""
+Performance artifact summaries
+Checks the waterfall and CPU summaries written next to the trace, HAR and
+profile of a perf test that exceeded its budget. No browser needed.
+"""
+from perf_artifacts import summarize_har, summarize_profile
+
+
+def har_entry(url: str, start_ms: int, time_ms: int, size: int, mime: str, wait_ms: int = 0):
+    seconds, ms = divmod(start_ms, 1000)
+    return {
+        "startedDateTime": f"2026-10-19T10:00:{seconds:02d}.{ms:03d}Z",
+        "time": time_ms,
+        "request": {"method": "GET", "url": url},
+        "response": {
+            "status": 200,
+            "bodySize": size,
+            "_transferSize": size,
+            "content": {"size": size, "mimeType": mime},
+        },
+        "timings": {"wait": wait_ms},
+    }
+
+
+HAR = {
+    "log": {
+        "pages": [
+            {"id": "page@1", "title": "Shop", "pageTimings": {"onContentLoad": 900, "onLoad": 2400}}
+        ],
+        "entries": [
+            har_entry("http://localhost:3000/shop", 0, 800, 40_000, "text/html", wait_ms=750),
+            har_entry("http://localhost:3000/_next/static/chunks/main.js", 820, 300, 250_000,
+                      "application/javascript"),
+            har_entry("http://localhost:3000/_next/static/css/app.css", 830, 90, 12_000,
+                      "text/css"),
+            har_entry("http://localhost:3000/img/abc/640.avif", 1000, 1400, 900_000,
+                      "image/avif"),
+        ],
+    }
+}
+
+
+class TestWaterfallSummary:
+    """Test the request waterfall summary of a recorded HAR"""
+
+    def test_totals_and_page_timings(self):
+        summary = summarize_har(HAR)
+        assert "Requests: 4" in summary
+        assert "2,400 ms from first request to last response" in summary
+        assert "Shop: DOMContentLoaded 900 ms, load 2,400 ms" in summary
+
+    def test_slowest_and_largest_first(self):
+        lines = summarize_har(HAR).splitlines()
+        slowest = lines[lines.index("Slowest requests (top 10):") + 1]
+        largest = lines[lines.index("Largest payloads (top 10):") + 1]
+        assert "img/abc/640.avif" in slowest
+        assert "img/abc/640.avif" in largest and "878.9 KB" in largest
+
+    def test_blocking_resources_from_resource_timing(self):
+        resources = [
+            {"name": "http://localhost:3000/_next/static/chunks/main.js", "startTime": 820,
+             "duration": 300, "renderBlockingStatus": "blocking"},
+            {"name": "http://localhost:3000/img/abc/640.avif", "startTime": 1000,
+             "duration": 1400, "renderBlockingStatus": "non-blocking"},
+        ]
+        section = summarize_har(HAR, resources).split("Render-blocking")[1].split("Waterfall")[0]
+        assert "main.js" in section
+        assert "640.avif" not in section
+
+    def test_blocking_fallback_uses_dom_content_loaded(self):
+        section = summarize_har(HAR).split("Render-blocking")[1].split("Waterfall")[0]
+        assert "main.js" in section and "app.css" in section
+        assert "before DOMContentLoaded" in section
+
+    def test_waterfall_rows_in_start_order(self):
+        waterfall = summarize_har(HAR).split("Waterfall")[1].splitlines()[1:]
+        assert len(waterfall) == 4
+        assert "localhost:3000/shop" in waterfall[0]
+        assert waterfall[0].index("█") < waterfall[3].index("█")
+
+    def test_empty_har(self):
+        assert summarize_har({"log": {"entries": []}}) == "No requests recorded"
+
+
+class TestCpuProfileSummary:
+    """Test the self-time summary of a CDP CPU profile"""
+
+    def test_top_self_time_excludes_idle(self):
+        profile = {
+            "startTime": 0,
+            "endTime": 40_000,  # microseconds
+            "samples": [1] * 40,
+            "nodes": [
+                {"callFrame": {"functionName": "(idle)", "url": "", "lineNumber": -1},
+                 "hitCount": 10},
+                {"callFrame": {"functionName": "renderProducts",
+                               "url": "http://localhost:3000/_next/static/chunks/app.js",
+                               "lineNumber": 41},
+                 "hitCount": 30},
+            ],
+        }
+        summary = summarize_profile(profile)
+        assert "30 ms busy" in summary
+        assert "renderProducts" in summary and "app.js:42" in summary
+        assert "(idle)" not in summary
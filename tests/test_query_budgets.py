@@ -0,0 +1,119 @@
+"""
+Per-route database query budgets
+Fails when a change adds queries to a hot route (e.g. an N+1 loop).
+
+API routes report their count in the X-DB-Query-Count header. Page routes
+and background jobs are read from /api/metrics/queries, which is only
+exposed outside production or when DB_METRICS_EXPOSE=true.
+"""
+import base64
+import time
+
+import pytest
+from playwright.sync_api import Page
+
+
+# Maximum Prisma operations per request
+QUERY_BUDGETS = {
+    "/shop": 2,
+    "/product/[slug]": 1,
+    "/api/telemetry": 1,
+    "/api/telemetry/stats": 4,
+    "label-scan:process": 2,
+}
+
+# 1x1 transparent PNG
+TINY_PNG = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNkYPhfDwAChwGA60e6kgAAAABJRU5ErkJggg=="
+)
+
+
+def latest_metrics(page: Page, base_url: str, route: str, timeout: float = 0):
+    """Return the newest query metrics record for a route"""
+    deadline = time.time() + timeout
+    while True:
+        response = page.request.get(
+            f"{base_url}/api/metrics/queries", params={"route": route, "limit": 1}
+        )
+        if response.status == 404:
+            pytest.skip("Query metrics not exposed (set DB_METRICS_EXPOSE=true)")
+
+        records = response.json()["records"]
+        if records or time.time() >= deadline:
+            break
+        time.sleep(0.5)
+
+    assert records, f"No query metrics recorded for {route}"
+    return records[0]
+
+
+def assert_within_budget(route: str, query_count: int, operations=None):
+    budget = QUERY_BUDGETS[route]
+    assert query_count <= budget, (
+        f"{route} issued {query_count} queries (budget {budget}): {operations}"
+    )
+
+
+@pytest.mark.perf
+class TestPageQueryBudgets:
+    """Query budgets for server-rendered pages"""
+
+    def test_shop_query_budget(self, page: Page, base_url: str):
+        """Shop page loads products and categories without per-product queries"""
+        page.goto(f"{base_url}/shop")
+
+        metrics = latest_metrics(page, base_url, "/shop")
+        assert_within_budget("/shop", metrics["queryCount"], metrics["operations"])
+
+    def test_product_detail_query_budget(self, page: Page, base_url: str):
+        """Product page loads the product once for metadata and body"""
+        page.goto(f"{base_url}/shop")
+        href = page.locator('[href^="/product/"]').first.get_attribute("href")
+        page.goto(f"{base_url}{href}")
+
+        metrics = latest_metrics(page, base_url, "/product/[slug]")
+        assert_within_budget("/product/[slug]", metrics["queryCount"], metrics["operations"])
+
+
+@pytest.mark.perf
+class TestApiQueryBudgets:
+    """Query budgets for API routes, read from response headers"""
+
+    def test_telemetry_post_query_budget(self, page: Page, base_url: str):
+        """Tracking one event costs at most one insert"""
+        response = page.request.post(
+            f"{base_url}/api/telemetry",
+            data={"eventType": "PAGE_VIEW", "eventName": "budget_test", "path": "/test"},
+        )
+        assert response.ok
+        assert "server-timing" in response.headers
+        assert_within_budget("/api/telemetry", int(response.headers["x-db-query-count"]))
+
+    def test_telemetry_stats_query_budget(self, logged_in_page: Page, base_url: str):
+        """Stats summary runs a fixed number of aggregate queries"""
+        response = logged_in_page.request.get(f"{base_url}/api/telemetry/stats")
+        assert response.ok
+        assert "db;dur=" in response.headers["server-timing"]
+        assert_within_budget("/api/telemetry/stats", int(response.headers["x-db-query-count"]))
+
+
+@pytest.mark.perf
+class TestBackgroundQueryBudgets:
+    """Query budgets for background jobs"""
+
+    def test_label_scan_analysis_query_budget(self, page: Page, base_url: str):
+        """
+        Label scan processing stays within its query budget. The tiny image
+        yields no ingredients, so the single-lookup guarantee for labels with
+        many ingredients is covered by src/lib/__tests__/label-analysis.test.ts
+        """
+        response = page.request.post(
+            f"{base_url}/api/label-scan",
+            multipart={
+                "image": {"name": "label.png", "mimeType": "image/png", "buffer": TINY_PNG}
+            },
+        )
+        assert response.status == 201
+
+        metrics = latest_metrics(page, base_url, "label-scan:process", timeout=30)
+        assert_within_budget("label-scan:process", metrics["queryCount"], metrics["operations"])
@@ -0,0 +1,158 @@
+"""
+Rate limit tests
+Fires concurrent bursts at the throttled endpoints (OTP login, telemetry,
+label scan) and checks that the bucket capacity (plus what refills during the
+burst) gets through and the rest receive 429 with Retry-After. The per-email
+OTP bucket only counts requests with the right password, so wrong guesses
+must never hit it.
+
+The test client has no trusted address, so every request lands in the shared
+"unknown" bucket of each policy; buckets are reset through
+DELETE /api/metrics/rate-limits before each test so they do not leak between
+tests. Burst sizes follow the effective limits reported by the same endpoint,
+so this requires metrics to be exposed (DB_METRICS_EXPOSE=true under
+`next start`).
+"""
+import json
+import time
+import urllib.error
+import urllib.request
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from playwright.sync_api import Page
+
+
+# Requests beyond the bucket capacity in each burst
+OVERFLOW = 10
+# Skip policies whose (multiplied) capacity would need a larger burst than this
+MAX_BURST = 500
+
+
+def unique_email() -> str:
+    return f"ratelimit-{uuid.uuid4().hex[:8]}@example.com"
+
+
+def post_json(url: str, payload: dict) -> tuple:
+    """POST JSON and return (status, headers) (thread-safe, no browser)"""
+    request = urllib.request.Request(
+        url,
+        data=json.dumps(payload).encode(),
+        headers={"Content-Type": "application/json"},
+        method="POST",
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=30) as response:
+            response.read()
+            return response.status, dict(response.headers)
+    except urllib.error.HTTPError as error:
+        error.read()
+        return error.code, dict(error.headers)
+
+
+def burst(url: str, payloads: list) -> tuple:
+    """Send the requests concurrently and return (responses, elapsed seconds)"""
+    started = time.monotonic()
+    with ThreadPoolExecutor(max_workers=20) as executor:
+        responses = list(executor.map(lambda payload: post_json(url, payload), payloads))
+    return responses, time.monotonic() - started
+
+
+@pytest.fixture
+def rate_limits(page: Page, base_url: str) -> dict:
+    response = page.request.get(f"{base_url}/api/metrics/rate-limits")
+    if response.status != 200:
+        pytest.skip("Rate limit metrics not exposed (set DB_METRICS_EXPOSE=true)")
+
+    data = response.json()
+    if not data["enabled"]:
+        pytest.skip("Rate limiting disabled")
+
+    # Start every test with full buckets
+    assert page.request.delete(f"{base_url}/api/metrics/rate-limits").ok
+    return data
+
+
+def burst_size(rate_limits: dict, policy: str) -> int:
+    size = rate_limits["policies"][policy]["limit"] + OVERFLOW
+    if size > MAX_BURST:
+        pytest.skip(f"{policy} capacity too large to exhaust (RATE_LIMIT_MULTIPLIER)")
+    return size
+
+
+def assert_capacity_enforced(responses: list, elapsed: float, rate_limits: dict, policy: str):
+    """
+    The bucket capacity is admitted, plus whatever refilled while the burst
+    ran; every rejection carries Retry-After
+    """
+    limits = rate_limits["policies"][policy]
+    refilled = elapsed * limits["limit"] / limits["windowSeconds"]
+    blocked = [headers for status, headers in responses if status == 429]
+    admitted = len(responses) - len(blocked)
+    assert limits["limit"] <= admitted <= limits["limit"] + refilled + 1
+
+    for headers in blocked:
+        assert headers["X-RateLimit-Policy"] == policy
+        assert int(headers["Retry-After"]) > 0
+
+
+@pytest.mark.api
+@pytest.mark.perf
+class TestRateLimits:
+    """Test token-bucket rate limiting under concurrent load"""
+
+    def test_wrong_passwords_do_not_lock_out_email(
+        self, base_url: str, rate_limits: dict, admin_credentials: dict
+    ):
+        """Failed logins for a known email never use up its OTP bucket"""
+        count = burst_size(rate_limits, "otp-email")
+        responses, _ = burst(
+            f"{base_url}/api/auth/request-otp",
+            [{"email": admin_credentials["email"], "password": "WrongPassword1"}] * count,
+        )
+
+        assert [status for status, _ in responses] == [401] * count
+
+    def test_otp_requests_limited_per_ip(self, base_url: str, rate_limits: dict):
+        """One IP cycling through emails is stopped by the per-IP bucket"""
+        count = burst_size(rate_limits, "otp-ip")
+        responses, elapsed = burst(
+            f"{base_url}/api/auth/request-otp",
+            [{"email": unique_email(), "password": "x"} for _ in range(count)],
+        )
+
+        assert_capacity_enforced(responses, elapsed, rate_limits, "otp-ip")
+
+    def test_telemetry_limited_per_ip(self, base_url: str, rate_limits: dict):
+        """A client rotating session ids is still throttled by its IP"""
+        count = burst_size(rate_limits, "telemetry-ip")
+        event = {"eventType": "USER_ACTION", "eventName": "rate_limit_test"}
+        responses, elapsed = burst(
+            f"{base_url}/api/telemetry",
+            [{**event, "sessionId": f"ratelimit-{uuid.uuid4().hex}"} for _ in range(count)],
+        )
+
+        assert_capacity_enforced(responses, elapsed, rate_limits, "telemetry-ip")
+
+    def test_label_scan_limited_per_ip(self, base_url: str, rate_limits: dict):
+        """Label scan uploads are throttled per IP before the upload is read"""
+        count = burst_size(rate_limits, "label-scan-ip")
+        # A JSON body is rejected (not multipart) but still consumes a token
+        responses, elapsed = burst(f"{base_url}/api/label-scan", [{}] * count)
+
+        assert_capacity_enforced(responses, elapsed, rate_limits, "label-scan-ip")
+
+    def test_counters_report_blocked_requests(
+        self, page: Page, base_url: str, rate_limits: dict
+    ):
+        """Blocked requests show up in the per-policy counters"""
+        count = burst_size(rate_limits, "otp-ip")
+        before = rate_limits["policies"]["otp-ip"]["blocked"]
+        burst(
+            f"{base_url}/api/auth/request-otp",
+            [{"email": unique_email(), "password": "x"} for _ in range(count)],
+        )
+
+        after = page.request.get(f"{base_url}/api/metrics/rate-limits").json()
+        assert after["policies"]["otp-ip"]["blocked"] >= before + OVERFLOW
@@ -253,6 +253,8 @@ class TestAccessibilityJourney:
         # This is basic - full a11y testing needs axe-core
 
 
+@pytest.mark.perf
+@pytest.mark.perf_browser
 class TestPerformanceJourney:
     """Test performance-related user experiences"""
 